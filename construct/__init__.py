@@ -61,6 +61,7 @@ __all__ = [
     'Checksum',
     'ChecksumError',
     'CipherError',
+    'CompileCache',
     'Compiled',
     'Compressed',
     'CompressedLZ4',
@@ -104,6 +105,7 @@ __all__ = [
     'IfThenElse',
     'Index',
     'IndexFieldError',
+    'IncrementalParser',
     'Indexing',
     'Int',
     'IntegerError',
@@ -155,6 +157,7 @@ __all__ = [
     'RawCopy',
     'Rebuffered',
     'RebufferedBytesIO',
+    'Record',
     'Rebuild',
     'release_date',
     'Renamed',
@@ -165,6 +168,7 @@ __all__ = [
     'RestreamedBytesIO',
     'RotationError',
     'Seek',
+    'SegmentedBytesIO',
     'Select',
     'SelectError',
     'Sequence',
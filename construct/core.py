@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-import struct, io, binascii, itertools, collections, pickle, sys, os, hashlib, importlib, importlib.machinery, importlib.util
+import struct, io, binascii, itertools, collections, pickle, sys, os, hashlib, importlib, importlib.machinery, importlib.util, keyword, mmap, array, functools, threading
 
 from construct.lib import *
 from construct.expr import *
@@ -164,6 +164,8 @@ class CipherError(ConstructError):
 #===============================================================================
 def singleton(arg):
     x = arg()
+    # pickled by name, because module attribute is the instance and not the class
+    arg.__reduce__ = lambda self: arg.__name__
     return x
 
 
@@ -188,6 +190,8 @@ def stream_read_entire(stream, path):
 
 def stream_write(stream, data, length, path):
     if not isinstance(data, bytes):
+        if isinstance(data, SegmentedBytesIO):
+            return stream_splice(stream, data, path)
         raise StringError("given non-bytes value, perhaps unicode? %r" % (data,), path=path)
     if length < 0:
         raise StreamError("length must be non-negative, found %s" % length, path=path)
@@ -201,6 +205,25 @@ def stream_write(stream, data, length, path):
         raise StreamError("stream written less than specified, expected %d, written %d" % (length, written), path=path)
 
 
+def stream_buildbuffer(stream):
+    """Used internally. Returns a new stream for building a subcon into, before what was built is written into given stream. Segmented streams get segmented buffers, that stream_buildvalue and stream_write pass along without copying."""
+    return SegmentedBytesIO() if isinstance(stream, SegmentedBytesIO) else io.BytesIO()
+
+
+def stream_buildvalue(buffer):
+    """Used internally. Returns bytes built into a stream from stream_buildbuffer, or the segmented stream itself (it has length too)."""
+    return buffer if isinstance(buffer, SegmentedBytesIO) else buffer.getvalue()
+
+
+def stream_splice(stream, buffer, path):
+    try:
+        if isinstance(stream, SegmentedBytesIO):
+            return stream.splice(buffer)
+        return stream.write(buffer.getvalue())
+    except Exception:
+        raise StreamError("stream.write() failed, given %d bytes" % (len(buffer),), path=path)
+
+
 def stream_seek(stream, offset, whence, path):
     try:
         return stream.seek(offset, whence)
@@ -225,6 +248,190 @@ def stream_size(stream):
         raise StreamError("stream. seek() tell() failed", path="???")
 
 
+def stream_read_terminated(stream, term, include, consume, require, path):
+    """Used internally. Reads until a terminator at position aligned to its length. Random-access streams (in-memory streams, mmaps, and seekable files) are read in growing chunks that are searched with find, and the stream is then seeked back to right after (or before, if not consume) the terminator. Other streams (which may block until entire chunk arrives, or count bytes that were asked for) are read one unit at a time."""
+    unit = len(term)
+    kind = type(stream)
+    if kind in (io.BufferedReader, io.BufferedRandom, io.FileIO):
+        try:
+            randomaccess = stream.seekable()
+        except Exception:
+            randomaccess = False
+    else:
+        randomaccess = kind in (io.BytesIO, BytesIOWithOffsets, BoundedBytesIO, mmap.mmap)
+    if not randomaccess:
+        data = b''
+        while True:
+            try:
+                b = stream_read(stream, unit, path)
+            except StreamError:
+                if require:
+                    raise
+                return data
+            if b == term:
+                if include:
+                    data += b
+                if not consume:
+                    stream_seek(stream, -unit, 1, path)
+                return data
+            data += b
+    data = bytearray()
+    chunksize = 64 * unit
+    start = 0
+    while True:
+        try:
+            chunk = stream.read(chunksize)
+        except Exception:
+            raise StreamError("stream.read() failed, requested %s bytes" % (chunksize,), path=path)
+        data += chunk
+        index = data.find(term, start)
+        while index >= 0 and index % unit:
+            index = data.find(term, index + unit - index % unit)
+        if index >= 0:
+            end = index + unit
+            stream_seek(stream, (end if consume else index) - len(data), 1, path)
+            return bytes(data[:end if include else index])
+        if len(chunk) < chunksize:
+            if require:
+                raise StreamError("stream read less than specified amount, expected terminator %r, found none" % (term,), path=path)
+            return bytes(data[:len(data) - len(data) % unit])
+        start = len(data) - len(data) % unit - unit + 1
+        start = max(0, start + (-start) % unit)
+        chunksize = min(chunksize * 2, 64 * 1024)
+
+
+def stream_mapfile(filename):
+    """Used internally. Returns read-only mmap of entire file, or empty bytes for an empty file (which cannot be mapped). The map stays valid after the file is closed, until it is garbage collected."""
+    with open(filename, 'rb') as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            if os.fstat(f.fileno()).st_size:
+                raise
+            return b""
+
+
+INDEX_MAGIC = int.from_bytes(b"constIDX", "little")
+
+
+def index_load(sidecar, stat, offset):
+    """Used internally. Returns offsets saved by index_save, or None if sidecar is missing or was made for a different file (by size and modification time) or with first record at different offset."""
+    try:
+        with open(sidecar, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    offsets = array.array('q')
+    if len(data) % offsets.itemsize:
+        return None
+    offsets.frombytes(data)
+    if offsets[:4].tolist() != [INDEX_MAGIC, stat.st_size, stat.st_mtime_ns, offset]:
+        return None
+    del offsets[:3]
+    return offsets
+
+
+def index_save(sidecar, stat, offsets):
+    """Used internally. Saves offsets into sidecar file, replacing it atomically, along with size and modification time of the indexed file."""
+    temp = "%s.%d.tmp" % (os.fspath(sidecar), os.getpid())
+    with open(temp, 'wb') as f:
+        array.array('q', [INDEX_MAGIC, stat.st_size, stat.st_mtime_ns]).tofile(f)
+        offsets.tofile(f)
+    os.replace(temp, sidecar)
+
+
+parsemany_state = None
+parseshards_state = None
+
+
+def parsemany_init(subcon, contextkw):
+    """Used internally. Initializes parse_many worker process, the construct is unpickled once per worker and not once per chunk."""
+    global parsemany_state
+    parsemany_state = (subcon, contextkw)
+
+
+def parseshards_init(subcon, contextkw):
+    """Used internally. Initializes parse_shards worker process, the construct and its record size are computed once per worker and not once per shard."""
+    global parseshards_state
+    parseshards_state = (subcon, contextkw, subcon.sizeof(**contextkw))
+
+
+def stripio(obj):
+    """Used internally. Removes _io entries (streams that Structs were parsed from) from parsed records in place, before records are sent back from a worker process. Returns the object."""
+    if isinstance(obj, dict):
+        dict.pop(obj, "_io", None)
+        for v in dict.values(obj):
+            stripio(v)
+    elif isinstance(obj, list):
+        for v in obj:
+            stripio(v)
+    return obj
+
+
+def parsemany_chunk(name, offsets):
+    """Used internally. Parses blobs laid out back-to-back in shared memory, in parse_many worker process."""
+    from multiprocessing import shared_memory
+    subcon, contextkw = parsemany_state
+    shm = shared_memory.SharedMemory(name)
+    try:
+        return [stripio(subcon.parse(shm.buf[start:end].tobytes(), **contextkw)) for start,end in zip(offsets, offsets[1:])]
+    finally:
+        shm.close()
+
+
+def parseshards_chunk(filename, start, count):
+    """Used internally. Parses fixed-size records from a range of a file, memory-mapping only that range, in parse_shards worker process."""
+    subcon, contextkw, size = parseshards_state
+    aligned = start - start % mmap.ALLOCATIONGRANULARITY
+    with open(filename, 'rb') as f:
+        data = mmap.mmap(f.fileno(), start - aligned + count * size, offset=aligned, access=mmap.ACCESS_READ)
+    data.seek(start - aligned)
+    context = Container(**contextkw)
+    context._parsing = True
+    context._building = False
+    context._sizing = False
+    context._params = context
+    return [stripio(subcon._parsereport(data, context, "(parsing)")) for i in range(count)]
+
+
+def pool_results(executor, jobs, inflight, ordered):
+    """Used internally. Submits (function, args, release) jobs taken from an iterator to an executor, keeping at most inflight of them pending, and yields their results in order of submission or of completion. Release callables (if not None) free resources of a job once it is done or cancelled."""
+    from concurrent.futures import FIRST_COMPLETED, wait
+    pending = collections.deque()
+    releases = {}
+    try:
+        while True:
+            for func,args,release in itertools.islice(jobs, inflight - len(pending)):
+                future = executor.submit(func, *args)
+                releases[future] = release
+                pending.append(future)
+            if not pending:
+                return
+            if ordered:
+                future = pending.popleft()
+            else:
+                future = wait(pending, return_when=FIRST_COMPLETED).done.pop()
+                pending.remove(future)
+            try:
+                result = future.result()
+            finally:
+                release = releases.pop(future)
+                if release is not None:
+                    release()
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        for future in pending:
+            try:
+                future.exception()
+            except BaseException:
+                pass
+            release = releases.pop(future)
+            if release is not None:
+                release()
+
+
 def stream_iseof(stream):
     try:
         fallback = stream.tell()
@@ -238,6 +445,8 @@ def stream_iseof(stream):
 class BytesIOWithOffsets(io.BytesIO):
     @staticmethod
     def from_reading(stream, length: int, path: str):
+        if type(stream) in (io.BytesIO, BytesIOWithOffsets, BoundedBytesIO, mmap.mmap):
+            return BoundedBytesIO.from_reading(stream, length, path)
         offset = stream_tell(stream, path)
         contents = stream_read(stream, length, path)
         return BytesIOWithOffsets(contents, stream, offset)
@@ -258,6 +467,240 @@ class BytesIOWithOffsets(io.BytesIO):
         return self.tell()
 
 
+class BoundedBytesIO(object):
+    """Used internally. Read-only stream over a region of the buffer of a parent in-memory stream (BytesIO, mmap, or another BoundedBytesIO), or of a bytearray or memoryview, that does not copy the region. Reading stops at the end of the region, and returns bytes regardless of the buffer type. Positions are those of the parent stream, like in BytesIOWithOffsets, so nested regions share one buffer regardless of how deep they are nested."""
+
+    @staticmethod
+    def from_reading(stream, length: int, path: str):
+        if length < 0:
+            raise StreamError("length must be non-negative, found %s" % length, path=path)
+        if type(stream) is BoundedBytesIO:
+            data, start, end, delta = stream.data, stream.pos, stream.end, stream.delta
+        elif type(stream) is mmap.mmap:
+            data, start, end, delta = stream, stream_tell(stream, path), len(stream), 0
+        else:
+            offset = stream_tell(stream, path)
+            data = stream.getvalue()
+            start = io.BytesIO.tell(stream)
+            end = len(data)
+            delta = offset - start
+        if length > end - start:
+            raise StreamError("stream read less than specified amount, expected %d, found %d" % (length, max(0, end - start)), path=path)
+        if type(stream) is BoundedBytesIO:
+            stream.pos = start + length
+        else:
+            stream.seek(length, io.SEEK_CUR)
+        return BoundedBytesIO(data, start, start + length, delta)
+
+    def __init__(self, data, start: int, end: int, delta: int):
+        self.data = data
+        self.start = start
+        self.end = end
+        self.pos = start
+        self.delta = delta
+
+    def read(self, size=-1):
+        pos = self.pos
+        end = self.end
+        if size is not None and 0 <= size < end - pos:
+            end = pos + size
+        if end <= pos:
+            return b""
+        self.pos = end
+        data = self.data[pos:end]
+        return data if type(data) is bytes else bytes(data)
+
+    def read1(self, size=-1):
+        return self.read(size)
+
+    def readinto(self, buffer):
+        data = self.read(len(memoryview(buffer).cast("B")))
+        memoryview(buffer).cast("B")[:len(data)] = data
+        return len(data)
+
+    def readline(self, size=-1):
+        end = self.end
+        if size is not None and 0 <= size < end - self.pos:
+            end = self.pos + size
+        if type(self.data) is memoryview:
+            found = bytes(self.data[self.pos:end]).find(b"\n")
+            found = found if found < 0 else self.pos + found
+        else:
+            found = self.data.find(b"\n", self.pos, end)
+        return self.read((end if found < 0 else found + 1) - self.pos)
+
+    def peek(self, size=0):
+        data = self.data[self.pos:min(self.end, self.pos + max(size, io.DEFAULT_BUFFER_SIZE))]
+        return data if type(data) is bytes else bytes(data)
+
+    def getvalue(self):
+        data = self.data[self.start:self.end]
+        return data if type(data) is bytes else bytes(data)
+
+    def tell(self) -> int:
+        return self.pos + self.delta
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset - self.delta
+            if pos < self.start:
+                raise ValueError("negative seek value %d" % (pos - self.start,))
+        elif whence == io.SEEK_CUR:
+            pos = max(self.start, self.pos + offset)
+        elif whence == io.SEEK_END:
+            pos = max(self.start, self.end + offset)
+        else:
+            raise ValueError("invalid whence (%r, should be 0, 1 or 2)" % (whence,))
+        self.pos = pos
+        return pos + self.delta
+
+    def seekable(self):
+        return True
+
+    def readable(self):
+        return True
+
+    def writable(self):
+        return False
+
+    closed = False
+
+    def close(self):
+        pass
+
+
+class PositionalFileIO(object):
+    """Used internally. Read-only stream over a file that reads using os.pread at its own position, so that it neither uses nor moves the position of the file object it was made from. Reads are buffered, and streams made over same file can share the buffer (a list holding a tuple of buffer position and contents, that is replaced and never modified)."""
+
+    def __init__(self, file, pos: int, buffer: list):
+        self.file = file
+        self.pos = pos
+        self.buffer = buffer
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            chunks = []
+            while True:
+                chunk = os.pread(self.file.fileno(), 1024*1024, self.pos)
+                if not chunk:
+                    return b"".join(chunks)
+                chunks.append(chunk)
+                self.pos += len(chunk)
+        bufferpos, buffer = self.buffer[0]
+        start = self.pos - bufferpos
+        if 0 <= start and start + size <= len(buffer):
+            data = buffer[start:start+size]
+        else:
+            buffer = os.pread(self.file.fileno(), max(size, io.DEFAULT_BUFFER_SIZE), self.pos)
+            self.buffer[0] = (self.pos, buffer)
+            data = buffer[:size]
+        self.pos += len(data)
+        return data
+
+    def read1(self, size=-1):
+        return self.read(size)
+
+    def readinto(self, buffer):
+        data = self.read(len(memoryview(buffer).cast("B")))
+        memoryview(buffer).cast("B")[:len(data)] = data
+        return len(data)
+
+    def readline(self, size=-1):
+        chunks = []
+        while size != 0:
+            chunk = self.read(io.DEFAULT_BUFFER_SIZE if size is None or size < 0 else min(size, io.DEFAULT_BUFFER_SIZE))
+            found = chunk.find(b"\n")
+            if found >= 0:
+                self.pos -= len(chunk) - found - 1
+                chunk = chunk[:found + 1]
+            chunks.append(chunk)
+            if found >= 0 or not chunk:
+                break
+            if size is not None and size > 0:
+                size -= len(chunk)
+        return b"".join(chunks)
+
+    def peek(self, size=0):
+        pos = self.pos
+        data = self.read(max(size, io.DEFAULT_BUFFER_SIZE))
+        self.pos = pos
+        return data
+
+    def tell(self) -> int:
+        return self.pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self.pos + offset
+        elif whence == io.SEEK_END:
+            pos = os.fstat(self.file.fileno()).st_size + offset
+        else:
+            raise ValueError("invalid whence (%r, should be 0, 1 or 2)" % (whence,))
+        if pos < 0:
+            raise ValueError("negative seek value %d" % (pos,))
+        self.pos = pos
+        return pos
+
+    def seekable(self):
+        return True
+
+    def readable(self):
+        return True
+
+    def writable(self):
+        return False
+
+    @property
+    def closed(self):
+        return self.file.closed
+
+    def close(self):
+        pass
+
+
+def stream_positional(stream, path):
+    """Used internally. Returns a function that makes new streams over same data as given stream, positioned at given offset (BoundedBytesIO over in-memory streams, PositionalFileIO over files opened for reading only), so that lazily parsed values can be read without racing on position of given stream. Returns None if that is not possible."""
+    kind = type(stream)
+    if kind is BoundedBytesIO:
+        data, start, end, delta = stream.data, stream.start, stream.end, stream.delta
+    elif kind is mmap.mmap:
+        data, start, end, delta = stream, 0, len(stream), 0
+    elif kind is io.BytesIO or kind is BytesIOWithOffsets:
+        data, start, delta = stream.getvalue(), 0, stream_tell(stream, path) - io.BytesIO.tell(stream)
+        end = len(data)
+    elif (kind is io.FileIO or kind is io.BufferedReader and type(stream.raw) is io.FileIO) and hasattr(os, "pread"):
+        if stream.closed or stream.writable():
+            return None
+        buffer = [(0, b"")]
+        return lambda offset: PositionalFileIO(stream, offset, buffer)
+    else:
+        return None
+    def positioned(offset):
+        view = BoundedBytesIO(data, start, end, delta)
+        view.pos = offset - delta
+        return view
+    return positioned
+
+
+lazy_lock = threading.RLock()
+
+
+class ProbingBytesIO(io.BytesIO):
+    """Used internally. Records the position that the most recent short read tried to reach, so that after a failed parse the caller knows how many more bytes are needed. Reads that came up short but were recovered from (by Select, Optional and such) are superseded by the read that failed last, and terminated strings are read one unit at a time (see stream_read_terminated), so the caller never asks for bytes past the end of the record."""
+
+    def __init__(self, contents):
+        super().__init__(contents)
+        self.wanted = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        if size is not None and 0 <= len(data) < size:
+            self.wanted = self.tell() - len(data) + size
+        return data
+
+
 class CodeGen:
     def __init__(self):
         self.blocks = []
@@ -267,7 +710,15 @@ class CodeGen:
         self.linkedinstances = {}
         self.linkedparsers = {}
         self.linkedbuilders = {}
+        self.linkedids = {}
         self.userfunction = {}
+        self.parsebuffercache = {}
+        self.buildbuffercache = {}
+        self.bufferfallback = False
+        self.path = "(compiling)"
+        self.fallbacks = []
+        self.records = False
+        self.recordcache = {}
 
     def allocateId(self):
         self.nextid += 1
@@ -285,6 +736,82 @@ class CodeGen:
         return "\n".join(self.blocks + [""])
 
 
+class CompileCache:
+    r"""
+    On-disk cache of compiled code objects, used by :meth:`~construct.core.Construct.compile` to skip bytecode compilation of generated source. Entries are keyed by the sha1 of generated source, the interpreter cache tag and Construct version, and stored as marshalled code objects. After each store, least recently used entries are evicted until the directory holds at most `maxsize` bytes of entries.
+
+    Note that code generation itself still runs on every compile, because it is what produces the key and links instances that cannot be compiled.
+
+    :param directory: string or PathLike, created if missing
+    :param maxsize: integer, maximum total size of cached entries in bytes
+
+    Example::
+
+        >>> cache = CompileCache("/tmp/construct-cache")
+        >>> d = Struct("num" / Byte).compile(cachedir=cache)
+    """
+
+    suffix = ".constructcache"
+
+    def __init__(self, directory, maxsize=64*1024*1024):
+        self.directory = os.fspath(directory)
+        self.maxsize = maxsize
+
+    @staticmethod
+    def tag():
+        """Returns the interpreter cache tag and Construct version, that marshalled code objects are only valid for."""
+        tag = sys.implementation.cache_tag or "python-%d%d" % sys.version_info[:2]
+        return f"{tag}.{version_string}"
+
+    def filename(self, modulename):
+        return os.path.join(self.directory, f"{modulename}.{self.tag()}{self.suffix}")
+
+    def load(self, modulename):
+        """Returns cached code object, or None if there is no usable entry."""
+        import marshal
+        filename = self.filename(modulename)
+        try:
+            with open(filename, "rb") as f:
+                c = marshal.loads(f.read())
+            os.utime(filename)
+        except Exception:
+            return None
+        return c
+
+    def store(self, modulename, c):
+        """Writes code object atomically, then evicts entries over the size limit."""
+        import marshal, tempfile
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmpname = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(fd, "wb") as f:
+                f.write(marshal.dumps(c))
+            os.replace(tmpname, self.filename(modulename))
+        except OSError:
+            return
+        self.evict()
+
+    def evict(self):
+        """Removes least recently used entries until total size fits within maxsize."""
+        entries = []
+        try:
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(self.suffix):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+        except OSError:
+            return
+        total = sum(size for _,size,_ in entries)
+        for _,size,path in sorted(entries):
+            if total <= self.maxsize:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+
 class KsyGen:
     def __init__(self):
         self.instances = {}
@@ -305,6 +832,16 @@ def hyphenatelist(l):
     return [hyphenatedict(d) for d in l]
 
 
+def picklablemacro(func):
+    """Used internally. Decorates a macro, so that constructs it returns (that have functions defined inside the macro as attributes, which cannot be pickled) are pickled as a call to the macro with same arguments."""
+    @functools.wraps(func)
+    def macro(*args, **kwargs):
+        x = func(*args, **kwargs)
+        x._macro = (macro, args, kwargs)
+        return x
+    return macro
+
+
 def extractfield(sc):
     if isinstance(sc, Renamed):
         return extractfield(sc.subcon)
@@ -315,6 +852,145 @@ def evaluate(param, context):
     return param(context) if callable(param) else param
 
 
+def fusedformats(subcons, code, minimum=2):
+    r"""
+    Used internally. Groups consecutive members that emit a struct format (see `_emitformat`) and share byte order. Returns a list of items that are either a member, or a list of (member, format tuple) pairs (at least `minimum` long) to be fused into one struct.Struct.
+    """
+    groups = []
+    run = []
+    runorder = ""
+    def flush():
+        if len(run) >= minimum:
+            groups.append(list(run))
+        else:
+            groups.extend(sc for sc,_ in run)
+        run.clear()
+    for sc in subcons:
+        try:
+            fmt = sc._emitformat(code)
+        except NotImplementedError:
+            flush()
+            runorder = ""
+            groups.append(sc)
+            continue
+        byteorder = fmt[0]
+        if byteorder and runorder and byteorder != runorder:
+            flush()
+            runorder = ""
+        runorder = runorder or byteorder
+        run.append((sc, fmt))
+    flush()
+    return groups
+
+
+def formatarray(subcon, count, code, building=False):
+    """Used internally. Returns struct format string (or its prefix and suffix around non-constant count) and element size, for arrays whose elements can be unpacked (or packed, if building) all at once. Raises NotImplementedError otherwise."""
+    byteorder, format, decoder, encoder = subcon._emitformat(code)
+    if (encoder if building else decoder) != "{}" or len(format) != 1:
+        raise NotImplementedError
+    byteorder = byteorder or ">"
+    size = struct.calcsize(byteorder+format)
+    if isinstance(count, int):
+        return f"{byteorder}{count}{format}", size
+    return (byteorder, format), size
+
+
+def emitformatarrayparse(subcon, count, code, buffered=False):
+    """Used internally. Emits parsing of entire array of FormatField-like elements with one unpack, either from `io` stream or from `buf` buffer at `pos` cursor."""
+    fmt, size = formatarray(subcon, count, code)
+    if isinstance(count, int):
+        fname = f"formatarray_{code.allocateId()}"
+        code.append(f"{fname} = struct.Struct({repr(fmt)})")
+        if buffered:
+            return f"(ListContainer({fname}.unpack_from(buf, pos)), pos+{count*size})"
+        return f"ListContainer({fname}.unpack(io.read({count*size})))"
+    if buffered:
+        fname = f"parse_formatarray_buffer_{code.allocateId()}"
+        code.append(f"""
+            def {fname}(buf, pos, count):
+                if not 0 <= count:
+                    raise RangeError("invalid count %s" % (count,))
+                return ListContainer(struct.unpack_from(f'{fmt[0]}{{count}}{fmt[1]}', buf, pos)), pos+{size}*count
+        """)
+        return f"{fname}(buf, pos, {count})"
+    fname = f"parse_formatarray_{code.allocateId()}"
+    code.append(f"""
+        def {fname}(io, count):
+            if not 0 <= count:
+                raise RangeError("invalid count %s" % (count,))
+            return ListContainer(struct.unpack(f'{fmt[0]}{{count}}{fmt[1]}', io.read({size}*count)))
+    """)
+    return f"{fname}(io, {count})"
+
+
+def emitformatarraybuild(subcon, count, code):
+    """Used internally. Emits building of entire array of FormatField-like elements with one pack."""
+    fmt, size = formatarray(subcon, count, code, building=True)
+    fname = f"build_formatarray_{code.allocateId()}"
+    if isinstance(count, int):
+        code.append(f"""
+            formatarray_{fname} = struct.Struct({repr(fmt)})
+            def {fname}(obj, io, count):
+                if len(obj) != {count}:
+                    raise RangeError("expected %d elements, found %d" % ({count}, len(obj)))
+                io.write(formatarray_{fname}.pack(*obj))
+                return ListContainer(obj)
+        """)
+    else:
+        code.append(f"""
+            def {fname}(obj, io, count):
+                if not 0 <= count:
+                    raise RangeError("invalid count %s" % (count,))
+                if len(obj) != count:
+                    raise RangeError("expected %d elements, found %d" % (count, len(obj)))
+                io.write(struct.pack(f'{fmt[0]}{{count}}{fmt[1]}', *obj))
+                return ListContainer(obj)
+        """)
+    return f"{fname}(obj, io, {count})"
+
+
+def fusedstruct(run, code):
+    """Used internally. Declares struct.Struct for a run returned by fusedformats, returns its name and size."""
+    byteorder = next((fmt[0] for sc,fmt in run if fmt[0]), ">")
+    fmtstr = byteorder + "".join(fmt[1] for sc,fmt in run)
+    fname = f"fusedformat_{code.allocateId()}"
+    code.append(f"{fname} = struct.Struct({repr(fmtstr)})")
+    return fname, struct.calcsize(fmtstr)
+
+
+def contextfree(subcon):
+    r"""
+    Used internally. Walks a construct tree and returns True if no member can read the context, meaning there are no `this` expressions, no user lambdas or functions, no Index or Probe, no classes defined outside of the library (like user Adapter subclasses), and no members that cannot be compiled (those are linked, and their _parse and _build receive the context). Library functions (like bytes2bits) and builtins are considered safe, anything unknown is not.
+    """
+    from construct.debug import Probe
+    seen = set()
+    pending = [subcon]
+    while pending:
+        value = pending.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        if isinstance(value, Construct):
+            if value is Index or isinstance(value, Probe):
+                return False
+            cls = type(value)
+            if not cls.__module__.startswith("construct.") or cls._emitparse is Construct._emitparse or cls._emitbuild is Construct._emitbuild:
+                return False
+            pending.extend(v for k,v in vars(value).items() if k not in ("name", "docs", "parsed", "_macro") and not k.startswith("_emit"))
+        elif isinstance(value, ExprMixin):
+            if "this" in repr(value):
+                return False
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            pending.extend(value)
+        elif isinstance(value, dict):
+            pending.extend(dict.keys(value))
+            pending.extend(dict.values(value))
+        elif callable(value) and not isinstance(value, type):
+            if not isinstance(value, type(len)) and not getattr(value, "__module__", "").startswith("construct.lib"):
+                return False
+    return True
+
+
 #===============================================================================
 # abstract constructs
 #===============================================================================
@@ -383,6 +1059,12 @@ class Construct(object):
         for name, value in attrs.items():
             setattr(self, name, value)
 
+    def __reduce_ex__(self, protocol):
+        if "_macro" in getattr(self, "__dict__", ()):
+            func, args, kwargs = self._macro
+            return (functools.partial(func, *args, **kwargs), ())
+        return super().__reduce_ex__(protocol)
+
     def __copy__(self):
         self2 = object.__new__(self.__class__)
         self2.__setstate__(self.__getstate__())
@@ -418,13 +1100,251 @@ class Construct(object):
         except CancelParsing:
             pass
 
-    def parse_file(self, filename, **contextkw):
+    def parse_file(self, filename, memorymap=False, **contextkw):
         r"""
         Parse a closed binary file. See parse().
+
+        Optionally, the file is memory-mapped and parsed from the map instead of a buffered reader. Seeking (like by Pointer or Seek) then costs no syscalls and only pages that were touched are read from disk. The map is not closed when parsing returns, so that values parsed by LazyStruct LazyArray Lazy can still be accessed, and it is unmapped once nothing refers to it.
+
+        :param memorymap: optional, bool, parse from read-only mmap of the file
         """
+        if memorymap:
+            data = stream_mapfile(filename)
+            return self.parse_stream(data if isinstance(data, mmap.mmap) else io.BytesIO(data), **contextkw)
         with open(filename, 'rb') as f:
             return self.parse_stream(f, **contextkw)
 
+    def parse_iter(self, stream, **contextkw):
+        r"""
+        Parse back-to-back records from a stream or a file (given by filename), yielding one parsed record at a time, until the stream ends exactly at a record boundary. Unlike GreedyRange, records are not accumulated in memory. The context is created once and shared by all records.
+
+        End of stream is detected using peek method (like files opened in binary mode and other buffered readers have), or by reading and seeking back. See parse().
+
+        :param stream: stream, or string or PathLike filename
+
+        :returns: generator of parsed records
+
+        :raises StreamError: stream ended in the middle of a record, or stream neither has peek method nor is seekable
+        """
+        if isinstance(stream, (str, os.PathLike)):
+            with open(stream, 'rb') as f:
+                yield from self.parse_iter(f, **contextkw)
+            return
+        context = Container(**contextkw)
+        context._parsing = True
+        context._building = False
+        context._sizing = False
+        context._params = context
+        peek = getattr(stream, "peek", None)
+        if peek is None:
+            try:
+                seekable = stream.seekable()
+            except Exception:
+                seekable = False
+            if not seekable:
+                raise StreamError("stream must have peek method or be seekable to detect end of stream", path="(parsing)")
+        while True:
+            if peek is not None:
+                try:
+                    if not peek(1):
+                        return
+                except Exception:
+                    raise StreamError("stream.peek() failed", path="(parsing)")
+            elif stream_iseof(stream):
+                return
+            try:
+                yield self._parsereport(stream, context, "(parsing)")
+            except CancelParsing:
+                return
+
+    def index_file(self, filename, sidecar=None, offset=0, **contextkw):
+        r"""
+        Index a file made of back-to-back records (like a file that is ``GreedyRange(record)``), so that any record can be accessed without parsing the ones before it. The file is memory-mapped and walked once, every record is skipped using its size if it can be determined (fixed-size records, or records with length prefix like ``Prefixed`` and ``PrefixedArray``), otherwise records are parsed (compiled records are parsed faster). Records start at given offset, which allows to skip a header (like the count field of ``PrefixedArray``).
+
+        Offsets of fixed-size records are computed when accessed, and the file is not walked. Offsets of variable-size records are kept in a compact ``array('q')``. Optionally, they are saved into a sidecar file, and loaded from it instead of walking the file again, as long as the file has same size and modification time as when it was indexed.
+
+        :param filename: string or PathLike, file to index
+        :param sidecar: optional, string or PathLike, file to save offsets into and load them from
+        :param offset: optional, integer, position of first record
+
+        :returns: LazyListContainer of records, that are parsed when accessed (and cached)
+
+        :raises StreamError: file ended in the middle of a record
+        """
+        context = Container(**contextkw)
+        context._parsing = True
+        context._building = False
+        context._sizing = False
+        context._params = context
+        path = "(parsing)"
+        data = stream_mapfile(filename)
+        stream = data if isinstance(data, mmap.mmap) else io.BytesIO(data)
+        end = len(data)
+        if not 0 <= offset <= end:
+            raise StreamError("offset %s is outside of the file of %s bytes" % (offset, end), path=path)
+        try:
+            size = self.sizeof(**contextkw)
+        except SizeofError:
+            size = None
+        if size:
+            if (end - offset) % size:
+                raise StreamError("file ended in the middle of a record", path=path)
+            return LazyListContainer(self, stream, (end - offset) // size, range(offset, end + 1, size), {}, context, path)
+        stat = os.stat(filename)
+        offsets = index_load(sidecar, stat, offset) if sidecar is not None else None
+        if offsets is None:
+            offsets = array.array('q', [offset])
+            sizable = True
+            while offset < end:
+                stream_seek(stream, offset, 0, path)
+                context._index = len(offsets) - 1
+                if sizable:
+                    try:
+                        offset += self._actualsize(stream, context, path)
+                    except SizeofError:
+                        sizable = False
+                        stream_seek(stream, offset, 0, path)
+                if not sizable:
+                    self._parsereport(stream, context, path)
+                    offset = stream_tell(stream, path)
+                if offset > end:
+                    raise StreamError("file ended in the middle of a record", path=path)
+                if offset == offsets[-1]:
+                    raise StreamError("record of no size cannot be indexed", path=path)
+                offsets.append(offset)
+            if sidecar is not None:
+                index_save(sidecar, stat, offsets)
+        return LazyListContainer(self, stream, len(offsets) - 1, offsets, {}, context, path)
+
+    def parse_many(self, buffers, workers=None, chunksize=256, ordered=True, **contextkw):
+        r"""
+        Parse many independent buffers (like bytes objects, one record each) in a pool of worker processes, yielding parsed records. Buffers are dispatched in chunks, every chunk is copied into one shared memory segment (instead of being pickled) and parsed by a worker, and parsed records are sent back. The construct is sent to every worker once, see :meth:`~construct.core.Construct.compile` about pickling compiled instances.
+
+        Buffers are taken from the iterable only as workers need them, at most two chunks per worker are in flight. Parsed records must be picklable (records of constructs compiled with ``records=True`` are sent back as Containers).
+
+        :param buffers: iterable of bytes-like objects
+        :param workers: optional, integer, amount of worker processes, by default amount of CPUs
+        :param chunksize: optional, integer, amount of buffers parsed by a worker at once
+        :param ordered: optional, bool, yield records in order of buffers, otherwise in order in which chunks get parsed
+
+        :returns: generator of parsed records
+
+        :raises ConstructError: raised for any reason, by a worker
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import shared_memory
+        workers = workers or os.cpu_count() or 1
+        def jobs():
+            iterator = iter(buffers)
+            while True:
+                chunk = [memoryview(b).cast("B") for b in itertools.islice(iterator, chunksize)]
+                if not chunk:
+                    return
+                offsets = [0]
+                for b in chunk:
+                    offsets.append(offsets[-1] + len(b))
+                shm = shared_memory.SharedMemory(create=True, size=max(1, offsets[-1]))
+                for b,start in zip(chunk, offsets):
+                    shm.buf[start:start+len(b)] = b
+                def release(shm=shm):
+                    shm.close()
+                    shm.unlink()
+                yield (parsemany_chunk, (shm.name, offsets), release)
+        with ProcessPoolExecutor(workers, initializer=parsemany_init, initargs=(self, contextkw)) as executor:
+            for records in pool_results(executor, jobs(), 2*workers, ordered):
+                yield from records
+
+    def parse_shards(self, filename, workers=None, shardsize=64*1024*1024, ordered=True, offset=0, **contextkw):
+        r"""
+        Parse a file made of back-to-back fixed-size records (like a file that is ``GreedyRange(record)`` where record has static sizeof) in a pool of worker processes, yielding parsed records. The file is split into shards of whole records, every worker memory-maps only the shard it parses (so no file contents are sent to workers), and parsed records are sent back. The construct is sent to every worker once, see :meth:`~construct.core.Construct.compile` about pickling compiled instances.
+
+        Shards are at most given amount of bytes (but at least one record), and at most two shards per worker are in flight, which caps memory used by parsed records that were not yet yielded. Records start at given offset, which allows to skip a header.
+
+        :param filename: string or PathLike, file to parse
+        :param workers: optional, integer, amount of worker processes, by default amount of CPUs
+        :param shardsize: optional, integer, amount of bytes parsed by a worker at once
+        :param ordered: optional, bool, yield records in order of the file, otherwise in order in which shards get parsed
+        :param offset: optional, integer, position of first record
+
+        :returns: generator of parsed records
+
+        :raises SizeofError: record size is not static, or is zero
+        :raises StreamError: file ended in the middle of a record
+        :raises ConstructError: raised for any reason, by a worker
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        path = "(parsing)"
+        size = self.sizeof(**contextkw)
+        if not size:
+            raise SizeofError("records of no size cannot be sharded", path=path)
+        filename = os.fspath(filename)
+        end = os.path.getsize(filename)
+        if not 0 <= offset <= end:
+            raise StreamError("offset %s is outside of the file of %s bytes" % (offset, end), path=path)
+        if (end - offset) % size:
+            raise StreamError("file ended in the middle of a record", path=path)
+        count = (end - offset) // size
+        pershard = max(1, shardsize // size)
+        workers = workers or os.cpu_count() or 1
+        jobs = ((parseshards_chunk, (filename, offset + i*size, min(pershard, count - i)), None) for i in range(0, count, pershard))
+        with ProcessPoolExecutor(workers, initializer=parseshards_init, initargs=(self, contextkw)) as executor:
+            for records in pool_results(executor, jobs, 2*workers, ordered):
+                yield from records
+
+    async def parse_async(self, reader, **contextkw):
+        r"""
+        Parse one record from an asyncio StreamReader (or anything that has readexactly coroutine method), awaiting exactly the bytes it consists of. See parse().
+
+        Record size is determined before parsing if possible, either from sizeof (fixed-size constructs) or from the record header using `_actualsize` (like Prefixed and PrefixedArray), so that a record costs one or two reads. Otherwise the record is parsed on trial and every time it runs out of data, the missing amount is awaited. Compiled instances are parsed on trial using their original (not compiled) construct.
+
+        :param reader: asyncio.StreamReader
+
+        :returns: some value, see parse()
+
+        :raises StreamError: reader ended before the record was complete
+        """
+        import asyncio
+        async def readexactly(length):
+            try:
+                return await reader.readexactly(length)
+            except asyncio.IncompleteReadError as e:
+                raise StreamError("stream read less than specified amount, expected %d, found %d" % (length, len(e.partial)), path="(parsing)")
+        context = Container(**contextkw)
+        context._parsing = True
+        context._building = False
+        context._sizing = False
+        context._params = context
+        try:
+            size = self._sizeof(context, "(parsing)")
+        except (SizeofError, KeyError, AttributeError):
+            size = None
+        data = b""
+        while size is None:
+            stream = ProbingBytesIO(data)
+            try:
+                size = self._actualsize(stream, context, "(parsing)")
+            except StreamError:
+                if stream.wanted <= len(data):
+                    raise
+                data += await readexactly(stream.wanted - len(data))
+            except (SizeofError, KeyError, AttributeError):
+                break
+        if size is not None:
+            if size > len(data):
+                data += await readexactly(size - len(data))
+            return self.parse(data, **contextkw)
+        subcon = self.defersubcon if isinstance(self, Compiled) else self
+        while True:
+            stream = ProbingBytesIO(data)
+            try:
+                return subcon._parsereport(stream, context, "(parsing)")
+            except CancelParsing:
+                return None
+            except StreamError:
+                if stream.wanted <= len(data):
+                    raise
+                data += await readexactly(stream.wanted - len(data))
+
     def _parsereport(self, stream, context, path):
         obj = self._parse(stream, context, path)
         if self.parsed is not None:
@@ -474,6 +1394,46 @@ class Construct(object):
         with open(filename, 'w+b') as f:
             self.build_stream(obj, f, **contextkw)
 
+    async def build_async(self, obj, writer, **contextkw):
+        r"""
+        Build an object into an asyncio StreamWriter (or anything that has write method and drain coroutine method), with one write call, and await draining it. See build().
+
+        :param writer: asyncio.StreamWriter
+        """
+        writer.write(self.build(obj, **contextkw))
+        await writer.drain()
+
+    def build_segments(self, obj, **contextkw):
+        r"""
+        Build an object into a list of segments (bytes and bytearray objects), that concatenated make the same bytes as build() returns. Large bytes values (like payloads of Bytes GreedyBytes fields) are not copied into one buffer but referenced, including through ``Prefixed`` and ``FixedSized``, small fields are coalesced into bytearray segments. The list can be joined once, or written without joining using os.writev or socket.sendmsg. See build().
+
+        :returns: list of bytes-like objects
+
+        :raises ConstructError: raised for any reason
+        """
+        stream = SegmentedBytesIO()
+        self.build_stream(obj, stream, **contextkw)
+        return stream.getsegments()
+
+    def build_into(self, obj, buffer, offset=0, **contextkw):
+        r"""
+        Build an object into a preallocated writable buffer (bytearray, memoryview, mmap), starting at given offset. Compiled instances of fixed-size constructs pack fields directly into the buffer, otherwise this builds into bytes and copies them. See build().
+
+        :param buffer: writable bytes-like object
+        :param offset: optional, integer, position in buffer to write at
+
+        :returns: integer, amount of bytes written
+
+        :raises StreamError: built data does not fit into the buffer
+        """
+        data = self.build(obj, **contextkw)
+        if isinstance(buffer, memoryview):
+            buffer = buffer.cast("B")
+        if not 0 <= offset <= len(buffer) - len(data):
+            raise StreamError(f"buffer of {len(buffer)} bytes cannot fit {len(data)} bytes at offset {offset}", path="(building)")
+        buffer[offset:offset+len(data)] = data
+        return len(data)
+
     def _build(self, obj, stream, context, path):
         """Override in your subclass."""
         raise NotImplementedError
@@ -508,30 +1468,77 @@ class Construct(object):
     def _actualsize(self, stream, context, path):
         return self._sizeof(context, path)
 
-    def compile(self, filename=None):
+    def compile(self, filename=None, cachedir=None, strict=False, records=False):
         """
         Transforms a construct into another construct that does same thing (has same parsing and building semantics) but is much faster when parsing. Already compiled instances just compile into itself.
 
         Optionally, partial source code can be saved to a text file. This is meant only to inspect the generated code, not to import it from external scripts.
 
+        Optionally, compiled bytecode can be cached on disk, so that later processes compiling the same construct skip bytecode compilation. See :class:`~construct.core.CompileCache`.
+
+        Constructs that cannot be compiled are linked into compiled code and run at interpreted speed. Those are listed in `fallbacks` attribute of returned instance, as (mode, path, construct) tuples where mode is "parse" or "build". In strict mode, any such fallback raises instead.
+
+        :param filename: optional, string, source code is saved to that file
+        :param cachedir: optional, string or PathLike or CompileCache instance
+        :param strict: optional, bool, raise if any subcon could not be compiled
+        :param records: optional, bool, compiled Struct parses into instances of generated :class:`~construct.lib.Record` subclasses (that use __slots__) instead of Container
+
         :returns: Compiled instance
+
+        :raises ConstructError: in strict mode, some subcons could not be compiled
         """
 
         code = CodeGen()
+        code.records = records
         code.append("""
             # generated by Construct, this source is for inspection only! do not import!
 
             from construct import *
             from construct.lib import *
+            from construct.core import BoundedBytesIO, stream_buildbuffer, stream_buildvalue, stream_write, stream_read_terminated
             from io import BytesIO
             import struct
             import collections
             import itertools
+            import mmap
 
             def restream(data, func):
                 return func(BytesIO(data))
             def reuse(obj, func):
                 return func(obj)
+            def bufferstream(buf):
+                if isinstance(buf, (bytes, mmap.mmap)):
+                    return buf if isinstance(buf, mmap.mmap) else BytesIO(buf)
+                if not isinstance(buf, bytearray):
+                    buf = memoryview(buf).cast("B")
+                return BoundedBytesIO(buf, 0, len(buf), 0)
+            def substream(io, length, func):
+                if length < 4096 or type(io) not in (BytesIO, BoundedBytesIO, mmap.mmap):
+                    return func(BytesIO(io.read(length)))
+                io = BoundedBytesIO.from_reading(io, length, "(parsing)")
+                io.delta = -io.start
+                return func(io)
+            def bytesvalue(obj, length):
+                data = integer2bytes(obj, length) if isinstance(obj, int) else obj
+                if not isinstance(data, (bytes, bytearray)):
+                    raise StringError("given non-bytes value, perhaps unicode? %r" % (data,))
+                if len(data) != length:
+                    raise StreamError("bytes object of wrong length, expected %d, found %d" % (length, len(data)))
+                return data
+            def bitsinteger(obj, length, signed):
+                if not isinstance(obj, int):
+                    raise IntegerError(f"value {obj} is not an integer")
+                low, high = (-(1 << (length-1)), (1 << (length-1)) - 1) if signed else (0, (1 << length) - 1)
+                if not low <= obj <= high:
+                    raise IntegerError(f"number {obj} is out of range (min={low}, max={high})")
+                return obj & ((1 << length) - 1)
+            def bytesinteger(obj, length, signed):
+                if not isinstance(obj, int):
+                    raise IntegerError(f"value {obj} is not an integer")
+                low, high = (-(1 << (8*length-1)), (1 << (8*length-1)) - 1) if signed else (0, (1 << 8*length) - 1)
+                if not low <= obj <= high:
+                    raise IntegerError(f"number {obj} does not fit width {length}, signed {signed}")
+                return obj
 
             linkedinstances = {}
             linkedparsers = {}
@@ -549,42 +1556,70 @@ class Construct(object):
                 return {self._compileparse(code)}
             def buildall(obj, io, this):
                 return {self._compilebuild(code)}
-            compiled = Compiled(parseall, buildall)
+        """)
+        parseallbuffer = buildallbuffer = buildsize = None
+        try:
+            parsebuffer = self._compileparsebuffer(code)
+            code.append(f"""
+                def parseallbuffer(buf, pos, this):
+                    io = {'bufferstream(buf)' if code.bufferfallback else 'None'}
+                    return {parsebuffer}[0]
+            """)
+            parseallbuffer = "parseallbuffer"
+        except NotImplementedError:
+            pass
+        try:
+            buildsize = self.sizeof()
+            buildbuffer = self._compilebuildbuffer(code)
+            code.append(f"""
+                def buildallbuffer(obj, buf, pos, this):
+                    io = None
+                    return {buildbuffer}[1]
+            """)
+            buildallbuffer = "buildallbuffer"
+        except (SizeofError, KeyError, AttributeError, NotImplementedError):
+            buildsize = None
+        code.append(f"""
+            compiled = Compiled(parseall, buildall, {parseallbuffer}, {buildallbuffer}, {buildsize})
         """)
         source = code.toString()
 
+        if strict and code.fallbacks:
+            details = ", ".join(f"{mode} {path} {construct}" for mode,path,construct in code.fallbacks)
+            raise ConstructError(f"compilation fell back to interpreted code: {details}", path=code.fallbacks[0][1])
+
         if filename:
             with open(filename, "wt") as f:
                 f.write(source)
 
         modulename = hexlify(hashlib.sha1(source.encode()).digest()).decode()
-        module_spec = importlib.machinery.ModuleSpec(modulename, None)
-        module = importlib.util.module_from_spec(module_spec)
-        c = compile(source, '', 'exec')
-        exec(c, module.__dict__)
-
-        module.linkedinstances = code.linkedinstances
-        module.linkedparsers = code.linkedparsers
-        module.linkedbuilders = code.linkedbuilders
-        module.userfunction = code.userfunction
-        compiled = module.compiled
-        compiled.source = source
-        compiled.module = module
-        compiled.modulename = modulename
+        if cachedir is not None and not isinstance(cachedir, CompileCache):
+            cachedir = CompileCache(cachedir)
+        c = cachedir.load(modulename) if cachedir is not None else None
+        if c is None:
+            c = compile(source, '', 'exec')
+            if cachedir is not None:
+                cachedir.store(modulename, c)
+
+        compiled = Compiled.link(source, modulename, c, code.linkedinstances, code.userfunction)
         compiled.defersubcon = self
+        compiled.fallbacks = code.fallbacks
         return compiled
 
     def _compileinstance(self, code):
         """Used internally."""
-        if id(self) in code.linkedinstances:
-            return
+        if id(self) in code.linkedids:
+            return code.linkedids[id(self)]
+        linkid = code.allocateId()
+        code.linkedids[id(self)] = linkid
         code.append(f"""
-            # linkedinstances[{id(self)}] is {self}
+            # linkedinstances[{linkid}] is {self}
         """)
         field = extractfield(self)
-        code.linkedinstances[id(self)] = field
-        code.linkedparsers[id(self)] = field._parse
-        code.linkedbuilders[id(self)] = field._build
+        code.linkedinstances[linkid] = field
+        code.linkedparsers[linkid] = field._parse
+        code.linkedbuilders[linkid] = field._build
+        return linkid
 
     def _compileparse(self, code):
         """Used internally."""
@@ -595,8 +1630,30 @@ class Construct(object):
             code.parsercache[id(self)] = emitted
             return emitted
         except NotImplementedError:
-            self._compileinstance(code)
-            return f"linkedparsers[{id(self)}](io, this, '(???)')"
+            linkid = self._compileinstance(code)
+            code.fallbacks.append(("parse", code.path, self))
+            return f"linkedparsers[{linkid}](io, this, '(???)')"
+
+    def _compileparsebuffer(self, code):
+        """Used internally. Unlike _compileparse, raises NotImplementedError if there is no buffer emitter."""
+        if id(self) in code.parsebuffercache:
+            return code.parsebuffercache[id(self)]
+        emitted = self._emitparsebuffer(code)
+        code.parsebuffercache[id(self)] = emitted
+        return emitted
+
+    def _compilebuildbuffer(self, code):
+        """Used internally. Uses _emitbuildbuffer, or packs fields that have _emitformat. Raises NotImplementedError if neither is available."""
+        if id(self) in code.buildbuffercache:
+            return code.buildbuffercache[id(self)]
+        try:
+            emitted = self._emitbuildbuffer(code)
+        except NotImplementedError:
+            fused, size = fusedstruct([(self, self._emitformat(code))], code)
+            encoder = self._emitformat(code)[3]
+            emitted = f"({fused}.pack_into(buf, pos{'' if encoder is None else ', '+encoder.replace('{}', 'obj')}), (obj, pos+{size}))[1]"
+        code.buildbuffercache[id(self)] = emitted
+        return emitted
 
     def _compilebuild(self, code):
         """Used internally."""
@@ -607,8 +1664,9 @@ class Construct(object):
             code.buildercache[id(self)] = emitted
             return emitted
         except NotImplementedError:
-            self._compileinstance(code)
-            return f"linkedbuilders[{id(self)}](obj, io, this, '(???)')"
+            linkid = self._compileinstance(code)
+            code.fallbacks.append(("build", code.path, self))
+            return f"linkedbuilders[{linkid}](obj, io, this, '(???)')"
 
     def _emitparse(self, code):
         """Override in your subclass."""
@@ -618,6 +1676,22 @@ class Construct(object):
         """Override in your subclass."""
         raise NotImplementedError
 
+    def _emitparsebuffer(self, code):
+        """Override in your subclass. Returns expression that parses from `buf` buffer at `pos` cursor and evaluates to (obj, pos) tuple."""
+        raise NotImplementedError
+
+    def _emitbuildbuffer(self, code):
+        """Override in your subclass. Returns expression that builds `obj` into `buf` buffer at `pos` cursor and evaluates to (buildret, pos) tuple."""
+        raise NotImplementedError
+
+    def _emitformat(self, code):
+        """Override in your subclass. Returns (byteorder, format, decoder, encoder) tuple for fixed-size fields that can be fused into one struct.Struct, see fusedformats."""
+        raise NotImplementedError
+
+    def _emitbitformat(self, code):
+        """Override in your subclass. Returns (length, decoder, encoder) tuple for fixed-size fields inside Bitwise, that can be extracted from one integer by shifting and masking."""
+        raise NotImplementedError
+
     def benchmark(self, sampledata, filename=None):
         """
         Measures performance of your construct (its parsing and building runtime), both for the original instance and the compiled instance. Uses timeit module, over at min 1 loop, and at max over 100 millisecond time.
@@ -867,20 +1941,32 @@ class Tunnel(Subconstruct):
     r"""
     Abstract class that allows other constructs to read part of the stream as if they were reading the entire stream. See Prefixed for example.
 
-    Needs to implement `_decode()` for parsing and `_encode()` for building.
+    Needs to implement `_decode()` for parsing and `_encode()` for building. Subclasses that set `streaming` attribute also need to implement `_decoder()` and `_encoder()`, and then the subcon reads from (or writes into) a stream that decodes (or encodes) data on demand, instead of entire data being transformed at once.
     """
+    streaming = False
+
     def _parse(self, stream, context, path):
+        if self.streaming:
+            stream2 = DecoderBytesIO(stream, *self._decoder(context, path))
+            obj = self.subcon.parse_stream(stream2, **context)
+            stream_read_entire(stream, path)
+            return obj
         data = stream_read_entire(stream, path)  # reads entire stream
         data = self._decode(data, context, path)
         return self.subcon.parse(data, **context)
 
     def _build(self, obj, stream, context, path):
+        if self.streaming:
+            stream2 = EncoderBytesIO(stream, *self._encoder(context, path))
+            buildret = self.subcon._build(obj, stream2, context, path)
+            stream2.close()
+            return buildret
         stream2 = io.BytesIO()
         buildret = self.subcon._build(obj, stream2, context, path)
         data = stream2.getvalue()
         data = self._encode(data, context, path)
         stream_write(stream, data, len(data), path)
-        return obj
+        return buildret
 
     def _sizeof(self, context, path):
         raise SizeofError(path=path)
@@ -891,31 +1977,232 @@ class Tunnel(Subconstruct):
     def _encode(self, data, context, path):
         raise NotImplementedError
 
+    def _decoder(self, context, path):
+        """Override in your subclass. Returns (decode, flush) pair of functions, decode is called with consecutive chunks of data and flush when data ended, both return decoded bytes."""
+        raise NotImplementedError
+
+    def _encoder(self, context, path):
+        """Override in your subclass. Returns (encode, flush) pair of functions, encode is called with consecutive chunks of data and flush when data ended, both return encoded bytes."""
+        raise NotImplementedError
+
 
 class Compiled(Construct):
     """Used internally."""
 
-    def __init__(self, parsefunc, buildfunc):
+    def __init__(self, parsefunc, buildfunc, parsebufferfunc=None, buildbufferfunc=None, buildsize=None):
         super().__init__()
         self.source = None
         self.defersubcon = None
+        self.fallbacks = []
         self.parsefunc = parsefunc
         self.buildfunc = buildfunc
+        self.parsebufferfunc = parsebufferfunc
+        self.buildbufferfunc = buildbufferfunc
+        self.buildsize = buildsize
+
+    def parse(self, data, **contextkw):
+        if self.parsebufferfunc is None:
+            return super().parse(data, **contextkw)
+        context = Container(**contextkw)
+        context._parsing = True
+        context._building = False
+        context._sizing = False
+        context._params = context
+        try:
+            return self.parsebufferfunc(data, 0, context)
+        except CancelParsing:
+            pass
+        except struct.error as e:
+            raise StreamError("stream read less than specified amount, %s" % (e,), path="(parsing)")
+
+    def parse_file(self, filename, memorymap=False, **contextkw):
+        if not memorymap or self.parsebufferfunc is None:
+            return super().parse_file(filename, memorymap, **contextkw)
+        return self.parse(stream_mapfile(filename), **contextkw)
+
+    def _parse(self, stream, context, path):
+        try:
+            return self.parsefunc(stream, context)
+        except struct.error as e:
+            raise StreamError("stream read less than specified amount, %s" % (e,), path=path)
+
+    def build(self, obj, **contextkw):
+        if self.buildbufferfunc is None:
+            return super().build(obj, **contextkw)
+        buf = bytearray(self.buildsize)
+        self.build_into(obj, buf, **contextkw)
+        return bytes(buf)
+
+    def build_into(self, obj, buffer, offset=0, **contextkw):
+        if self.buildbufferfunc is None:
+            return super().build_into(obj, buffer, offset, **contextkw)
+        if isinstance(buffer, memoryview):
+            buffer = buffer.cast("B")
+        if not 0 <= offset <= len(buffer) - self.buildsize:
+            raise StreamError(f"buffer of {len(buffer)} bytes cannot fit {self.buildsize} bytes at offset {offset}", path="(building)")
+        context = Container(**contextkw)
+        context._parsing = False
+        context._building = True
+        context._sizing = False
+        context._params = context
+        end = self.buildbufferfunc(obj, buffer, offset, context)
+        if end - offset != self.buildsize:
+            raise StreamError(f"built {end-offset} bytes, expected {self.buildsize}", path="(building)")
+        return self.buildsize
+
+    def _build(self, obj, stream, context, path):
+        return self.buildfunc(obj, stream, context)
+
+    def _sizeof(self, context, path):
+        return self.defersubcon._sizeof(context, path)
+
+    def compile(self, filename=None, cachedir=None, strict=False, records=False):
+        if strict and self.fallbacks:
+            raise ConstructError("compilation fell back to interpreted code", path=self.fallbacks[0][1])
+        return self
+
+    def benchmark(self, sampledata, filename=None):
+        return self.defersubcon.benchmark(sampledata, filename)
+
+    def _actualsize(self, stream, context, path):
+        return self.defersubcon._actualsize(stream, context, path)
+
+    @staticmethod
+    def link(source, modulename, c, linkedinstances, userfunction):
+        """Used internally. Executes code object (compiled generated source) in a new module, links into it the instances that generated code falls back to and user functions, and returns Compiled instance that the module made."""
+        module_spec = importlib.machinery.ModuleSpec(modulename, None)
+        module = importlib.util.module_from_spec(module_spec)
+        exec(c, module.__dict__)
+        module.linkedinstances = linkedinstances
+        module.linkedparsers = {linkid: sc._parse for linkid,sc in linkedinstances.items()}
+        module.linkedbuilders = {linkid: sc._build for linkid,sc in linkedinstances.items()}
+        module.userfunction = userfunction
+        compiled = module.compiled
+        compiled.source = source
+        compiled.code = c
+        compiled.module = module
+        compiled.modulename = modulename
+        return compiled
+
+    def __getstate__(self):
+        import marshal
+        attrs = super().__getstate__()
+        for name in ["module", "code", "parsefunc", "buildfunc", "parsebufferfunc", "buildbufferfunc"]:
+            attrs.pop(name, None)
+        attrs["linkedinstances"] = self.module.linkedinstances
+        attrs["userfunction"] = self.module.userfunction
+        attrs["bytecode"] = (CompileCache.tag(), marshal.dumps(self.code))
+        return attrs
+
+    def __setstate__(self, attrs):
+        import marshal
+        attrs = dict(attrs)
+        tag, bytecode = attrs.pop("bytecode")
+        c = marshal.loads(bytecode) if tag == CompileCache.tag() else compile(attrs["source"], '', 'exec')
+        compiled = Compiled.link(attrs["source"], attrs["modulename"], c, attrs.pop("linkedinstances"), attrs.pop("userfunction"))
+        super().__setstate__(compiled.__dict__)
+        super().__setstate__(attrs)
+        self.module.compiled = self
+
+
+class IncrementalParser(object):
+    r"""
+    Push-style parser of back-to-back records, for data that arrives in chunks (like from a non-blocking socket). Chunks are given to `feed` method, and complete records are taken out by iterating over the instance. Iteration stops when buffered data does not hold a complete record, and can be resumed after more data was fed.
+
+    Record size is determined up front if possible, either from sizeof (fixed-size constructs) or from the record header using `_actualsize` (like Prefixed and PrefixedArray), and nothing is parsed until that many bytes were fed. Otherwise records are parsed on trial, where StreamError means more data is needed, and next trial happens only after as much data was fed as the read that failed the trial tried to reach (terminated strings are read one unit at a time, so this never reaches into the next record). Compiled instances are parsed on trial using their original (not compiled) construct.
 
-    def _parse(self, stream, context, path):
-        return self.parsefunc(stream, context)
+    The context is created once and shared by all records. Consumed data is discarded from the buffer as parsing proceeds.
 
-    def _build(self, obj, stream, context, path):
-        return self.buildfunc(obj, stream, context)
+    :param subcon: Construct instance, parses a single record
+    :param \*\*contextkw: context entries, usually empty
 
-    def _sizeof(self, context, path):
-        return self.defersubcon._sizeof(context, path)
+    Example::
+
+        >>> p = IncrementalParser(Prefixed(Byte, GreedyBytes))
+        >>> p.feed(b"\x02a")
+        >>> list(p)
+        []
+        >>> p.feed(b"b\x01c")
+        >>> list(p)
+        [b'ab', b'c']
+    """
+
+    def __init__(self, subcon, **contextkw):
+        self.subcon = subcon
+        self.context = Container(**contextkw)
+        self.context._parsing = True
+        self.context._building = False
+        self.context._sizing = False
+        self.context._params = self.context
+        try:
+            self.size = subcon.sizeof(**contextkw)
+        except (SizeofError, KeyError, AttributeError):
+            self.size = None
+        self.stream = ProbingBytesIO(b"")
+        self.offset = 0
+        self.end = 0
+        self.needed = 1
+        self.recordsize = None
+
+    def feed(self, data):
+        r"""
+        Append a chunk of data to the buffer.
+        """
+        self.stream.seek(self.end)
+        self.stream.write(data)
+        self.end += len(data)
+
+    @property
+    def pending(self):
+        r"""
+        Amount of buffered bytes not consumed by parsed records.
+        """
+        return self.end - self.offset
 
-    def compile(self, filename=None):
+    def __iter__(self):
         return self
 
-    def benchmark(self, sampledata, filename=None):
-        return self.defersubcon.benchmark(sampledata, filename)
+    def __next__(self):
+        available = self.end - self.offset
+        if available < self.needed:
+            raise StopIteration
+        stream = self.stream
+        stream.seek(self.offset)
+        recordsize = self.size if self.size is not None else self.recordsize
+        stream.wanted = 0
+        if recordsize is None:
+            try:
+                recordsize = self.subcon._actualsize(stream, self.context, "(parsing)")
+            except StreamError:
+                self.needed = max(stream.wanted - self.offset, available + 1)
+                raise StopIteration
+            except (SizeofError, KeyError, AttributeError):
+                pass
+            stream.seek(self.offset)
+        if recordsize is not None:
+            if available < recordsize:
+                self.recordsize = recordsize
+                self.needed = recordsize
+                raise StopIteration
+            obj = self.subcon._parsereport(stream, self.context, "(parsing)")
+        else:
+            subcon = self.subcon.defersubcon if isinstance(self.subcon, Compiled) else self.subcon
+            try:
+                obj = subcon._parsereport(stream, self.context, "(parsing)")
+            except StreamError:
+                self.needed = max(stream.wanted - self.offset, available + 1)
+                raise StopIteration
+        self.offset = stream.tell()
+        self.needed = 1
+        self.recordsize = None
+        if self.offset == self.end:
+            self.stream = ProbingBytesIO(b"")
+            self.offset = self.end = 0
+        elif self.offset >= 65536 and self.offset*2 >= self.end:
+            self.stream = ProbingBytesIO(stream.read())
+            self.end -= self.offset
+            self.offset = 0
+        return obj
 
 
 #===============================================================================
@@ -985,6 +2272,11 @@ class Bytes(Construct):
     def _emitbuild(self, code):
         return f"(io.write(obj), obj)[1]"
 
+    def _emitformat(self, code):
+        if not isinstance(self.length, int) or self.length < 0:
+            raise NotImplementedError
+        return ("", f"{self.length}s", "{}", f"bytesvalue({{}}, {self.length})")
+
     def _emitfulltype(self, ksy, bitwise):
         return dict(size=self.length)
 
@@ -1027,6 +2319,7 @@ class GreedyBytes(Construct):
         return dict(size_eos=True)
 
 
+@picklablemacro
 def Bitwise(subcon):
     r"""
     Converts the stream from bytes to bits, and passes the bitstream to underlying subcon. Bitstream is a stream that contains 8 times as many bytes, and each byte is either \\x00 or \\x01 (in documentation those bytes are called bits).
@@ -1066,18 +2359,88 @@ def Bitwise(subcon):
         macro = Transformed(subcon, bytes2bits, size//8, bits2bytes, size//8)
     except SizeofError:
         macro = Restreamed(subcon, bytes2bits, 1, bits2bytes, 8, lambda n: n//8)
+    def _emitbitfields(code):
+        field = extractfield(subcon)
+        members = field.subcons if isinstance(field, Struct) else [subcon]
+        fields = [(sc, sc._emitbitformat(code)) for sc in members]
+        total = sum(length for sc,(length,decoder,encoder) in fields)
+        if not isinstance(macro, Transformed) or total % 8 or not total:
+            raise NotImplementedError
+        return isinstance(field, Struct), fields, total
+    def _emitparse(code):
+        isstruct, fields, total = _emitbitfields(code)
+        fname = f"parse_bitwise_{code.allocateId()}"
+        block = f"""
+            def {fname}(io, this):
+                data = io.read({total//8})
+                if len(data) != {total//8}:
+                    raise StreamError("stream read less than specified amount, expected %d, found %d" % ({total//8}, len(data)))
+                bits = int.from_bytes(data, 'big')
+        """
+        if isstruct:
+            block += f"""
+                result = Container()
+            """
+        offset = total
+        for sc,(length,decoder,encoder) in fields:
+            offset -= length
+            value = decoder.replace("{}", f"((bits >> {offset}) & {(1<<length)-1})") if decoder is not None else "None"
+            if not isstruct:
+                block += f"""
+                return {value}
+                """
+            elif sc.name:
+                block += f"""
+                result[{repr(sc.name)}] = {value}
+                """
+        if isstruct:
+            block += f"""
+                return result
+            """
+        code.append(block)
+        return f"{fname}(io, this)"
+    def _emitbuild(code):
+        isstruct, fields, total = _emitbitfields(code)
+        fname = f"build_bitwise_{code.allocateId()}"
+        block = f"""
+            def {fname}(obj, io, this):
+                bits = 0
+        """
+        offset = total
+        for sc,(length,decoder,encoder) in fields:
+            offset -= length
+            if encoder is None:
+                continue
+            if not isstruct:
+                value = "obj"
+            elif sc.flagbuildnone:
+                value = f"obj.get({repr(sc.name)}, None)"
+            else:
+                value = f"obj[{repr(sc.name)}]"
+            block += f"""
+                bits |= (({encoder.replace("{}", value)}) & {(1<<length)-1}) << {offset}
+            """
+        block += f"""
+                io.write(bits.to_bytes({total//8}, 'big'))
+                return obj
+        """
+        code.append(block)
+        return f"{fname}(obj, io, this)"
     def _emitseq(ksy, bitwise):
         return subcon._compileseq(ksy, bitwise=True)
     def _emitprimitivetype(ksy, bitwise):
         return subcon._compileprimitivetype(ksy, bitwise=True)
     def _emitfulltype(ksy, bitwise):
         return subcon._compilefulltype(ksy, bitwise=True)
+    macro._emitparse = _emitparse
+    macro._emitbuild = _emitbuild
     macro._emitseq = _emitseq
     macro._emitprimitivetype = _emitprimitivetype
     macro._emitfulltype = _emitfulltype
     return macro
 
 
+@picklablemacro
 def Bytewise(subcon):
     r"""
     Converts the bitstream back to normal byte stream. Must be used within :class:`~construct.core.Bitwise`.
@@ -1184,6 +2547,14 @@ class FormatField(Construct):
         code.append(f"{fname} = struct.Struct({repr(self.fmtstr)})")
         return f"(io.write({fname}.pack(obj)), obj)[1]"
 
+    def _emitformat(self, code):
+        endianity,format = self.fmtstr
+        if endianity == "=":
+            endianity = "<" if sys.byteorder == "little" else ">"
+        if format in "bB?":
+            endianity = ""
+        return (endianity, format, "{}", "{}")
+
     def _emitprimitivetype(self, ksy, bitwise):
         endianity,format = self.fmtstr
         signed = format.islower()
@@ -1280,7 +2651,18 @@ class BytesInteger(Construct):
         return f"bytes2integer(swapbytes(io.read({self.length})) if {self.swapped} else io.read({self.length}), {self.signed})"
 
     def _emitbuild(self, code):
-        return f"((io.write(swapbytes(integer2bytes(obj, {self.length}, {self.signed})) if ({self.swapped}) else integer2bytes(obj, {self.length}, {self.signed}))), obj)[1]"
+        return f"((io.write(swapbytes(integer2bytes(bytesinteger(obj, {self.length}, {self.signed}), {self.length}, {self.signed})) if ({self.swapped}) else integer2bytes(bytesinteger(obj, {self.length}, {self.signed}), {self.length}, {self.signed}))), obj)[1]"
+
+    def _emitformat(self, code):
+        if not isinstance(self.length, int) or not isinstance(self.swapped, bool) or self.length <= 0:
+            raise NotImplementedError
+        byteorder = "<" if self.swapped else ">"
+        if self.length in (1,2,4,8):
+            format = {1:"b", 2:"h", 4:"i", 8:"q"}[self.length]
+            format = format if self.signed else format.upper()
+            return ("" if self.length == 1 else byteorder, format, "{}", f"bytesinteger({{}}, {self.length}, {self.signed})")
+        order = "little" if self.swapped else "big"
+        return ("", f"{self.length}s", f"int.from_bytes({{}}, {repr(order)}, signed={self.signed})", f"int.to_bytes(bytesinteger({{}}, {self.length}, {self.signed}), {self.length}, {repr(order)}, signed={self.signed})")
 
     def _emitprimitivetype(self, ksy, bitwise):
         if bitwise:
@@ -1400,6 +2782,21 @@ class BitsInteger(Construct):
     def _emitbuild(self, code):
         return f"((io.write(swapbytesinbits(integer2bits(obj, {self.length}, {self.signed})) if ({self.swapped}) else integer2bits(obj, {self.length}, {self.signed}))), obj)[1]"
 
+    def _emitbitformat(self, code):
+        if not isinstance(self.length, int) or not isinstance(self.swapped, bool) or self.length <= 0:
+            raise NotImplementedError
+        if self.swapped and self.length % 8:
+            raise NotImplementedError
+        decoder = "{}"
+        encoder = f"bitsinteger({{}}, {self.length}, {self.signed})"
+        if self.swapped:
+            decoder = f"int.from_bytes(({{}}).to_bytes({self.length//8}, 'big'), 'little')"
+            encoder = f"int.from_bytes(({encoder}).to_bytes({self.length//8}, 'big'), 'little')"
+        if self.signed:
+            half = 1 << (self.length-1)
+            decoder = f"(({decoder}) ^ {half}) - {half}"
+        return (self.length, decoder, encoder)
+
     def _emitprimitivetype(self, ksy, bitwise):
         assert not self.signed
         assert not self.swapped
@@ -1643,6 +3040,65 @@ class VarInt(Construct):
         stream_write(stream, bytes(B), len(B), path)
         return obj
 
+    def _emitparse(self, code):
+        code.append("""
+            def parse_varint(io):
+                seekable = getattr(io, 'seekable', None)
+                step = 16 if seekable is None or seekable() else 1
+                num = 0
+                shift = 0
+                while True:
+                    data = io.read(step)
+                    if not data:
+                        raise StreamError("stream read less than specified amount, expected 1, found 0")
+                    for i,b in enumerate(data):
+                        num |= (b & 127) << shift
+                        shift += 7
+                        if b < 128:
+                            if i+1 < len(data):
+                                io.seek(i+1-len(data), 1)
+                            return num
+        """)
+        return "parse_varint(io)"
+
+    def _emitparsebuffer(self, code):
+        code.append("""
+            def parse_varint_buffer(buf, pos):
+                num = 0
+                shift = 0
+                while True:
+                    try:
+                        b = buf[pos]
+                    except IndexError:
+                        raise StreamError("stream read less than specified amount, expected 1, found 0")
+                    pos += 1
+                    num |= (b & 127) << shift
+                    shift += 7
+                    if b < 128:
+                        return num, pos
+        """)
+        return "parse_varint_buffer(buf, pos)"
+
+    def _emitbuild(self, code):
+        code.append("""
+            def build_varint(obj, io):
+                if not isinstance(obj, int):
+                    raise IntegerError(f"value {obj} is not an integer")
+                if obj < 0:
+                    raise IntegerError(f"VarInt cannot build from negative number {obj}")
+                x = obj
+                B = bytearray((x.bit_length()+6)//7 or 1)
+                i = 0
+                while x > 127:
+                    B[i] = 128 | (x & 127)
+                    x >>= 7
+                    i += 1
+                B[i] = x
+                io.write(B)
+                return obj
+        """)
+        return "build_varint(obj, io)"
+
     def _emitprimitivetype(self, ksy, bitwise):
         return "vlq_base128_le"
 
@@ -1685,6 +3141,33 @@ class ZigZag(Construct):
         VarInt._build(x, stream, context, path)
         return obj
 
+    def _emitparse(self, code):
+        code.append("""
+            def decode_zigzag(x):
+                return (x >> 1) ^ -(x & 1)
+        """)
+        return f"decode_zigzag({VarInt._compileparse(code)})"
+
+    def _emitparsebuffer(self, code):
+        code.append("""
+            def parse_zigzag_buffer(buf, pos):
+                x, pos = parse_varint_buffer(buf, pos)
+                return (x >> 1) ^ -(x & 1), pos
+        """)
+        VarInt._compileparsebuffer(code)
+        return "parse_zigzag_buffer(buf, pos)"
+
+    def _emitbuild(self, code):
+        VarInt._compilebuild(code)
+        code.append("""
+            def build_zigzag(obj, io):
+                if not isinstance(obj, int):
+                    raise IntegerError(f"value {obj} is not an integer")
+                build_varint(2*obj if obj >= 0 else -2*obj-1, io)
+                return obj
+        """)
+        return "build_zigzag(obj, io)"
+
 
 #===============================================================================
 # strings
@@ -1744,6 +3227,7 @@ class StringEncoded(Adapter):
         # return f"({self.subcon._compilebuild(code)}).encode({repr(self.encoding)})"
 
 
+@picklablemacro
 def PaddedString(length, encoding):
     r"""
     Configurable, fixed-length or variable-length string field.
@@ -1775,6 +3259,7 @@ def PaddedString(length, encoding):
     return macro
 
 
+@picklablemacro
 def PascalString(lengthfield, encoding):
     r"""
     Length-prefixed string. The length field can be variable length (such as VarInt) or fixed length (such as Int64ub). :class:`~construct.core.VarInt` is recommended when designing new protocols. Stored length is in bytes, not characters. Size is not defined.
@@ -1808,6 +3293,7 @@ def PascalString(lengthfield, encoding):
     return macro
 
 
+@picklablemacro
 def CString(encoding):
     r"""
     String ending in a terminating null byte (or null bytes in case of UTF16 UTF32).
@@ -1828,12 +3314,18 @@ def CString(encoding):
         u'Афон'
     """
     macro = StringEncoded(NullTerminated(GreedyBytes, term=encodingunit(encoding)), encoding)
+
+    def _emitparse(code):
+        return f"({macro.subcon._compileparse(code)}).decode({repr(encoding)})"
+    macro._emitparse = _emitparse
+
     def _emitfulltype(ksy, bitwise):
         return dict(type="strz", encoding=encoding)
     macro._emitfulltype = _emitfulltype
     return macro
 
 
+@picklablemacro
 def GreedyString(encoding):
     r"""
     String that reads entire stream until EOF, and writes a given string as-is. Analog to :class:`~construct.core.GreedyBytes` but also applies unicode-to-bytes encoding.
@@ -1892,6 +3384,9 @@ class Flag(Construct):
     def _emitbuild(self, code):
         return f"((io.write(b'\\x01') if obj else io.write(b'\\x00')), obj)[1]"
 
+    def _emitbitformat(self, code):
+        return (1, "({} == 1)", "(1 if {} else 0)")
+
     def _emitfulltype(self, ksy, bitwise):
         return dict(type=("b1" if bitwise else "u1"), _construct_render="Flag")
 
@@ -2276,18 +3771,22 @@ class Struct(Construct):
             raise SizeofError("cannot calculate size, key not found in context", path=path)
 
     def _emitparse(self, code):
+        record = self._emitrecord(code)
+        elided = contextfree(self)
         fname = f"parse_struct_{code.allocateId()}"
         block = f"""
             def {fname}(io, this):
-                result = Container()
+                result = {record or 'Container'}()
+        """
+        if not elided:
+            block += f"""
                 this = Container(_ = this, _params = this['_params'], _root = None, _parsing = True, _building = False, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
                 this['_root'] = this['_'].get('_root', this)
+            """
+        block += f"""
                 try:
         """
-        for sc in self.subcons:
-            block += f"""
-                    {f'result[{repr(sc.name)}] = this[{repr(sc.name)}] = ' if sc.name else ''}{sc._compileparse(code)}
-            """
+        block += self._emitparsemembers(code, False, record, elided)
         block += f"""
                     pass
                 except StopFieldError:
@@ -2297,30 +3796,190 @@ class Struct(Construct):
         code.append(block)
         return f"{fname}(io, this)"
 
+    def _emitparsebuffer(self, code):
+        record = self._emitrecord(code)
+        elided = contextfree(self)
+        fname = f"parse_struct_buffer_{code.allocateId()}"
+        block = f"""
+            def {fname}(buf, pos, io, this):
+                result = {record or 'Container'}()
+        """
+        if not elided:
+            block += f"""
+                this = Container(_ = this, _params = this['_params'], _root = None, _parsing = True, _building = False, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+                this['_root'] = this['_'].get('_root', this)
+            """
+        block += f"""
+                try:
+        """
+        block += self._emitparsemembers(code, True, record, elided)
+        block += f"""
+                    pass
+                except StopFieldError:
+                    pass
+                return result, pos
+        """
+        code.append(block)
+        return f"{fname}(buf, pos, io, this)"
+
+    def _emitrecord(self, code):
+        """Used internally. When compiling with records, declares a Record subclass with member names as __slots__ and returns its name, otherwise returns None."""
+        if not code.records:
+            return None
+        if id(self) in code.recordcache:
+            return code.recordcache[id(self)]
+        names = []
+        for sc in self.subcons:
+            if sc.name and sc.name not in names:
+                names.append(sc.name)
+        record = None
+        if all(isinstance(n, str) and n.isidentifier() and not keyword.iskeyword(n) and not n.startswith("__") and not hasattr(Record, n) for n in names):
+            record = f"Record_{code.allocateId()}"
+            code.append(f"""
+                class {record}(Record):
+                    __slots__ = {repr(tuple(names))}
+            """)
+        code.recordcache[id(self)] = record
+        return record
+
+    def _emitparsemembers(self, code, buffered, record=None, elided=False):
+        """Used internally. Emits statements that parse all members, either from `io` stream or from `buf` buffer at `pos` cursor, into a Container or record. When elided, members are not inserted into the context."""
+        def target(name):
+            return (f"result.{name}" if record else f"result[{repr(name)}]") + ("" if elided else f" = this[{repr(name)}]")
+        block = ""
+        for group in fusedformats(self.subcons, code, 1 if buffered else 2):
+            if isinstance(group, list):
+                fused, size = fusedstruct(group, code)
+                if buffered:
+                    block += f"""
+                    fused = {fused}.unpack_from(buf, pos)
+                    pos += {size}
+                    """
+                else:
+                    block += f"""
+                    fused = {fused}.unpack(io.read({size}))
+                    """
+                index = 0
+                for sc,(byteorder,format,decoder,encoder) in group:
+                    value = "None"
+                    if not format.endswith("x"):
+                        if decoder is not None:
+                            value = decoder.replace("{}", f"fused[{index}]")
+                        index += 1
+                    if sc.name:
+                        block += f"""
+                    {target(sc.name)} = {value}
+                        """
+                continue
+            sc = group
+            if not buffered:
+                block += f"""
+                    {f'{target(sc.name)} = ' if sc.name else ''}{sc._compileparse(code)}
+                """
+                continue
+            try:
+                block += f"""
+                    value, pos = {sc._compileparsebuffer(code)}
+                """
+            except NotImplementedError:
+                code.bufferfallback = True
+                block += f"""
+                    io.seek(pos)
+                    value = {sc._compileparse(code)}
+                    pos = io.tell()
+                """
+            if sc.name:
+                block += f"""
+                    {target(sc.name)} = value
+                """
+        return block
+
     def _emitbuild(self, code):
+        elided = contextfree(self)
         fname = f"build_struct_{code.allocateId()}"
         block = f"""
             def {fname}(obj, io, this):
+        """
+        block += self._emitbuildmembers(code, False, elided)
+        block += f"""
+                return {'result' if elided else 'this'}
+        """
+        code.append(block)
+        return f"{fname}(obj, io, this)"
+
+    def _emitbuildbuffer(self, code):
+        elided = contextfree(self)
+        fname = f"build_struct_buffer_{code.allocateId()}"
+        block = f"""
+            def {fname}(obj, buf, pos, io, this):
+        """
+        block += self._emitbuildmembers(code, True, elided)
+        block += f"""
+                return {'result' if elided else 'this'}, pos
+        """
+        code.append(block)
+        return f"{fname}(obj, buf, pos, io, this)"
+
+    def _emitbuildmembers(self, code, buffered, elided):
+        """Used internally. Emits statements that build all members, either into `io` stream or into `buf` buffer at `pos` cursor. Raises NotImplementedError if buffered and some member cannot build into a buffer."""
+        context = "result" if elided else "this"
+        if elided:
+            block = f"""
+                result = Container(obj)
+            """
+        else:
+            block = f"""
                 this = Container(_ = this, _params = this['_params'], _root = None, _parsing = False, _building = True, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
                 this['_root'] = this['_'].get('_root', this)
                 this.update(obj)
+            """
+        block += f"""
                 try:
                     objdict = obj
         """
-        for sc in self.subcons:
+        for group in fusedformats(self.subcons, code, 1 if buffered else 2):
+            if isinstance(group, list):
+                fused, size = fusedstruct(group, code)
+                values = []
+                for sc,(byteorder,format,decoder,encoder) in group:
+                    value = f'objdict.get({repr(sc.name)}, None)' if sc.flagbuildnone else f'objdict[{repr(sc.name)}]'
+                    if sc.name:
+                        block += f"""
+                    {context}[{repr(sc.name)}] = {value}
+                        """
+                        value = f"{context}[{repr(sc.name)}]"
+                    if encoder is not None:
+                        values.append(encoder.replace("{}", value))
+                if buffered:
+                    block += f"""
+                    {fused}.pack_into(buf, pos, {', '.join(values)})
+                    pos += {size}
+                    """
+                else:
+                    block += f"""
+                    io.write({fused}.pack({', '.join(values)}))
+                    """
+                continue
+            sc = group
             block += f"""
                     {f'obj = objdict.get({repr(sc.name)}, None)' if sc.flagbuildnone else f'obj = objdict[{repr(sc.name)}]'}
-                    {f'this[{repr(sc.name)}] = obj' if sc.name else ''}
-                    {f'this[{repr(sc.name)}] = ' if sc.name else ''}{sc._compilebuild(code)}
+                    {f'{context}[{repr(sc.name)}] = obj' if sc.name and not elided else ''}
             """
+            if buffered:
+                block += f"""
+                    value, pos = {sc._compilebuildbuffer(code)}
+                    {f'{context}[{repr(sc.name)}] = value' if sc.name else ''}
+                """
+            else:
+                block += f"""
+                    {f'{context}[{repr(sc.name)}] = ' if sc.name else ''}{sc._compilebuild(code)}
+                """
         block += f"""
                     pass
                 except StopFieldError:
                     pass
-                return this
         """
-        code.append(block)
-        return f"{fname}(obj, io, this)"
+        return block
 
     def _emitseq(self, ksy, bitwise):
         return [sc._compilefulltype(ksy, bitwise) for sc in self.subcons]
@@ -2558,9 +4217,50 @@ class Array(Subconstruct):
         return count * self.subcon._sizeof(context, path)
 
     def _emitparse(self, code):
+        try:
+            return emitformatarrayparse(self.subcon, self.count, code)
+        except NotImplementedError:
+            pass
         return f"ListContainer(({self.subcon._compileparse(code)}) for i in range({self.count}))"
 
+    def _emitparsebuffer(self, code):
+        return emitformatarrayparse(self.subcon, self.count, code, buffered=True)
+
+    def _emitbuildbuffer(self, code):
+        if not isinstance(self.count, int):
+            raise NotImplementedError
+        try:
+            fmt, size = formatarray(self.subcon, self.count, code, building=True)
+            fname = f"build_formatarray_buffer_{code.allocateId()}"
+            code.append(f"""
+                formatarray_{fname} = struct.Struct({repr(fmt)})
+                def {fname}(obj, buf, pos):
+                    if len(obj) != {self.count}:
+                        raise RangeError("expected %d elements, found %d" % ({self.count}, len(obj)))
+                    formatarray_{fname}.pack_into(buf, pos, *obj)
+                    return ListContainer(obj), pos+{self.count*size}
+            """)
+            return f"{fname}(obj, buf, pos)"
+        except NotImplementedError:
+            pass
+        fname = f"build_array_buffer_{code.allocateId()}"
+        code.append(f"""
+            def {fname}(objlist, buf, pos, io, this):
+                if not len(objlist) == {self.count}:
+                    raise RangeError("expected %d elements, found %d" % ({self.count}, len(objlist)))
+                retlist = ListContainer()
+                for obj in objlist:
+                    buildret, pos = {self.subcon._compilebuildbuffer(code)}
+                    retlist.append(buildret)
+                return retlist, pos
+        """)
+        return f"{fname}(obj, buf, pos, io, this)"
+
     def _emitbuild(self, code):
+        try:
+            return emitformatarraybuild(self.subcon, self.count, code)
+        except NotImplementedError:
+            pass
         return f"ListContainer(reuse(obj[i], lambda obj: ({self.subcon._compilebuild(code)})) for i in range({self.count}))"
 
     def _emitfulltype(self, ksy, bitwise):
@@ -2781,10 +4481,32 @@ class Renamed(Subconstruct):
         return self.subcon._sizeof(context, path)
 
     def _emitparse(self, code):
-        return self.subcon._compileparse(code)
+        path = code.path
+        code.path += f" -> {self.name}"
+        try:
+            return self.subcon._compileparse(code)
+        finally:
+            code.path = path
 
     def _emitbuild(self, code):
-        return self.subcon._compilebuild(code)
+        path = code.path
+        code.path += f" -> {self.name}"
+        try:
+            return self.subcon._compilebuild(code)
+        finally:
+            code.path = path
+
+    def _emitparsebuffer(self, code):
+        return self.subcon._compileparsebuffer(code)
+
+    def _emitbuildbuffer(self, code):
+        return self.subcon._compilebuildbuffer(code)
+
+    def _emitformat(self, code):
+        return self.subcon._emitformat(code)
+
+    def _emitbitformat(self, code):
+        return self.subcon._emitbitformat(code)
 
     def _emitseq(self, ksy, bitwise):
         return self.subcon._compileseq(ksy, bitwise)
@@ -2870,6 +4592,13 @@ class Const(Subconstruct):
         else:
             return f"reuse({repr(self.value)}, lambda obj: {self.subcon._compilebuild(code)})"
 
+    def _emitbuildbuffer(self, code):
+        if not isinstance(self.value, bytes):
+            raise NotImplementedError
+        fname = f"formatfield_{code.allocateId()}"
+        code.append(f"{fname} = struct.Struct({repr(f'{len(self.value)}s')})")
+        return f"({fname}.pack_into(buf, pos, {repr(self.value)}), ({repr(self.value)}, pos+{len(self.value)}))[1]"
+
     def _emitfulltype(self, ksy, bitwise):
         data = self.subcon.build(self.value)
         return dict(contents=list(data))
@@ -2929,6 +4658,9 @@ class Computed(Construct):
     def _emitbuild(self, code):
         return repr(self.func)
 
+    def _emitbuildbuffer(self, code):
+        return f"({repr(self.func)}, pos)"
+
 
 @singleton
 class Index(Construct):
@@ -3450,6 +5182,7 @@ class TimestampAdapter(Adapter):
     """Used internally."""
 
 
+@picklablemacro
 def Timestamp(subcon, unit, epoch):
     r"""
     Datetime, represented as `Arrow <https://pypi.org/project/arrow/>`_ object.
@@ -3909,6 +5642,7 @@ def Optional(subcon):
     return Select(subcon, Pass)
 
 
+@picklablemacro
 def If(condfunc, subcon):
     r"""
     If-then conditional construct.
@@ -4133,6 +5867,7 @@ class StopIf(Construct):
 #===============================================================================
 # alignment and padding
 #===============================================================================
+@picklablemacro
 def Padding(length, pattern=b"\x00"):
     r"""
     Appends null bytes.
@@ -4254,6 +5989,22 @@ class Padded(Subconstruct):
     def _emitbuild(self, code):
         return f"({self.subcon._compilebuild(code)}, io.write({repr(self.pattern)}*(({self.length})-({self.subcon.sizeof()})) ))[0]"
 
+    def _emitbitformat(self, code):
+        if self.subcon is not Pass or not isinstance(self.length, int) or self.length <= 0:
+            raise NotImplementedError
+        if self.pattern == b"\x00":
+            return (self.length, None, None)
+        if self.pattern == b"\x01":
+            return (self.length, None, repr((1 << self.length) - 1))
+        raise NotImplementedError
+
+    def _emitformat(self, code):
+        if self.subcon is not Pass or not isinstance(self.length, int) or self.length < 0:
+            raise NotImplementedError
+        if self.pattern == b"\x00":
+            return ("", f"{self.length}x", None, None)
+        return ("", f"{self.length}s", None, repr(self.pattern * self.length))
+
     def _emitfulltype(self, ksy, bitwise):
         return dict(size=self.length, type=self.subcon._compileprimitivetype(ksy, bitwise))
 
@@ -4878,9 +6629,9 @@ class Prefixed(Subconstruct):
         return self.subcon._parsereport(substream, context, path)
 
     def _build(self, obj, stream, context, path):
-        stream2 = io.BytesIO()
+        stream2 = stream_buildbuffer(stream)
         buildret = self.subcon._build(obj, stream2, context, path)
-        data = stream2.getvalue()
+        data = stream_buildvalue(stream2)
         length = len(data)
         if self.includelength:
             length += self.lengthfield._sizeof(context, path)
@@ -4901,7 +6652,24 @@ class Prefixed(Subconstruct):
 
     def _emitparse(self, code):
         sub = self.lengthfield.sizeof() if self.includelength else 0
-        return f"restream(io.read(({self.lengthfield._compileparse(code)})-({sub})), lambda io: ({self.subcon._compileparse(code)}))"
+        return f"substream(io, ({self.lengthfield._compileparse(code)})-({sub}), lambda io: ({self.subcon._compileparse(code)}))"
+
+    def _emitbuild(self, code):
+        fname = f"build_prefixed_{code.allocateId()}"
+        sub = self.lengthfield.sizeof() if self.includelength else 0
+        block = f"""
+            def {fname}(obj, io, this):
+                outer, io = io, stream_buildbuffer(io)
+                obj = {self.subcon._compilebuild(code)}
+                data = stream_buildvalue(io)
+                io = outer
+                buildret, obj = obj, len(data) + ({sub})
+                {self.lengthfield._compilebuild(code)}
+                stream_write(io, data, len(data), "(building)")
+                return buildret
+        """
+        code.append(block)
+        return f"{fname}(obj, io, this)"
 
     def _emitseq(self, ksy, bitwise):
         return [
@@ -4910,6 +6678,7 @@ class Prefixed(Subconstruct):
         ]
 
 
+@picklablemacro
 def PrefixedArray(countfield, subcon):
     r"""
     Prefixes an array with item count (as opposed to prefixed by byte count, see :class:`~construct.core.Prefixed`).
@@ -4938,14 +6707,22 @@ def PrefixedArray(countfield, subcon):
     )
 
     def _emitparse(code):
+        try:
+            return emitformatarrayparse(subcon, countfield._compileparse(code), code)
+        except NotImplementedError:
+            pass
         return "ListContainer((%s) for i in range(%s))" % (subcon._compileparse(code), countfield._compileparse(code), )
     macro._emitparse = _emitparse
 
     def _emitbuild(code):
+        try:
+            return f"(reuse(len(obj), lambda obj: {countfield._compilebuild(code)}), {emitformatarraybuild(subcon, 'len(obj)', code)}, obj)[2]"
+        except NotImplementedError:
+            pass
         return f"(reuse(len(obj), lambda obj: {countfield._compilebuild(code)}), list({subcon._compilebuild(code)} for obj in obj), obj)[2]"
     macro._emitbuild = _emitbuild
 
-    def _actualsize(self, stream, context, path):
+    def _actualsize(stream, context, path):
         position1 = stream_tell(stream, path)
         count = countfield._parse(stream, context, path)
         position2 = stream_tell(stream, path)
@@ -5003,9 +6780,9 @@ class FixedSized(Subconstruct):
         length = evaluate(self.length, context)
         if length < 0:
             raise PaddingError("length cannot be negative", path=path)
-        stream2 = io.BytesIO()
+        stream2 = stream_buildbuffer(stream)
         buildret = self.subcon._build(obj, stream2, context, path)
-        data = stream2.getvalue()
+        data = stream_buildvalue(stream2)
         pad = length - len(data)
         if pad < 0:
             raise PaddingError("subcon build %d bytes but was allowed only %d" % (len(data), length), path=path)
@@ -5020,7 +6797,7 @@ class FixedSized(Subconstruct):
         return length
 
     def _emitparse(self, code):
-        return f"restream(io.read({self.length}), lambda io: ({self.subcon._compileparse(code)}))"
+        return f"substream(io, {self.length}, lambda io: ({self.subcon._compileparse(code)}))"
 
     def _emitfulltype(self, ksy, bitwise):
         return dict(size=repr(self.length).replace("this.",""), **self.subcon._compilefulltype(ksy, bitwise))
@@ -5065,23 +6842,8 @@ class NullTerminated(Subconstruct):
         unit = len(term)
         if unit < 1:
             raise PaddingError("NullTerminated term must be at least 1 byte", path=path)
-        data = b''
         offset = stream_tell(stream, path)
-        while True:
-            try:
-                b = stream_read(stream, unit, path)
-            except StreamError:
-                if self.require:
-                    raise
-                else:
-                    break
-            if b == term:
-                if self.include:
-                    data += b
-                if not self.consume:
-                    stream_seek(stream, -unit, 1, path)
-                break
-            data += b
+        data = stream_read_terminated(stream, term, self.include, self.consume, self.require, path)
         substream = BytesIOWithOffsets(data, stream, offset)
         return self.subcon._parsereport(substream, context, path)
 
@@ -5093,6 +6855,17 @@ class NullTerminated(Subconstruct):
     def _sizeof(self, context, path):
         raise SizeofError(path=path)
 
+    def _emitparse(self, code):
+        if len(self.term) < 1:
+            raise NotImplementedError
+        data = f"stream_read_terminated(io, {repr(self.term)}, {self.include}, {self.consume}, {self.require}, '(parsing)')"
+        if self.subcon is GreedyBytes:
+            return data
+        return f"restream({data}, lambda io: ({self.subcon._compileparse(code)}))"
+
+    def _emitbuild(self, code):
+        return f"({self.subcon._compilebuild(code)}, io.write({repr(self.term)}))[0]"
+
     def _emitfulltype(self, ksy, bitwise):
         if len(self.term) > 1:
             raise NotImplementedError
@@ -5588,6 +7361,7 @@ class Compressed(Tunnel):
     :param subcon: Construct instance, subcon used for storing the value
     :param encoding: string, any of module names like zlib/gzip/bzip2/lzma, otherwise any of codecs module bytes<->bytes encodings, each codec usually requires some Python version
     :param level: optional, integer between 0..9, although lzma discards it, some encoders allow different compression levels
+    :param streaming: optional, bool, subcon reads decompressed data on demand and writes data compressed on the fly, instead of entire data being decompressed or compressed in memory at once, note that the subcon cannot seek
 
     :raises ImportError: needed module could not be imported by ctor
     :raises StreamError: stream failed when reading until EOF
@@ -5601,10 +7375,11 @@ class Compressed(Tunnel):
         13
    """
 
-    def __init__(self, subcon, encoding, level=None):
+    def __init__(self, subcon, encoding, level=None, streaming=False):
         super().__init__(subcon)
         self.encoding = encoding
         self.level = level
+        self.streaming = streaming
         if self.encoding == "zlib":
             import zlib
             self.lib = zlib
@@ -5634,6 +7409,35 @@ class Compressed(Tunnel):
                 return self.lib.compress(data, self.level)
         return self.lib.encode(data, self.encoding)
 
+    def _decoder(self, context, path):
+        if self.encoding in ("zlib", "gzip"):
+            import zlib
+            decompressor = zlib.decompressobj(zlib.MAX_WBITS|16 if self.encoding == "gzip" else zlib.MAX_WBITS)
+        elif self.encoding in ("bzip2", "lzma"):
+            decompressor = self.lib.BZ2Decompressor() if self.encoding == "bzip2" else self.lib.LZMADecompressor()
+        else:
+            decoder = self.lib.getincrementaldecoder(self.encoding)()
+            return decoder.decode, lambda: decoder.decode(b"", True)
+        def flush():
+            if not decompressor.eof:
+                raise StreamError("compressed data ended before end of stream marker", path=path)
+            return decompressor.flush() if hasattr(decompressor, "flush") else b""
+        return decompressor.decompress, flush
+
+    def _encoder(self, context, path):
+        level = 9 if self.level is None else self.level
+        if self.encoding in ("zlib", "gzip"):
+            import zlib
+            compressor = zlib.compressobj(-1 if self.level is None and self.encoding == "zlib" else level, zlib.DEFLATED, zlib.MAX_WBITS|16 if self.encoding == "gzip" else zlib.MAX_WBITS)
+        elif self.encoding == "bzip2":
+            compressor = self.lib.BZ2Compressor(level)
+        elif self.encoding == "lzma":
+            compressor = self.lib.LZMACompressor()
+        else:
+            encoder = self.lib.getincrementalencoder(self.encoding)()
+            return encoder.encode, lambda: encoder.encode(b"", True)
+        return compressor.compress, compressor.flush
+
 
 class CompressedLZ4(Tunnel):
     r"""
@@ -5642,6 +7446,7 @@ class CompressedLZ4(Tunnel):
     Parsing and building transforms all bytes using LZ4 library. Since data is processed until EOF, it behaves similar to `GreedyBytes`. Size is undefined.
 
     :param subcon: Construct instance, subcon used for storing the value
+    :param streaming: optional, bool, subcon reads decompressed data on demand and writes data compressed on the fly, instead of entire data being decompressed or compressed in memory at once, note that the subcon cannot seek
 
     :raises ImportError: needed module could not be imported by ctor
     :raises StreamError: stream failed when reading until EOF
@@ -5657,10 +7462,11 @@ class CompressedLZ4(Tunnel):
         35
    """
 
-    def __init__(self, subcon):
+    def __init__(self, subcon, streaming=False):
         super().__init__(subcon)
         import lz4.frame
         self.lib = lz4.frame
+        self.streaming = streaming
 
     def _decode(self, data, context, path):
         return self.lib.decompress(data)
@@ -5668,6 +7474,23 @@ class CompressedLZ4(Tunnel):
     def _encode(self, data, context, path):
         return self.lib.compress(data)
 
+    def _decoder(self, context, path):
+        decompressor = self.lib.LZ4FrameDecompressor()
+        def flush():
+            if not decompressor.eof:
+                raise StreamError("compressed data ended before end of frame", path=path)
+            return b""
+        return decompressor.decompress, flush
+
+    def _encoder(self, context, path):
+        compressor = self.lib.LZ4FrameCompressor()
+        header = [compressor.begin()]
+        def encode(data):
+            return (header.pop() if header else b"") + compressor.compress(data)
+        def flush():
+            return (header.pop() if header else b"") + compressor.flush()
+        return encode, flush
+
 
 class EncryptedSym(Tunnel):
     r"""
@@ -5875,7 +7698,7 @@ class Lazy(Subconstruct):
 
     This wrapper allows you to do lazy parsing of individual fields inside a normal Struct (without using LazyStruct which may not work in every scenario). It is also used by KaitaiStruct compiler to emit `instances` because those are not processed greedily, and they may refer to other not yet parsed fields. Those are 2 entirely different applications but semantics are the same.
 
-    Parsing saves the current stream offset and returns a lambda. If and when that lambda gets evaluated, it seeks the stream to then-current position, parses the subcon, and seeks the stream back to previous position. Building evaluates that lambda into an object (if needed), then defers to subcon. Size also defers to subcon.
+    Parsing saves the current stream offset and returns a lambda. If and when that lambda gets evaluated, it parses the subcon from a new stream positioned at saved offset, that reads same data as the stream (in-memory streams and mmaps are not copied, files opened for reading only are read using os.pread), so the stream position is not used. Lambdas can therefore be evaluated concurrently from multiple threads. Other streams are seeked to saved offset, parsed from, and seeked back to previous position, while holding a lock. Building evaluates that lambda into an object (if needed), then defers to subcon. Size also defers to subcon.
 
     :param subcon: Construct instance
 
@@ -5903,14 +7726,18 @@ class Lazy(Subconstruct):
 
     def _parse(self, stream, context, path):
         offset = stream_tell(stream, path)
+        positioned = stream_positional(stream, path)
         def execute():
-            fallback = stream_tell(stream, path)
-            stream_seek(stream, offset, 0, path)
-            obj = self.subcon._parsereport(stream, context, path)
-            stream_seek(stream, fallback, 0, path)
-            return obj
+            if positioned is not None:
+                return self.subcon._parsereport(positioned(offset), context, path)
+            with lazy_lock:
+                fallback = stream_tell(stream, path)
+                stream_seek(stream, offset, 0, path)
+                obj = self.subcon._parsereport(stream, context, path)
+                stream_seek(stream, fallback, 0, path)
+                return obj
         len = self.subcon._actualsize(stream, context, path)
-        stream_seek(stream, len, 1, path)
+        stream_seek(stream, offset + len, 0, path)
         return execute
 
     def _build(self, obj, stream, context, path):
@@ -5929,6 +7756,7 @@ class LazyContainer(dict):
         self._values = values
         self._context = context
         self._path = path
+        self._positioned = stream_positional(stream, path)
 
     def __getattr__(self, name):
         if name in self._struct._subconsindexes:
@@ -5940,8 +7768,12 @@ class LazyContainer(dict):
             index = self._struct._subconsindexes[index] # KeyError
         if index in self._values:
             return self._values[index]
-        stream_seek(self._stream, self._offsets[index], 0, self._path) # KeyError
-        parseret = self._struct.subcons[index]._parsereport(self._stream, self._context, self._path)
+        if self._positioned is not None:
+            parseret = self._struct.subcons[index]._parsereport(self._positioned(self._offsets[index]), self._context, self._path) # KeyError
+        else:
+            with lazy_lock:
+                stream_seek(self._stream, self._offsets[index], 0, self._path) # KeyError
+                parseret = self._struct.subcons[index]._parsereport(self._stream, self._context, self._path)
         self._values[index] = parseret
         return parseret
 
@@ -6065,14 +7897,23 @@ class LazyListContainer(list):
         self._values = values
         self._context = context
         self._path = path
+        self._positioned = stream_positional(stream, path)
 
     def __getitem__(self, index):
         if isinstance(index, slice):
             return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("list index out of range")
         if index in self._values:
             return self._values[index]
-        stream_seek(self._stream, self._offsets[index], 0, self._path) # KeyError
-        parseret = self._subcon._parsereport(self._stream, self._context, self._path)
+        if self._positioned is not None:
+            parseret = self._subcon._parsereport(self._positioned(self._offsets[index]), self._context, self._path) # KeyError
+        else:
+            with lazy_lock:
+                stream_seek(self._stream, self._offsets[index], 0, self._path) # KeyError
+                parseret = self._subcon._parsereport(self._stream, self._context, self._path)
         self._values[index] = parseret
         return parseret
 
@@ -6098,6 +7939,8 @@ class LazyArray(Subconstruct):
     r"""
     Equivalent to :class:`~construct.core.Array`, but the subcon is not parsed when possible (it gets skipped if the size can be measured by _actualsize or _sizeof method). See its docstring for details.
 
+    If the subcon is fixed-size, offsets of elements are computed when they are accessed, so parsing takes constant time and memory regardless of count. Otherwise offsets are kept in a compact array of integers.
+
     Fields are parsed depending on some factors:
 
     * Some fields like Int* Float* Bytes(5) Array(5,Byte) Pointer are fixed-size and are therefore skipped. Stream is not read.
@@ -6128,7 +7971,15 @@ class LazyArray(Subconstruct):
         if not 0 <= count:
             raise RangeError("invalid count %s" % (count,), path=path)
         offset = stream_tell(stream, path)
-        offsets = {0: offset}
+        try:
+            size = sc._sizeof(context, path)
+        except SizeofError:
+            size = None
+        if size:
+            end = offset + count * size
+            stream_seek(stream, end, 0, path)
+            return LazyListContainer(sc, stream, count, range(offset, end + 1, size), {}, context, path)
+        offsets = array.array('q', [offset])
         values = {}
         for i in range(count):
             try:
@@ -6138,7 +7989,7 @@ class LazyArray(Subconstruct):
                 parseret = sc._parsereport(stream, context, path)
                 values[i] = parseret
                 offset = stream_tell(stream, path)
-            offsets[i+1] = offset
+            offsets.append(offset)
         return LazyListContainer(sc, stream, count, offsets, values, context, path)
 
     def _build(self, obj, stream, context, path):
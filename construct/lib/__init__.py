@@ -12,6 +12,8 @@ __all__ = [
     'bytes2integer',
     'bytes2str',
     'Container',
+    'DecoderBytesIO',
+    'EncoderBytesIO',
     'globalPrintFalseFlags',
     'globalPrintFullStrings',
     'HexDisplayedBytes',
@@ -30,7 +32,9 @@ __all__ = [
     'PY',
     'PYPY',
     'RebufferedBytesIO',
+    'Record',
     'RestreamedBytesIO',
+    'SegmentedBytesIO',
     'setGlobalPrintFalseFlags',
     'setGlobalPrintFullStrings',
     'setGlobalPrintPrivateEntries',
@@ -3,6 +3,14 @@ from time import sleep
 from sys import maxsize
 
 
+def consumebuffer(buffer, count):
+    """Returns first count bytes of a bytearray as bytes, and removes them from it. Removing from the front of a bytearray does not move remaining bytes, so appending and consuming are both amortized O(1)."""
+    with memoryview(buffer) as view:
+        data = bytes(view[:count])
+    del buffer[:count]
+    return data
+
+
 class RestreamedBytesIO(object):
 
     def __init__(self, substream, decoder, decoderunit, encoder, encoderunit):
@@ -11,8 +19,8 @@ class RestreamedBytesIO(object):
         self.encoderunit = encoderunit
         self.decoder = decoder
         self.decoderunit = decoderunit
-        self.rbuffer = b""
-        self.wbuffer = b""
+        self.rbuffer = bytearray()
+        self.wbuffer = bytearray()
         self.sincereadwritten = 0
 
     def read(self, count=None):
@@ -22,7 +30,7 @@ class RestreamedBytesIO(object):
                 if data is None or len(data) == 0:
                     break
                 self.rbuffer += self.decoder(data)
-            data, self.rbuffer = self.rbuffer, b''
+            data = consumebuffer(self.rbuffer, len(self.rbuffer))
             self.sincereadwritten += len(data)
             return data
 
@@ -34,7 +42,7 @@ class RestreamedBytesIO(object):
                 if data is None or len(data) == 0:
                     return b''
                 self.rbuffer += self.decoder(data)
-            data, self.rbuffer = self.rbuffer[:count], self.rbuffer[count:]
+            data = consumebuffer(self.rbuffer, count)
             self.sincereadwritten += count
             return data
 
@@ -42,8 +50,7 @@ class RestreamedBytesIO(object):
         self.wbuffer += data
         datalen = len(data)
         while len(self.wbuffer) >= self.encoderunit:
-            data, self.wbuffer = self.wbuffer[:self.encoderunit], self.wbuffer[self.encoderunit:]
-            self.substream.write(self.encoder(data))
+            self.substream.write(self.encoder(consumebuffer(self.wbuffer, self.encoderunit)))
         self.sincereadwritten += datalen
         return datalen
 
@@ -75,7 +82,7 @@ class RebufferedBytesIO(object):
     def __init__(self, substream, tailcutoff=None):
         self.substream = substream
         self.offset = 0
-        self.rwbuffer = b""
+        self.rwbuffer = bytearray()
         self.moved = 0
         self.tailcutoff = tailcutoff
 
@@ -95,12 +102,13 @@ class RebufferedBytesIO(object):
                 sleep(0)
                 continue
             self.rwbuffer += newdata
-        data = self.rwbuffer[startsat-self.moved:endsat-self.moved]
+        with memoryview(self.rwbuffer) as view:
+            data = bytes(view[startsat-self.moved:endsat-self.moved])
         self.offset += count
         if self.tailcutoff is not None and self.moved < self.offset - self.tailcutoff:
             removed = self.offset - self.tailcutoff - self.moved
             self.moved += removed
-            self.rwbuffer = self.rwbuffer[removed:]
+            del self.rwbuffer[:removed]
         if len(data) < count:
             raise IOError("could not read enough bytes, something went wrong")
         return data
@@ -113,12 +121,12 @@ class RebufferedBytesIO(object):
             self.rwbuffer += newdata
             if not newdata:
                 sleep(0)
-        self.rwbuffer = self.rwbuffer[:startsat-self.moved] + data + self.rwbuffer[endsat-self.moved:]
+        self.rwbuffer[startsat-self.moved:endsat-self.moved] = data
         self.offset = endsat
         if self.tailcutoff is not None and self.moved < self.offset - self.tailcutoff:
             removed = self.offset - self.tailcutoff - self.moved
             self.moved += removed
-            self.rwbuffer = self.rwbuffer[removed:]
+            del self.rwbuffer[:removed]
         return len(data)
 
     def seek(self, at, whence=0):
@@ -145,3 +153,198 @@ class RebufferedBytesIO(object):
 
     def cachedto(self):
         return self.moved + len(self.rwbuffer)
+
+
+class DecoderBytesIO(object):
+    """Read-only stream that reads substream in chunks, passes them through decode function (like decompress method of zlib.decompressobj) and serves decoded bytes. When substream ends, flush function is called for remaining bytes. Only as much is read and decoded as reads require."""
+
+    def __init__(self, substream, decode, flush, chunksize=16*1024):
+        self.substream = substream
+        self.decode = decode
+        self.flush = flush
+        self.chunksize = chunksize
+        self.rbuffer = bytearray()
+        self.finished = False
+        self.sinceread = 0
+
+    def _fill(self):
+        if self.finished:
+            return False
+        data = self.substream.read(self.chunksize)
+        if data:
+            self.rbuffer += self.decode(data)
+        else:
+            self.rbuffer += self.flush()
+            self.finished = True
+        return True
+
+    def read(self, count=None):
+        if count is None or count < 0:
+            while self._fill():
+                pass
+            count = len(self.rbuffer)
+        else:
+            while len(self.rbuffer) < count and self._fill():
+                pass
+            count = min(count, len(self.rbuffer))
+        self.sinceread += count
+        return consumebuffer(self.rbuffer, count)
+
+    def seek(self, at, whence=0):
+        if whence == 0 and at == self.sinceread:
+            return self.sinceread
+        raise IOError
+
+    def seekable(self):
+        return False
+
+    def tell(self):
+        return self.sinceread
+
+    def tellable(self):
+        return True
+
+
+class EncoderBytesIO(object):
+    """Write-only stream that passes written bytes through encode function (like compress method of zlib.compressobj) into substream. Closing it writes the result of flush function."""
+
+    def __init__(self, substream, encode, flush):
+        self.substream = substream
+        self.encode = encode
+        self.flush = flush
+        self.sincewritten = 0
+
+    def write(self, data):
+        encoded = self.encode(data)
+        if encoded:
+            self.substream.write(encoded)
+        self.sincewritten += len(data)
+        return len(data)
+
+    def close(self):
+        encoded = self.flush()
+        if encoded:
+            self.substream.write(encoded)
+
+    def seek(self, at, whence=0):
+        if whence == 0 and at == self.sincewritten:
+            return self.sincewritten
+        raise IOError
+
+    def seekable(self):
+        return False
+
+    def tell(self):
+        return self.sincewritten
+
+    def tellable(self):
+        return True
+
+
+class SegmentedBytesIO(object):
+    """Stream that collects written data as a list of segments instead of one buffer. Bytes objects of at least threshold size are kept by reference, smaller writes are coalesced into bytearray segments. Another SegmentedBytesIO can be spliced in the same way. Seeking back and overwriting, and reading back what was written, are supported (like BytesIO), but copy the affected segments."""
+
+    def __init__(self, threshold=4*1024):
+        self.threshold = threshold
+        self.segments = []
+        self.tail = bytearray()
+        self.size = 0
+        self.pos = 0
+
+    def __len__(self):
+        return self.size
+
+    def _append(self, data):
+        if len(data) >= self.threshold and type(data) is bytes:
+            if self.tail:
+                self.segments.append(self.tail)
+                self.tail = bytearray()
+            self.segments.append(data)
+        else:
+            self.tail += data
+        self.size += len(data)
+        self.pos = self.size
+
+    def write(self, data):
+        if self.pos != self.size:
+            return self._overwrite(data)
+        self._append(data)
+        return len(data)
+
+    def splice(self, other):
+        if self.pos != self.size:
+            return self.write(other.getvalue())
+        for segment in other.getsegments():
+            self._append(segment)
+        return len(other)
+
+    def _overwrite(self, data):
+        if self.pos > self.size:
+            gap = self.pos - self.size
+            self.pos = self.size
+            self._append(bytes(gap))
+            self._append(data)
+            return len(data)
+        pos = self.pos
+        end = min(pos + len(data), self.size)
+        offset = 0
+        for i, segment in enumerate(self.getsegments()):
+            segend = offset + len(segment)
+            if segend > pos and offset < end:
+                if type(segment) is not bytearray:
+                    segment = self.segments[i] = bytearray(segment)
+                lo, hi = max(pos, offset), min(end, segend)
+                segment[lo - offset:hi - offset] = data[lo - pos:hi - pos]
+            offset = segend
+            if offset >= end:
+                break
+        self.pos = end
+        if pos + len(data) > end:
+            self._append(data[end - pos:])
+        return len(data)
+
+    def read(self, count=None):
+        end = self.size if count is None or count < 0 else min(self.pos + count, self.size)
+        if end <= self.pos:
+            return b""
+        parts = []
+        offset = 0
+        for segment in self.getsegments():
+            segend = offset + len(segment)
+            if segend > self.pos and offset < end:
+                parts.append(segment[max(self.pos, offset) - offset:min(end, segend) - offset])
+            offset = segend
+            if offset >= end:
+                break
+        self.pos = end
+        return b"".join(parts)
+
+    def getsegments(self):
+        if self.tail:
+            return self.segments + [self.tail]
+        return list(self.segments)
+
+    def getvalue(self):
+        return b"".join(self.getsegments())
+
+    def seek(self, at, whence=0):
+        if whence == 0:
+            if at < 0:
+                raise ValueError("negative seek value %d" % (at,))
+            self.pos = at
+        elif whence == 1:
+            self.pos = max(0, self.pos + at)
+        elif whence == 2:
+            self.pos = max(0, self.size + at)
+        else:
+            raise ValueError("invalid whence (%r, should be 0, 1 or 2)" % (whence,))
+        return self.pos
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.pos
+
+    def tellable(self):
+        return True
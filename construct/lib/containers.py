@@ -81,6 +81,90 @@ def value_to_string(value):
     return str(value)
 
 
+class Record(object):
+    r"""
+    Base class for record classes that compiled Struct generates when compiling with `records` option. Subclasses list member names in __slots__, so instances take a fraction of memory of a Container, and attribute access is faster. Allows both key and attribute access, compares equal to Container (and dict) with same items, and converts into Container. Pickles as a Container.
+
+    Example::
+
+        >>> d = Struct("num" / Byte).compile(records=True)
+        >>> obj = d.parse(b"\x01")
+        >>> obj.num, obj["num"]
+        (1, 1)
+        >>> obj.to_container()
+        Container(num=1)
+    """
+    __slots__ = ()
+
+    def __getitem__(self, name, /):
+        try:
+            return getattr(self, name)
+        except (AttributeError, TypeError):
+            raise KeyError(name)
+
+    def __setitem__(self, name, value, /):
+        try:
+            setattr(self, name, value)
+        except (AttributeError, TypeError):
+            raise KeyError(name)
+
+    def __delitem__(self, name, /):
+        try:
+            delattr(self, name)
+        except (AttributeError, TypeError):
+            raise KeyError(name)
+
+    def __contains__(self, name, /):
+        return isinstance(name, str) and name in self.__slots__ and hasattr(self, name)
+
+    def __iter__(self, /):
+        return iter(self.keys())
+
+    def __len__(self, /):
+        return len(self.keys())
+
+    def keys(self, /):
+        return [k for k in self.__slots__ if hasattr(self, k)]
+
+    def values(self, /):
+        return [getattr(self, k) for k in self.keys()]
+
+    def items(self, /):
+        return [(k, getattr(self, k)) for k in self.keys()]
+
+    def get(self, name, default=None, /):
+        return getattr(self, name, default) if isinstance(name, str) else default
+
+    def to_container(self, /):
+        """Converts into a Container, nested records (also within lists) are converted as well."""
+        def convert(v):
+            if isinstance(v, Record):
+                return v.to_container()
+            if isinstance(v, list):
+                return ListContainer(convert(e) for e in v)
+            return v
+        return Container((k, convert(v)) for k,v in self.items())
+
+    def __eq__(self, other, /):
+        if not isinstance(other, (dict, Record)):
+            return False
+        return self.to_container() == Container(other.items())
+
+    def __ne__(self, other, /):
+        return not self == other
+
+    __hash__ = None
+
+    def __reduce__(self, /):
+        return (Container, (self.to_container(), ))
+
+    def __repr__(self, /):
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(f"{k}={v!r}" for k,v in self.items()))
+
+    def __str__(self, /):
+        return str(self.to_container())
+
+
 class Container(dict):
     # NOTE: be careful when working with these objects. Any method can be shadowed, so instead of doing `self.items()` you should do `dict.items(self)`. Operation that use methods implicitly (such as `x in self` or `self[k]`) will work as usual.
     r"""
@@ -127,6 +211,8 @@ class Container(dict):
     def __eq__(self, other, /):
         if self is other:
             return True
+        if isinstance(other, Record):
+            return other == self
         if not isinstance(other, dict):
             return False
         def isequal(v1, v2):
@@ -218,6 +304,7 @@ class Container(dict):
         """
         Used by pickle to de-serialize from a dict.
         """
+        self.__dict__ = self
         self.__class__.clear(self)
         self.__class__.update(self, state)
 
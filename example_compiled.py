@@ -0,0 +1,1819 @@
+# generated by Construct, this source is for inspection only! do not import!
+from construct import *
+from construct.lib import *
+from construct.core import BoundedBytesIO, stream_buildbuffer, stream_buildvalue, stream_write, stream_read_terminated
+from io import BytesIO
+import struct
+import collections
+import itertools
+import mmap
+def restream(data, func):
+    return func(BytesIO(data))
+def reuse(obj, func):
+    return func(obj)
+def bufferstream(buf):
+    if isinstance(buf, (bytes, mmap.mmap)):
+        return buf if isinstance(buf, mmap.mmap) else BytesIO(buf)
+    if not isinstance(buf, bytearray):
+        buf = memoryview(buf).cast("B")
+    return BoundedBytesIO(buf, 0, len(buf), 0)
+def substream(io, length, func):
+    if length < 4096 or type(io) not in (BytesIO, BoundedBytesIO, mmap.mmap):
+        return func(BytesIO(io.read(length)))
+    io = BoundedBytesIO.from_reading(io, length, "(parsing)")
+    io.delta = -io.start
+    return func(io)
+def bytesvalue(obj, length):
+    data = integer2bytes(obj, length) if isinstance(obj, int) else obj
+    if not isinstance(data, (bytes, bytearray)):
+        raise StringError("given non-bytes value, perhaps unicode? %r" % (data,))
+    if len(data) != length:
+        raise StreamError("bytes object of wrong length, expected %d, found %d" % (length, len(data)))
+    return data
+def bitsinteger(obj, length, signed):
+    if not isinstance(obj, int):
+        raise IntegerError(f"value {obj} is not an integer")
+    low, high = (-(1 << (length-1)), (1 << (length-1)) - 1) if signed else (0, (1 << length) - 1)
+    if not low <= obj <= high:
+        raise IntegerError(f"number {obj} is out of range (min={low}, max={high})")
+    return obj & ((1 << length) - 1)
+def bytesinteger(obj, length, signed):
+    if not isinstance(obj, int):
+        raise IntegerError(f"value {obj} is not an integer")
+    low, high = (-(1 << (8*length-1)), (1 << (8*length-1)) - 1) if signed else (0, (1 << 8*length) - 1)
+    if not low <= obj <= high:
+        raise IntegerError(f"number {obj} does not fit width {length}, signed {signed}")
+    return obj
+linkedinstances = {}
+linkedparsers = {}
+linkedbuilders = {}
+userfunction = {}
+len_ = len
+sum_ = sum
+min_ = min
+max_ = max
+abs_ = abs
+fusedformat_2 = struct.Struct('>B4s')
+formatfield_3 = struct.Struct('>B')
+def parse_bitwise_4(io, this):
+    data = io.read(2)
+    if len(data) != 2:
+        raise StreamError("stream read less than specified amount, expected %d, found %d" % (2, len(data)))
+    bits = int.from_bytes(data, 'big')
+    return ((bits >> 0) & 65535)
+def parse_bitwise_5(io, this):
+    data = io.read(2)
+    if len(data) != 2:
+        raise StreamError("stream read less than specified amount, expected %d, found %d" % (2, len(data)))
+    bits = int.from_bytes(data, 'big')
+    return int.from_bytes((((bits >> 0) & 65535)).to_bytes(2, 'big'), 'little')
+# linkedinstances[6] is <Transformed <BytesInteger>>
+# linkedinstances[7] is <Transformed <BytesInteger>>
+fusedformat_8 = struct.Struct('>B16s16s')
+fusedformat_9 = struct.Struct('>BQefd')
+def parse_varint(io):
+    seekable = getattr(io, 'seekable', None)
+    step = 16 if seekable is None or seekable() else 1
+    num = 0
+    shift = 0
+    while True:
+        data = io.read(step)
+        if not data:
+            raise StreamError("stream read less than specified amount, expected 1, found 0")
+        for i,b in enumerate(data):
+            num |= (b & 127) << shift
+            shift += 7
+            if b < 128:
+                if i+1 < len(data):
+                    io.seek(i+1-len(data), 1)
+                return num
+def decode_zigzag(x):
+    return (x >> 1) ^ -(x & 1)
+# linkedinstances[10] is <StringEncoded <FixedSized <NullStripped <GreedyBytes>>>>
+# linkedinstances[11] is <StringEncoded <FixedSized <NullStripped <GreedyBytes>>>>
+# linkedinstances[12] is <StringEncoded <FixedSized <NullStripped <GreedyBytes>>>>
+# linkedinstances[13] is <StringEncoded <FixedSized <NullStripped <GreedyBytes>>>>
+# linkedinstances[14] is <StringEncoded <GreedyBytes>>
+# linkedinstances[15] is <StringEncoded <GreedyBytes>>
+# linkedinstances[16] is <StringEncoded <GreedyBytes>>
+# linkedinstances[17] is <StringEncoded <GreedyBytes>>
+factory_18 = {0: EnumIntegerString.new(0, 'zero')}
+factory_19 = {}
+factory_20 = {0: 'zero'}
+def parse_check(condition):
+    if not condition: raise CheckError
+def parse_struct_21(io, this):
+    result = Container()
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = True, _building = False, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    try:
+        result['field'] = this['field'] = formatfield_3.unpack(io.read(1))[0]
+        parse_check((this['field'] == 0))
+        pass
+    except StopFieldError:
+        pass
+    return result
+def parse_stopif(condition):
+    if condition:
+        raise StopFieldError
+def parse_error():
+    raise ExplicitError
+def parse_struct_22(io, this):
+    result = Container()
+    try:
+        result['field'] = formatfield_3.unpack(io.read(1))[0]
+        parse_stopif(True)
+        parse_error()
+        pass
+    except StopFieldError:
+        pass
+    return result
+def parse_sequence_23(io, this):
+    result = ListContainer()
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = True, _building = False, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    try:
+        result.append(formatfield_3.unpack(io.read(1))[0])
+        result.append(formatfield_3.unpack(io.read(1))[0])
+        pass
+    except StopFieldError:
+        pass
+    return result
+def parse_sequence_24(io, this):
+    result = ListContainer()
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = True, _building = False, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    try:
+        result.append(formatfield_3.unpack(io.read(1))[0])
+        this['num1'] = result[-1]
+        result.append(formatfield_3.unpack(io.read(1))[0])
+        this['num2'] = result[-1]
+        pass
+    except StopFieldError:
+        pass
+    return result
+formatarray_25 = struct.Struct('>5B')
+def parse_formatarray_26(io, count):
+    if not 0 <= count:
+        raise RangeError("invalid count %s" % (count,))
+    return ListContainer(struct.unpack(f'>{count}B', io.read(1*count)))
+# linkedinstances[27] is <GreedyRange <FormatField>>
+def parse_repeatuntil_28(io, this):
+    list_ = ListContainer()
+    while True:
+        obj_ = formatfield_3.unpack(io.read(1))[0]
+        if not (False):
+            list_.append(obj_)
+        if ((obj_ == 0)):
+            return list_
+def parse_const(value, expected):
+    if not value == expected: raise ConstError
+    return value
+formatfield_29 = struct.Struct('>L')
+def parse_focusedseq_30(io, this):
+    result = []
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = True, _building = False, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    result.append(parse_const(io.read(4), b'\x00\x00\x00\x00'))
+    result.append(formatfield_3.unpack(io.read(1))[0])
+    this['num'] = result[-1]
+    return this['num']
+def parse_focusedseq_31(io, this):
+    result = []
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = True, _building = False, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    result.append(formatfield_3.unpack(io.read(1))[0])
+    this['num'] = result[-1]
+    return this[this['_']['focusedseq2_select']]
+# linkedinstances[32] is <Pickled>
+# linkedinstances[33] is <Numpy>
+factory_34 = collections.namedtuple('coord', 'x y z')
+formatarray_35 = struct.Struct('>3B')
+factory_36 = collections.namedtuple('coord', 'x y z')
+# linkedinstances[37] is <GreedyRange <FormatField>>
+factory_38 = collections.namedtuple('coord', 'x y z')
+def parse_sequence_39(io, this):
+    result = ListContainer()
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = True, _building = False, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    try:
+        result.append(formatfield_3.unpack(io.read(1))[0])
+        result.append(formatfield_3.unpack(io.read(1))[0])
+        result.append(formatfield_3.unpack(io.read(1))[0])
+        pass
+    except StopFieldError:
+        pass
+    return result
+factory_40 = collections.namedtuple('coord', 'x y z')
+fusedformat_42 = struct.Struct('>BBB')
+def parse_struct_41(io, this):
+    result = Container()
+    try:
+        fused = fusedformat_42.unpack(io.read(3))
+        result['x'] = fused[0]
+        result['y'] = fused[1]
+        result['z'] = fused[2]
+        pass
+    except StopFieldError:
+        pass
+    return result
+# linkedinstances[43] is <EpochTimestampAdapter <FormatField>>
+# linkedinstances[44] is <MsdosTimestampAdapter <Transformed <Struct>>>
+# linkedinstances[45] is <RawCopy <FormatField>>
+# linkedinstances[46] is <RawCopy <FormatField>>
+formatfield_48 = struct.Struct('>H')
+def parse_union_47(io, this):
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = True, _building = False, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    fallback = io.tell()
+    this['char'] = formatfield_3.unpack(io.read(1))[0]
+    io.seek(fallback)
+    this['short'] = formatfield_48.unpack(io.read(2))[0]
+    io.seek(fallback)
+    this['int'] = formatfield_29.unpack(io.read(4))[0]
+    io.seek(fallback)
+    del this['_']
+    del this['_index']
+    return this
+def parse_union_49(io, this):
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = True, _building = False, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    fallback = io.tell()
+    this['char'] = formatfield_3.unpack(io.read(1))[0]
+    io.seek(fallback)
+    this['short'] = formatfield_48.unpack(io.read(2))[0]
+    forward = io.tell()
+    io.seek(fallback)
+    this['int'] = formatfield_29.unpack(io.read(4))[0]
+    io.seek(forward)
+    del this['_']
+    del this['_index']
+    return this
+def parse_union_50(io, this):
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = True, _building = False, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    fallback = io.tell()
+    this['char1'] = formatfield_3.unpack(io.read(1))[0]
+    io.seek(fallback)
+    this['char2'] = formatfield_3.unpack(io.read(1))[0]
+    io.seek(fallback)
+    this['char3'] = formatfield_3.unpack(io.read(1))[0]
+    del this['_']
+    del this['_index']
+    return this
+def parse_union_51(io, this):
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = True, _building = False, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    fallback = io.tell()
+    this['char1'] = formatfield_3.unpack(io.read(1))[0]
+    io.seek(fallback)
+    this['char2'] = formatfield_3.unpack(io.read(1))[0]
+    io.seek(fallback)
+    this['char3'] = formatfield_3.unpack(io.read(1))[0]
+    del this['_']
+    del this['_index']
+    return this
+# linkedinstances[52] is <Select>
+# linkedinstances[53] is <Select +nonbuild>
+switch_cases_54 = {}
+switch_cases_54[0] = lambda io,this: formatfield_3.unpack(io.read(1))[0]
+switch_cases_54[255] = lambda io,this: parse_error()
+switch_defaultcase_55 = lambda io,this: None
+switch_cases_56 = {}
+switch_defaultcase_57 = lambda io,this: None
+switch_cases_58 = {}
+switch_defaultcase_59 = lambda io,this: formatfield_3.unpack(io.read(1))[0]
+def parse_struct_60(io, this):
+    result = Container()
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = True, _building = False, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    try:
+        parse_stopif((this['_']['num'] == 0))
+        parse_error()
+        pass
+    except StopFieldError:
+        pass
+    return result
+# linkedinstances[61] is <GreedyRange +nonbuild <StopIf +nonbuild>>
+def parse_struct_62(io, this):
+    result = Container()
+    try:
+        result['a'] = (formatfield_3.unpack(io.read(1))[0], io.read(-(1) % (4) ))[0]
+        result['b'] = (formatfield_48.unpack(io.read(2))[0], io.read(-(2) % (4) ))[0]
+        pass
+    except StopFieldError:
+        pass
+    return result
+def parse_bitwise_63(io, this):
+    data = io.read(1)
+    if len(data) != 1:
+        raise StreamError("stream read less than specified amount, expected %d, found %d" % (1, len(data)))
+    bits = int.from_bytes(data, 'big')
+    result = Container()
+    result['a'] = ((bits >> 0) & 255)
+    return result
+def parse_pointer(io, offset, func):
+    fallback = io.tell()
+    io.seek(offset, 2 if offset < 0 else 0)
+    obj = func()
+    io.seek(fallback)
+    return obj
+def parse_peek(io, func):
+    fallback = io.tell()
+    try:
+        return func()
+    except ExplicitError:
+        raise
+    except ConstructError:
+        pass
+    finally:
+        io.seek(fallback)
+# linkedinstances[64] is <Terminated +nonbuild>
+# linkedinstances[65] is <RawCopy <FormatField>>
+# linkedinstances[66] is <RawCopy <RawCopy <RawCopy <FormatField>>>>
+# linkedinstances[67] is <Transformed <BytesInteger>>
+# linkedinstances[68] is <Transformed <BytesInteger>>
+def parse_formatarray_69(io, count):
+    if not 0 <= count:
+        raise RangeError("invalid count %s" % (count,))
+    return ListContainer(struct.unpack(f'>{count}B', io.read(1*count)))
+# linkedinstances[70] is <NullStripped <GreedyBytes>>
+# linkedinstances[71] is <Compressed <GreedyBytes>>
+def parse_struct_1(io, this):
+    result = Container()
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = True, _building = False, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    try:
+        fused = fusedformat_2.unpack(io.read(5))
+        result['num'] = this['num'] = fused[0]
+        result['bytes1'] = this['bytes1'] = fused[1]
+        result['bytes2'] = this['bytes2'] = io.read(this['num'])
+        result['greedybytes1'] = this['greedybytes1'] = substream(io, (formatfield_3.unpack(io.read(1))[0])-(0), lambda io: (io.read()))
+        result['bitwise1'] = this['bitwise1'] = parse_bitwise_4(io, this)
+        result['bitwise2'] = this['bitwise2'] = parse_bitwise_5(io, this)
+        result['bytewise1'] = this['bytewise1'] = linkedparsers[6](io, this, '(???)')
+        result['bytewise2'] = this['bytewise2'] = linkedparsers[7](io, this, '(???)')
+        fused = fusedformat_8.unpack(io.read(33))
+        result['formatfield'] = this['formatfield'] = fused[0]
+        result['bytesinteger1'] = this['bytesinteger1'] = int.from_bytes(fused[1], 'big', signed=True)
+        result['bytesinteger2'] = this['bytesinteger2'] = int.from_bytes(fused[2], 'little', signed=False)
+        result['bytesinteger3'] = this['bytesinteger3'] = bytes2integer(swapbytes(io.read((this['num'] + 1))) if False else io.read((this['num'] + 1)), False)
+        result['bitsinteger1'] = this['bitsinteger1'] = bits2integer(swapbytesinbits(io.read(16)) if False else io.read(16), True)
+        result['bitsinteger2'] = this['bitsinteger2'] = bits2integer(swapbytesinbits(io.read(16)) if True else io.read(16), False)
+        result['bitsinteger3'] = this['bitsinteger3'] = bits2integer(swapbytesinbits(io.read((this['num'] + 1))) if False else io.read((this['num'] + 1)), False)
+        fused = fusedformat_9.unpack(io.read(23))
+        result['int1'] = this['int1'] = fused[0]
+        result['int2'] = this['int2'] = fused[1]
+        result['float1'] = this['float1'] = fused[2]
+        result['float2'] = this['float2'] = fused[3]
+        result['float3'] = this['float3'] = fused[4]
+        result['varint'] = this['varint'] = parse_varint(io)
+        result['zigzag'] = this['zigzag'] = decode_zigzag(parse_varint(io))
+        result['string1'] = this['string1'] = linkedparsers[10](io, this, '(???)')
+        result['string2'] = this['string2'] = linkedparsers[11](io, this, '(???)')
+        result['string3'] = this['string3'] = linkedparsers[12](io, this, '(???)')
+        result['string4'] = this['string4'] = linkedparsers[13](io, this, '(???)')
+        result['pascalstring1'] = this['pascalstring1'] = io.read(formatfield_3.unpack(io.read(1))[0]).decode('ascii')
+        result['pascalstring2'] = this['pascalstring2'] = io.read(formatfield_3.unpack(io.read(1))[0]).decode('utf8')
+        result['pascalstring3'] = this['pascalstring3'] = io.read(formatfield_3.unpack(io.read(1))[0]).decode('utf16')
+        result['pascalstring4'] = this['pascalstring4'] = io.read(formatfield_3.unpack(io.read(1))[0]).decode('utf32')
+        result['cstring1'] = this['cstring1'] = (stream_read_terminated(io, b'\x00', False, True, True, '(parsing)')).decode('ascii')
+        result['cstring2'] = this['cstring2'] = (stream_read_terminated(io, b'\x00', False, True, True, '(parsing)')).decode('utf8')
+        result['cstring3'] = this['cstring3'] = (stream_read_terminated(io, b'\x00\x00', False, True, True, '(parsing)')).decode('utf16')
+        result['cstring4'] = this['cstring4'] = (stream_read_terminated(io, b'\x00\x00\x00\x00', False, True, True, '(parsing)')).decode('utf32')
+        result['greedystring1'] = this['greedystring1'] = substream(io, (formatfield_3.unpack(io.read(1))[0])-(0), lambda io: (linkedparsers[14](io, this, '(???)')))
+        result['greedystring2'] = this['greedystring2'] = substream(io, (formatfield_3.unpack(io.read(1))[0])-(0), lambda io: (linkedparsers[15](io, this, '(???)')))
+        result['greedystring3'] = this['greedystring3'] = substream(io, (formatfield_3.unpack(io.read(1))[0])-(0), lambda io: (linkedparsers[16](io, this, '(???)')))
+        result['greedystring4'] = this['greedystring4'] = substream(io, (formatfield_3.unpack(io.read(1))[0])-(0), lambda io: (linkedparsers[17](io, this, '(???)')))
+        result['flag'] = this['flag'] = (io.read(1) != b'\x00')
+        result['enum1'] = this['enum1'] = reuse((formatfield_3.unpack(io.read(1))[0]), lambda x: factory_18.get(x, EnumInteger(x)))
+        result['enum2'] = this['enum2'] = reuse((formatfield_3.unpack(io.read(1))[0]), lambda x: factory_19.get(x, EnumInteger(x)))
+        result['flagsenum1'] = this['flagsenum1'] = reuse((formatfield_3.unpack(io.read(1))[0]), lambda x: Container(zero=bool(x & 0 == 0), one=bool(x & 1 == 1)))
+        result['flagsenum2'] = this['flagsenum2'] = reuse((formatfield_3.unpack(io.read(1))[0]), lambda x: Container())
+        result['mapping'] = this['mapping'] = factory_20[formatfield_3.unpack(io.read(1))[0]]
+        result['struct1'] = this['struct1'] = parse_struct_21(io, this)
+        result['struct2'] = this['struct2'] = parse_struct_22(io, this)
+        result['sequence1'] = this['sequence1'] = parse_sequence_23(io, this)
+        result['sequence2'] = this['sequence2'] = parse_sequence_24(io, this)
+        result['array1'] = this['array1'] = ListContainer(formatarray_25.unpack(io.read(5)))
+        result['array2'] = this['array2'] = parse_formatarray_26(io, this['num'])
+        result['greedyrange0'] = this['greedyrange0'] = substream(io, (formatfield_3.unpack(io.read(1))[0])-(0), lambda io: (linkedparsers[27](io, this, '(???)')))
+        result['repeatuntil1'] = this['repeatuntil1'] = parse_repeatuntil_28(io, this)
+        result['const1'] = this['const1'] = parse_const(io.read(4), b'\x00\x00\x00\x00')
+        result['const2'] = this['const2'] = parse_const(formatfield_29.unpack(io.read(4))[0], 0)
+        result['computed1'] = this['computed1'] = 'string literal'
+        result['computed2'] = this['computed2'] = this['num']
+        result['computedarray'] = this['computedarray'] = [1, 2, 3]
+        result['rebuild'] = this['rebuild'] = formatfield_3.unpack(io.read(1))[0]
+        result['default'] = this['default'] = formatfield_3.unpack(io.read(1))[0]
+        parse_check((this['num'] == 0))
+        result['check'] = this['check'] = parse_check((this['num'] == 0))
+        result['error0'] = this['error0'] = ((parse_error()) if (False) else (None))
+        result['focusedseq1'] = this['focusedseq1'] = parse_focusedseq_30(io, this)
+        result['focusedseq2_select'] = this['focusedseq2_select'] = 'num'
+        result['focusedseq2'] = this['focusedseq2'] = parse_focusedseq_31(io, this)
+        result['pickled_data'] = this['pickled_data'] = b"(lp0\n(taI1\naF2.3\na(dp1\na(lp2\naS'1'\np3\naS''\np4\na."
+        result['pickled'] = this['pickled'] = restream(this['pickled_data'], lambda io: linkedparsers[32](io, this, '(???)'))
+        result['numpy_data'] = this['numpy_data'] = b"\x93NUMPY\x01\x00F\x00{'descr': '<i8', 'fortran_order': False, 'shape': (3,), }            \n\x01\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00"
+        result['numpy1'] = this['numpy1'] = restream(this['numpy_data'], lambda io: linkedparsers[33](io, this, '(???)'))
+        result['namedtuple1'] = this['namedtuple1'] = factory_34(*(ListContainer(formatarray_35.unpack(io.read(3)))))
+        result['namedtuple2'] = this['namedtuple2'] = restream(b'\x00\x00\x00', lambda io: factory_36(*(linkedparsers[37](io, this, '(???)'))))
+        result['namedtuple3'] = this['namedtuple3'] = factory_38(*(parse_sequence_39(io, this)))
+        result['namedtuple4'] = this['namedtuple4'] = factory_40(**(parse_struct_41(io, this)))
+        result['timestamp1'] = this['timestamp1'] = restream(b'\x00\x00\x00\x00ZIz\x00', lambda io: linkedparsers[43](io, this, '(???)'))
+        result['timestamp2'] = this['timestamp2'] = restream(b'H9\x8c"', lambda io: linkedparsers[44](io, this, '(???)'))
+        result['hex1'] = this['hex1'] = formatfield_3.unpack(io.read(1))[0]
+        result['hex2'] = this['hex2'] = io.read(1)
+        result['hex3'] = this['hex3'] = linkedparsers[45](io, this, '(???)')
+        result['hexdump1'] = this['hexdump1'] = io.read(1)
+        result['hexdump2'] = this['hexdump2'] = linkedparsers[46](io, this, '(???)')
+        result['union1'] = this['union1'] = parse_union_47(io, this)
+        result['union2'] = this['union2'] = parse_union_49(io, this)
+        result['union3'] = this['union3'] = parse_union_50(io, this)
+        result['union4'] = this['union4'] = parse_union_51(io, this)
+        result['select'] = this['select'] = linkedparsers[52](io, this, '(???)')
+        result['optional'] = this['optional'] = linkedparsers[53](io, this, '(???)')
+        result['if1'] = this['if1'] = ((formatfield_3.unpack(io.read(1))[0]) if ((this['num'] == 0)) else (None))
+        result['ifthenelse'] = this['ifthenelse'] = ((formatfield_3.unpack(io.read(1))[0]) if ((this['num'] == 0)) else (formatfield_3.unpack(io.read(1))[0]))
+        result['switch1'] = this['switch1'] = switch_cases_54.get(this['num'], switch_defaultcase_55)(io, this)
+        result['switch2'] = this['switch2'] = switch_cases_56.get(this['num'], switch_defaultcase_57)(io, this)
+        result['switch3'] = this['switch3'] = switch_cases_58.get(this['num'], switch_defaultcase_59)(io, this)
+        result['stopif0'] = this['stopif0'] = parse_stopif((this['num'] == 255))
+        result['stopif1'] = this['stopif1'] = parse_struct_60(io, this)
+        result['stopif3'] = this['stopif3'] = linkedparsers[61](io, this, '(???)')
+        result['padding'] = this['padding'] = (None, io.read((2)-(0) ))[0]
+        result['paddedbyte'] = this['paddedbyte'] = (formatfield_3.unpack(io.read(1))[0], io.read((4)-(1) ))[0]
+        result['alignedbyte'] = this['alignedbyte'] = (formatfield_3.unpack(io.read(1))[0], io.read(-(1) % (4) ))[0]
+        result['alignedstruct'] = this['alignedstruct'] = parse_struct_62(io, this)
+        result['bitstruct'] = this['bitstruct'] = parse_bitwise_63(io, this)
+        result['pointer'] = this['pointer'] = parse_pointer(io, 0, lambda: formatfield_3.unpack(io.read(1))[0])
+        result['peek'] = this['peek'] = parse_peek(io, lambda: formatfield_3.unpack(io.read(1))[0])
+        result['seek0'] = this['seek0'] = io.seek(0, 1)
+        result['tell'] = this['tell'] = io.tell()
+        result['pass1'] = this['pass1'] = None
+        result['terminated0'] = this['terminated0'] = substream(io, (formatfield_3.unpack(io.read(1))[0])-(0), lambda io: (linkedparsers[64](io, this, '(???)')))
+        result['rawcopy1'] = this['rawcopy1'] = linkedparsers[65](io, this, '(???)')
+        result['rawcopy2'] = this['rawcopy2'] = linkedparsers[66](io, this, '(???)')
+        result['bytesswapped'] = this['bytesswapped'] = linkedparsers[67](io, this, '(???)')
+        result['bitsswapped'] = this['bitsswapped'] = linkedparsers[68](io, this, '(???)')
+        result['prefixed1'] = this['prefixed1'] = substream(io, (formatfield_3.unpack(io.read(1))[0])-(0), lambda io: (io.read()))
+        result['prefixed2'] = this['prefixed2'] = restream(b'\x01', lambda io: substream(io, (formatfield_3.unpack(io.read(1))[0])-(1), lambda io: (io.read())))
+        result['prefixedarray'] = this['prefixedarray'] = parse_formatarray_69(io, formatfield_3.unpack(io.read(1))[0])
+        result['fixedsized'] = this['fixedsized'] = substream(io, 10, lambda io: (io.read()))
+        result['nullterminated'] = this['nullterminated'] = restream(b'\x01\x00', lambda io: stream_read_terminated(io, b'\x00', False, True, True, '(parsing)'))
+        result['nullstripped'] = this['nullstripped'] = restream(b'\x01\x00', lambda io: linkedparsers[70](io, this, '(???)'))
+        result['restreamdata'] = this['restreamdata'] = restream(b'\xff', lambda io: formatfield_3.unpack(io.read(1))[0])
+        result['restreamdata_verify'] = this['restreamdata_verify'] = parse_check((this['restreamdata'] == 255))
+        result['compressed_bzip2_data'] = this['compressed_bzip2_data'] = b'BZh91AY&SYSc\x11\x99\x00\x00\x00A\x00@\x00@\x00 \x00!\x00\x82\x83\x17rE8P\x90Sc\x11\x99'
+        result['compressed_bzip2'] = this['compressed_bzip2'] = restream(this['compressed_bzip2_data'], lambda io: linkedparsers[71](io, this, '(???)'))
+        result['probe'] = this['probe'] = print(this)
+        result['debugger'] = this['debugger'] = formatfield_3.unpack(io.read(1))[0]
+        result['items1'] = this['items1'] = [1, 2, 3]
+        result['len1'] = this['len1'] = len_(this['items1'])
+        parse_check((this['len1'] == 3))
+        result['len2'] = this['len2'] = 5
+        result['items2'] = this['items2'] = io.read(5)
+        parse_check((this['len2'] == 5))
+        pass
+    except StopFieldError:
+        pass
+    return result
+fusedformat_73 = struct.Struct('>B4s')
+formatfield_75 = struct.Struct('>B')
+def build_prefixed_74(obj, io, this):
+    outer, io = io, stream_buildbuffer(io)
+    obj = (io.write(obj), obj)[1]
+    data = stream_buildvalue(io)
+    io = outer
+    buildret, obj = obj, len(data) + (0)
+    (io.write(formatfield_75.pack(obj)), obj)[1]
+    stream_write(io, data, len(data), "(building)")
+    return buildret
+def build_bitwise_76(obj, io, this):
+    bits = 0
+    bits |= ((bitsinteger(obj, 16, False)) & 65535) << 0
+    io.write(bits.to_bytes(2, 'big'))
+    return obj
+def build_bitwise_77(obj, io, this):
+    bits = 0
+    bits |= ((int.from_bytes((bitsinteger(obj, 16, False)).to_bytes(2, 'big'), 'little')) & 65535) << 0
+    io.write(bits.to_bytes(2, 'big'))
+    return obj
+fusedformat_78 = struct.Struct('>B16s16s')
+fusedformat_79 = struct.Struct('>BQefd')
+def build_varint(obj, io):
+    if not isinstance(obj, int):
+        raise IntegerError(f"value {obj} is not an integer")
+    if obj < 0:
+        raise IntegerError(f"VarInt cannot build from negative number {obj}")
+    x = obj
+    B = bytearray((x.bit_length()+6)//7 or 1)
+    i = 0
+    while x > 127:
+        B[i] = 128 | (x & 127)
+        x >>= 7
+        i += 1
+    B[i] = x
+    io.write(B)
+    return obj
+def build_zigzag(obj, io):
+    if not isinstance(obj, int):
+        raise IntegerError(f"value {obj} is not an integer")
+    build_varint(2*obj if obj >= 0 else -2*obj-1, io)
+    return obj
+# linkedinstances[80] is <StringEncoded <Prefixed <GreedyBytes>>>
+# linkedinstances[81] is <StringEncoded <Prefixed <GreedyBytes>>>
+# linkedinstances[82] is <StringEncoded <Prefixed <GreedyBytes>>>
+# linkedinstances[83] is <StringEncoded <Prefixed <GreedyBytes>>>
+# linkedinstances[84] is <StringEncoded <NullTerminated <GreedyBytes>>>
+# linkedinstances[85] is <StringEncoded <NullTerminated <GreedyBytes>>>
+# linkedinstances[86] is <StringEncoded <NullTerminated <GreedyBytes>>>
+# linkedinstances[87] is <StringEncoded <NullTerminated <GreedyBytes>>>
+def build_prefixed_88(obj, io, this):
+    outer, io = io, stream_buildbuffer(io)
+    obj = linkedbuilders[14](obj, io, this, '(???)')
+    data = stream_buildvalue(io)
+    io = outer
+    buildret, obj = obj, len(data) + (0)
+    (io.write(formatfield_75.pack(obj)), obj)[1]
+    stream_write(io, data, len(data), "(building)")
+    return buildret
+def build_prefixed_89(obj, io, this):
+    outer, io = io, stream_buildbuffer(io)
+    obj = linkedbuilders[15](obj, io, this, '(???)')
+    data = stream_buildvalue(io)
+    io = outer
+    buildret, obj = obj, len(data) + (0)
+    (io.write(formatfield_75.pack(obj)), obj)[1]
+    stream_write(io, data, len(data), "(building)")
+    return buildret
+def build_prefixed_90(obj, io, this):
+    outer, io = io, stream_buildbuffer(io)
+    obj = linkedbuilders[16](obj, io, this, '(???)')
+    data = stream_buildvalue(io)
+    io = outer
+    buildret, obj = obj, len(data) + (0)
+    (io.write(formatfield_75.pack(obj)), obj)[1]
+    stream_write(io, data, len(data), "(building)")
+    return buildret
+def build_prefixed_91(obj, io, this):
+    outer, io = io, stream_buildbuffer(io)
+    obj = linkedbuilders[17](obj, io, this, '(???)')
+    data = stream_buildvalue(io)
+    io = outer
+    buildret, obj = obj, len(data) + (0)
+    (io.write(formatfield_75.pack(obj)), obj)[1]
+    stream_write(io, data, len(data), "(building)")
+    return buildret
+factory_92 = {EnumIntegerString.new(0, 'zero'): 0}
+factory_93 = {}
+# linkedinstances[94] is <FlagsEnum <FormatField>>
+# linkedinstances[95] is <FlagsEnum <FormatField>>
+factory_96 = {'zero': 0}
+def build_check(condition):
+    if not condition: raise CheckError
+def build_struct_97(obj, io, this):
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = False, _building = True, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    this.update(obj)
+    try:
+        objdict = obj
+        obj = objdict['field']
+        this['field'] = obj
+        this['field'] = (io.write(formatfield_75.pack(obj)), obj)[1]
+        obj = objdict.get(None, None)
+        build_check((this['field'] == 0))
+        pass
+    except StopFieldError:
+        pass
+    return this
+def build_stopif(condition):
+    if condition:
+        raise StopFieldError
+def build_error():
+    raise ExplicitError
+def build_struct_98(obj, io, this):
+    result = Container(obj)
+    try:
+        objdict = obj
+        obj = objdict['field']
+        result['field'] = (io.write(formatfield_75.pack(obj)), obj)[1]
+        obj = objdict.get(None, None)
+        build_stopif(True)
+        obj = objdict.get(None, None)
+        build_error()
+        pass
+    except StopFieldError:
+        pass
+    return result
+def build_sequence_99(obj, io, this):
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = False, _building = True, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    try:
+        objiter = iter(obj)
+        retlist = ListContainer()
+        obj = next(objiter)
+        x = (io.write(formatfield_75.pack(obj)), obj)[1]
+        retlist.append(x)
+        obj = next(objiter)
+        x = (io.write(formatfield_75.pack(obj)), obj)[1]
+        retlist.append(x)
+        pass
+    except StopFieldError:
+        pass
+    return retlist
+def build_sequence_100(obj, io, this):
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = False, _building = True, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    try:
+        objiter = iter(obj)
+        retlist = ListContainer()
+        obj = next(objiter)
+        this['num1'] = obj
+        x = (io.write(formatfield_75.pack(obj)), obj)[1]
+        retlist.append(x)
+        this['num1'] = x
+        obj = next(objiter)
+        this['num2'] = obj
+        x = (io.write(formatfield_75.pack(obj)), obj)[1]
+        retlist.append(x)
+        this['num2'] = x
+        pass
+    except StopFieldError:
+        pass
+    return retlist
+formatarray_build_formatarray_101 = struct.Struct('>5B')
+def build_formatarray_101(obj, io, count):
+    if len(obj) != 5:
+        raise RangeError("expected %d elements, found %d" % (5, len(obj)))
+    io.write(formatarray_build_formatarray_101.pack(*obj))
+    return ListContainer(obj)
+def build_formatarray_102(obj, io, count):
+    if not 0 <= count:
+        raise RangeError("invalid count %s" % (count,))
+    if len(obj) != count:
+        raise RangeError("expected %d elements, found %d" % (count, len(obj)))
+    io.write(struct.pack(f'>{count}B', *obj))
+    return ListContainer(obj)
+def build_prefixed_103(obj, io, this):
+    outer, io = io, stream_buildbuffer(io)
+    obj = linkedbuilders[27](obj, io, this, '(???)')
+    data = stream_buildvalue(io)
+    io = outer
+    buildret, obj = obj, len(data) + (0)
+    (io.write(formatfield_75.pack(obj)), obj)[1]
+    stream_write(io, data, len(data), "(building)")
+    return buildret
+def build_repeatuntil_104(obj, io, this):
+    objiter = iter(obj)
+    list_ = ListContainer()
+    while True:
+        obj_ = reuse(next(objiter), lambda obj: (io.write(formatfield_75.pack(obj)), obj)[1])
+        list_.append(obj_)
+        if ((obj_ == 0)):
+            return list_
+formatfield_105 = struct.Struct('>L')
+def build_focusedseq_106(obj, io, this):
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = False, _building = True, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    try:
+        this['num'] = obj
+        finalobj = obj
+        obj = None
+        buildret = (io.write(b'\x00\x00\x00\x00'), b'\x00\x00\x00\x00')[1]
+        obj = finalobj
+        buildret = (io.write(formatfield_75.pack(obj)), obj)[1]
+        this['num'] = buildret
+        finalret = buildret
+        pass
+    except StopFieldError:
+        pass
+    return finalret
+def build_focusedseq_107(obj, io, this):
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = False, _building = True, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    try:
+        this[this['_']['focusedseq2_select']] = obj
+        finalobj = obj
+        obj = finalobj
+        buildret = (io.write(formatfield_75.pack(obj)), obj)[1]
+        this['num'] = buildret
+        finalret = buildret
+        pass
+    except StopFieldError:
+        pass
+    return finalret
+# linkedinstances[108] is <RestreamData +nonbuild <Pickled>>
+# linkedinstances[109] is <RestreamData +nonbuild <Numpy>>
+# linkedinstances[110] is <NamedTuple <Array <FormatField>>>
+# linkedinstances[111] is <RestreamData +nonbuild <NamedTuple <GreedyRange <FormatField>>>>
+# linkedinstances[112] is <NamedTuple <Sequence>>
+# linkedinstances[113] is <NamedTuple <Struct>>
+# linkedinstances[114] is <RestreamData +nonbuild <EpochTimestampAdapter <FormatField>>>
+# linkedinstances[115] is <RestreamData +nonbuild <MsdosTimestampAdapter <Transformed <Struct>>>>
+# linkedinstances[116] is <Hex <FormatField>>
+# linkedinstances[117] is <Hex <Bytes>>
+# linkedinstances[118] is <Hex <RawCopy <FormatField>>>
+# linkedinstances[119] is <HexDump <Bytes>>
+# linkedinstances[120] is <HexDump <RawCopy <FormatField>>>
+formatfield_122 = struct.Struct('>H')
+def build_union_121(obj, io, this):
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = False, _building = True, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    this.update(obj)
+    objdict = obj
+    if 'char' in objdict:
+        obj = objdict['char']
+        this['char'] = obj
+        buildret = this['char'] = (io.write(formatfield_75.pack(obj)), obj)[1]
+        return Container({ 'char':buildret })
+    if 'short' in objdict:
+        obj = objdict['short']
+        this['short'] = obj
+        buildret = this['short'] = (io.write(formatfield_122.pack(obj)), obj)[1]
+        return Container({ 'short':buildret })
+    if 'int' in objdict:
+        obj = objdict['int']
+        this['int'] = obj
+        buildret = this['int'] = (io.write(formatfield_105.pack(obj)), obj)[1]
+        return Container({ 'int':buildret })
+    raise UnionError('cannot build, none of subcons were found in the dictionary')
+def build_union_123(obj, io, this):
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = False, _building = True, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    this.update(obj)
+    objdict = obj
+    if 'char' in objdict:
+        obj = objdict['char']
+        this['char'] = obj
+        buildret = this['char'] = (io.write(formatfield_75.pack(obj)), obj)[1]
+        return Container({ 'char':buildret })
+    if 'short' in objdict:
+        obj = objdict['short']
+        this['short'] = obj
+        buildret = this['short'] = (io.write(formatfield_122.pack(obj)), obj)[1]
+        return Container({ 'short':buildret })
+    if 'int' in objdict:
+        obj = objdict['int']
+        this['int'] = obj
+        buildret = this['int'] = (io.write(formatfield_105.pack(obj)), obj)[1]
+        return Container({ 'int':buildret })
+    raise UnionError('cannot build, none of subcons were found in the dictionary')
+def build_union_124(obj, io, this):
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = False, _building = True, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    this.update(obj)
+    objdict = obj
+    if 'char1' in objdict:
+        obj = objdict['char1']
+        this['char1'] = obj
+        buildret = this['char1'] = (io.write(formatfield_75.pack(obj)), obj)[1]
+        return Container({ 'char1':buildret })
+    if 'char2' in objdict:
+        obj = objdict['char2']
+        this['char2'] = obj
+        buildret = this['char2'] = (io.write(formatfield_75.pack(obj)), obj)[1]
+        return Container({ 'char2':buildret })
+    if 'char3' in objdict:
+        obj = objdict['char3']
+        this['char3'] = obj
+        buildret = this['char3'] = (io.write(formatfield_75.pack(obj)), obj)[1]
+        return Container({ 'char3':buildret })
+    raise UnionError('cannot build, none of subcons were found in the dictionary')
+def build_union_125(obj, io, this):
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = False, _building = True, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    this.update(obj)
+    objdict = obj
+    if 'char1' in objdict:
+        obj = objdict['char1']
+        this['char1'] = obj
+        buildret = this['char1'] = (io.write(formatfield_75.pack(obj)), obj)[1]
+        return Container({ 'char1':buildret })
+    if 'char2' in objdict:
+        obj = objdict['char2']
+        this['char2'] = obj
+        buildret = this['char2'] = (io.write(formatfield_75.pack(obj)), obj)[1]
+        return Container({ 'char2':buildret })
+    if 'char3' in objdict:
+        obj = objdict['char3']
+        this['char3'] = obj
+        buildret = this['char3'] = (io.write(formatfield_75.pack(obj)), obj)[1]
+        return Container({ 'char3':buildret })
+    raise UnionError('cannot build, none of subcons were found in the dictionary')
+switch_cases_126 = {}
+switch_cases_126[0] = lambda obj,io,this: (io.write(formatfield_75.pack(obj)), obj)[1]
+switch_cases_126[255] = lambda obj,io,this: build_error()
+switch_defaultcase_127 = lambda obj,io,this: None
+switch_cases_128 = {}
+switch_defaultcase_129 = lambda obj,io,this: None
+switch_cases_130 = {}
+switch_defaultcase_131 = lambda obj,io,this: (io.write(formatfield_75.pack(obj)), obj)[1]
+def build_struct_132(obj, io, this):
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = False, _building = True, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    this.update(obj)
+    try:
+        objdict = obj
+        obj = objdict.get(None, None)
+        build_stopif((this['_']['num'] == 0))
+        obj = objdict.get(None, None)
+        build_error()
+        pass
+    except StopFieldError:
+        pass
+    return this
+def build_struct_133(obj, io, this):
+    result = Container(obj)
+    try:
+        objdict = obj
+        obj = objdict['a']
+        result['a'] = ((io.write(formatfield_75.pack(obj)), obj)[1], io.write(b'\x00'*(-(1) % (4))) )[0]
+        obj = objdict['b']
+        result['b'] = ((io.write(formatfield_122.pack(obj)), obj)[1], io.write(b'\x00'*(-(2) % (4))) )[0]
+        pass
+    except StopFieldError:
+        pass
+    return result
+def build_bitwise_134(obj, io, this):
+    bits = 0
+    bits |= ((bitsinteger(obj['a'], 8, False)) & 255) << 0
+    io.write(bits.to_bytes(1, 'big'))
+    return obj
+def build_pointer(obj, io, offset, func):
+    fallback = io.tell()
+    io.seek(offset, 2 if offset < 0 else 0)
+    ret = func()
+    io.seek(fallback)
+    return ret
+def build_prefixed_135(obj, io, this):
+    outer, io = io, stream_buildbuffer(io)
+    obj = linkedbuilders[64](obj, io, this, '(???)')
+    data = stream_buildvalue(io)
+    io = outer
+    buildret, obj = obj, len(data) + (0)
+    (io.write(formatfield_75.pack(obj)), obj)[1]
+    stream_write(io, data, len(data), "(building)")
+    return buildret
+def build_prefixed_136(obj, io, this):
+    outer, io = io, stream_buildbuffer(io)
+    obj = (io.write(obj), obj)[1]
+    data = stream_buildvalue(io)
+    io = outer
+    buildret, obj = obj, len(data) + (0)
+    (io.write(formatfield_75.pack(obj)), obj)[1]
+    stream_write(io, data, len(data), "(building)")
+    return buildret
+# linkedinstances[137] is <RestreamData +nonbuild <Prefixed <GreedyBytes>>>
+def build_formatarray_138(obj, io, count):
+    if not 0 <= count:
+        raise RangeError("invalid count %s" % (count,))
+    if len(obj) != count:
+        raise RangeError("expected %d elements, found %d" % (count, len(obj)))
+    io.write(struct.pack(f'>{count}B', *obj))
+    return ListContainer(obj)
+# linkedinstances[139] is <FixedSized <GreedyBytes>>
+# linkedinstances[140] is <RestreamData +nonbuild <NullTerminated <GreedyBytes>>>
+# linkedinstances[141] is <RestreamData +nonbuild <NullStripped <GreedyBytes>>>
+# linkedinstances[142] is <RestreamData +nonbuild <FormatField>>
+# linkedinstances[143] is <RestreamData +nonbuild <Compressed <GreedyBytes>>>
+def build_struct_72(obj, io, this):
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = False, _building = True, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    this.update(obj)
+    try:
+        objdict = obj
+        this['num'] = objdict['num']
+        this['bytes1'] = objdict['bytes1']
+        io.write(fusedformat_73.pack(this['num'], bytesvalue(this['bytes1'], 4)))
+        obj = objdict['bytes2']
+        this['bytes2'] = obj
+        this['bytes2'] = (io.write(obj), obj)[1]
+        obj = objdict['greedybytes1']
+        this['greedybytes1'] = obj
+        this['greedybytes1'] = build_prefixed_74(obj, io, this)
+        obj = objdict['bitwise1']
+        this['bitwise1'] = obj
+        this['bitwise1'] = build_bitwise_76(obj, io, this)
+        obj = objdict['bitwise2']
+        this['bitwise2'] = obj
+        this['bitwise2'] = build_bitwise_77(obj, io, this)
+        obj = objdict['bytewise1']
+        this['bytewise1'] = obj
+        this['bytewise1'] = linkedbuilders[6](obj, io, this, '(???)')
+        obj = objdict['bytewise2']
+        this['bytewise2'] = obj
+        this['bytewise2'] = linkedbuilders[7](obj, io, this, '(???)')
+        this['formatfield'] = objdict['formatfield']
+        this['bytesinteger1'] = objdict['bytesinteger1']
+        this['bytesinteger2'] = objdict['bytesinteger2']
+        io.write(fusedformat_78.pack(this['formatfield'], int.to_bytes(bytesinteger(this['bytesinteger1'], 16, True), 16, 'big', signed=True), int.to_bytes(bytesinteger(this['bytesinteger2'], 16, False), 16, 'little', signed=False)))
+        obj = objdict['bytesinteger3']
+        this['bytesinteger3'] = obj
+        this['bytesinteger3'] = ((io.write(swapbytes(integer2bytes(bytesinteger(obj, (this['num'] + 1), False), (this['num'] + 1), False)) if (False) else integer2bytes(bytesinteger(obj, (this['num'] + 1), False), (this['num'] + 1), False))), obj)[1]
+        obj = objdict['bitsinteger1']
+        this['bitsinteger1'] = obj
+        this['bitsinteger1'] = ((io.write(swapbytesinbits(integer2bits(obj, 16, True)) if (False) else integer2bits(obj, 16, True))), obj)[1]
+        obj = objdict['bitsinteger2']
+        this['bitsinteger2'] = obj
+        this['bitsinteger2'] = ((io.write(swapbytesinbits(integer2bits(obj, 16, False)) if (True) else integer2bits(obj, 16, False))), obj)[1]
+        obj = objdict['bitsinteger3']
+        this['bitsinteger3'] = obj
+        this['bitsinteger3'] = ((io.write(swapbytesinbits(integer2bits(obj, (this['num'] + 1), False)) if (False) else integer2bits(obj, (this['num'] + 1), False))), obj)[1]
+        this['int1'] = objdict['int1']
+        this['int2'] = objdict['int2']
+        this['float1'] = objdict['float1']
+        this['float2'] = objdict['float2']
+        this['float3'] = objdict['float3']
+        io.write(fusedformat_79.pack(this['int1'], this['int2'], this['float1'], this['float2'], this['float3']))
+        obj = objdict['varint']
+        this['varint'] = obj
+        this['varint'] = build_varint(obj, io)
+        obj = objdict['zigzag']
+        this['zigzag'] = obj
+        this['zigzag'] = build_zigzag(obj, io)
+        obj = objdict['string1']
+        this['string1'] = obj
+        this['string1'] = linkedbuilders[10](obj, io, this, '(???)')
+        obj = objdict['string2']
+        this['string2'] = obj
+        this['string2'] = linkedbuilders[11](obj, io, this, '(???)')
+        obj = objdict['string3']
+        this['string3'] = obj
+        this['string3'] = linkedbuilders[12](obj, io, this, '(???)')
+        obj = objdict['string4']
+        this['string4'] = obj
+        this['string4'] = linkedbuilders[13](obj, io, this, '(???)')
+        obj = objdict['pascalstring1']
+        this['pascalstring1'] = obj
+        this['pascalstring1'] = linkedbuilders[80](obj, io, this, '(???)')
+        obj = objdict['pascalstring2']
+        this['pascalstring2'] = obj
+        this['pascalstring2'] = linkedbuilders[81](obj, io, this, '(???)')
+        obj = objdict['pascalstring3']
+        this['pascalstring3'] = obj
+        this['pascalstring3'] = linkedbuilders[82](obj, io, this, '(???)')
+        obj = objdict['pascalstring4']
+        this['pascalstring4'] = obj
+        this['pascalstring4'] = linkedbuilders[83](obj, io, this, '(???)')
+        obj = objdict['cstring1']
+        this['cstring1'] = obj
+        this['cstring1'] = linkedbuilders[84](obj, io, this, '(???)')
+        obj = objdict['cstring2']
+        this['cstring2'] = obj
+        this['cstring2'] = linkedbuilders[85](obj, io, this, '(???)')
+        obj = objdict['cstring3']
+        this['cstring3'] = obj
+        this['cstring3'] = linkedbuilders[86](obj, io, this, '(???)')
+        obj = objdict['cstring4']
+        this['cstring4'] = obj
+        this['cstring4'] = linkedbuilders[87](obj, io, this, '(???)')
+        obj = objdict['greedystring1']
+        this['greedystring1'] = obj
+        this['greedystring1'] = build_prefixed_88(obj, io, this)
+        obj = objdict['greedystring2']
+        this['greedystring2'] = obj
+        this['greedystring2'] = build_prefixed_89(obj, io, this)
+        obj = objdict['greedystring3']
+        this['greedystring3'] = obj
+        this['greedystring3'] = build_prefixed_90(obj, io, this)
+        obj = objdict['greedystring4']
+        this['greedystring4'] = obj
+        this['greedystring4'] = build_prefixed_91(obj, io, this)
+        obj = objdict['flag']
+        this['flag'] = obj
+        this['flag'] = ((io.write(b'\x01') if obj else io.write(b'\x00')), obj)[1]
+        obj = objdict['enum1']
+        this['enum1'] = obj
+        this['enum1'] = reuse(factory_92.get(obj, obj), lambda obj: ((io.write(formatfield_75.pack(obj)), obj)[1]))
+        obj = objdict['enum2']
+        this['enum2'] = obj
+        this['enum2'] = reuse(factory_93.get(obj, obj), lambda obj: ((io.write(formatfield_75.pack(obj)), obj)[1]))
+        obj = objdict['flagsenum1']
+        this['flagsenum1'] = obj
+        this['flagsenum1'] = linkedbuilders[94](obj, io, this, '(???)')
+        obj = objdict['flagsenum2']
+        this['flagsenum2'] = obj
+        this['flagsenum2'] = linkedbuilders[95](obj, io, this, '(???)')
+        obj = objdict['mapping']
+        this['mapping'] = obj
+        this['mapping'] = reuse(factory_96[obj], lambda obj: ((io.write(formatfield_75.pack(obj)), obj)[1]))
+        obj = objdict['struct1']
+        this['struct1'] = obj
+        this['struct1'] = build_struct_97(obj, io, this)
+        obj = objdict['struct2']
+        this['struct2'] = obj
+        this['struct2'] = build_struct_98(obj, io, this)
+        obj = objdict['sequence1']
+        this['sequence1'] = obj
+        this['sequence1'] = build_sequence_99(obj, io, this)
+        obj = objdict['sequence2']
+        this['sequence2'] = obj
+        this['sequence2'] = build_sequence_100(obj, io, this)
+        obj = objdict['array1']
+        this['array1'] = obj
+        this['array1'] = build_formatarray_101(obj, io, 5)
+        obj = objdict['array2']
+        this['array2'] = obj
+        this['array2'] = build_formatarray_102(obj, io, this['num'])
+        obj = objdict['greedyrange0']
+        this['greedyrange0'] = obj
+        this['greedyrange0'] = build_prefixed_103(obj, io, this)
+        obj = objdict['repeatuntil1']
+        this['repeatuntil1'] = obj
+        this['repeatuntil1'] = build_repeatuntil_104(obj, io, this)
+        obj = objdict.get('const1', None)
+        this['const1'] = obj
+        this['const1'] = (io.write(b'\x00\x00\x00\x00'), b'\x00\x00\x00\x00')[1]
+        obj = objdict.get('const2', None)
+        this['const2'] = obj
+        this['const2'] = reuse(0, lambda obj: (io.write(formatfield_105.pack(obj)), obj)[1])
+        obj = objdict.get('computed1', None)
+        this['computed1'] = obj
+        this['computed1'] = 'string literal'
+        obj = objdict.get('computed2', None)
+        this['computed2'] = obj
+        this['computed2'] = this['num']
+        obj = objdict.get('computedarray', None)
+        this['computedarray'] = obj
+        this['computedarray'] = [1, 2, 3]
+        obj = objdict.get('rebuild', None)
+        this['rebuild'] = obj
+        this['rebuild'] = reuse(len_(this['computedarray']), lambda obj: ((io.write(formatfield_75.pack(obj)), obj)[1]))
+        obj = objdict.get('default', None)
+        this['default'] = obj
+        this['default'] = reuse(0 if obj is None else obj, lambda obj: ((io.write(formatfield_75.pack(obj)), obj)[1]))
+        obj = objdict.get(None, None)
+        build_check((this['num'] == 0))
+        obj = objdict.get('check', None)
+        this['check'] = obj
+        this['check'] = build_check((this['num'] == 0))
+        obj = objdict.get('error0', None)
+        this['error0'] = obj
+        this['error0'] = ((build_error()) if (False) else (None))
+        obj = objdict['focusedseq1']
+        this['focusedseq1'] = obj
+        this['focusedseq1'] = build_focusedseq_106(obj, io, this)
+        obj = objdict.get('focusedseq2_select', None)
+        this['focusedseq2_select'] = obj
+        this['focusedseq2_select'] = 'num'
+        obj = objdict['focusedseq2']
+        this['focusedseq2'] = obj
+        this['focusedseq2'] = build_focusedseq_107(obj, io, this)
+        obj = objdict.get('pickled_data', None)
+        this['pickled_data'] = obj
+        this['pickled_data'] = b"(lp0\n(taI1\naF2.3\na(dp1\na(lp2\naS'1'\np3\naS''\np4\na."
+        obj = objdict.get('pickled', None)
+        this['pickled'] = obj
+        this['pickled'] = linkedbuilders[108](obj, io, this, '(???)')
+        obj = objdict.get('numpy_data', None)
+        this['numpy_data'] = obj
+        this['numpy_data'] = b"\x93NUMPY\x01\x00F\x00{'descr': '<i8', 'fortran_order': False, 'shape': (3,), }            \n\x01\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00"
+        obj = objdict.get('numpy1', None)
+        this['numpy1'] = obj
+        this['numpy1'] = linkedbuilders[109](obj, io, this, '(???)')
+        obj = objdict['namedtuple1']
+        this['namedtuple1'] = obj
+        this['namedtuple1'] = linkedbuilders[110](obj, io, this, '(???)')
+        obj = objdict.get('namedtuple2', None)
+        this['namedtuple2'] = obj
+        this['namedtuple2'] = linkedbuilders[111](obj, io, this, '(???)')
+        obj = objdict['namedtuple3']
+        this['namedtuple3'] = obj
+        this['namedtuple3'] = linkedbuilders[112](obj, io, this, '(???)')
+        obj = objdict['namedtuple4']
+        this['namedtuple4'] = obj
+        this['namedtuple4'] = linkedbuilders[113](obj, io, this, '(???)')
+        obj = objdict.get('timestamp1', None)
+        this['timestamp1'] = obj
+        this['timestamp1'] = linkedbuilders[114](obj, io, this, '(???)')
+        obj = objdict.get('timestamp2', None)
+        this['timestamp2'] = obj
+        this['timestamp2'] = linkedbuilders[115](obj, io, this, '(???)')
+        obj = objdict['hex1']
+        this['hex1'] = obj
+        this['hex1'] = linkedbuilders[116](obj, io, this, '(???)')
+        obj = objdict['hex2']
+        this['hex2'] = obj
+        this['hex2'] = linkedbuilders[117](obj, io, this, '(???)')
+        obj = objdict['hex3']
+        this['hex3'] = obj
+        this['hex3'] = linkedbuilders[118](obj, io, this, '(???)')
+        obj = objdict['hexdump1']
+        this['hexdump1'] = obj
+        this['hexdump1'] = linkedbuilders[119](obj, io, this, '(???)')
+        obj = objdict['hexdump2']
+        this['hexdump2'] = obj
+        this['hexdump2'] = linkedbuilders[120](obj, io, this, '(???)')
+        obj = objdict['union1']
+        this['union1'] = obj
+        this['union1'] = build_union_121(obj, io, this)
+        obj = objdict['union2']
+        this['union2'] = obj
+        this['union2'] = build_union_123(obj, io, this)
+        obj = objdict['union3']
+        this['union3'] = obj
+        this['union3'] = build_union_124(obj, io, this)
+        obj = objdict['union4']
+        this['union4'] = obj
+        this['union4'] = build_union_125(obj, io, this)
+        obj = objdict['select']
+        this['select'] = obj
+        this['select'] = linkedbuilders[52](obj, io, this, '(???)')
+        obj = objdict.get('optional', None)
+        this['optional'] = obj
+        this['optional'] = linkedbuilders[53](obj, io, this, '(???)')
+        obj = objdict['if1']
+        this['if1'] = obj
+        this['if1'] = (((io.write(formatfield_75.pack(obj)), obj)[1]) if ((this['num'] == 0)) else (None))
+        obj = objdict['ifthenelse']
+        this['ifthenelse'] = obj
+        this['ifthenelse'] = (((io.write(formatfield_75.pack(obj)), obj)[1]) if ((this['num'] == 0)) else ((io.write(formatfield_75.pack(obj)), obj)[1]))
+        obj = objdict['switch1']
+        this['switch1'] = obj
+        this['switch1'] = switch_cases_126.get(this['num'], switch_defaultcase_127)(obj, io, this)
+        obj = objdict.get('switch2', None)
+        this['switch2'] = obj
+        this['switch2'] = switch_cases_128.get(this['num'], switch_defaultcase_129)(obj, io, this)
+        obj = objdict['switch3']
+        this['switch3'] = obj
+        this['switch3'] = switch_cases_130.get(this['num'], switch_defaultcase_131)(obj, io, this)
+        obj = objdict.get('stopif0', None)
+        this['stopif0'] = obj
+        this['stopif0'] = build_stopif((this['num'] == 255))
+        obj = objdict.get('stopif1', None)
+        this['stopif1'] = obj
+        this['stopif1'] = build_struct_132(obj, io, this)
+        obj = objdict.get('stopif3', None)
+        this['stopif3'] = obj
+        this['stopif3'] = linkedbuilders[61](obj, io, this, '(???)')
+        obj = objdict.get('padding', None)
+        this['padding'] = obj
+        this['padding'] = (None, io.write(b'\x00'*((2)-(0)) ))[0]
+        obj = objdict['paddedbyte']
+        this['paddedbyte'] = obj
+        this['paddedbyte'] = ((io.write(formatfield_75.pack(obj)), obj)[1], io.write(b'\x00'*((4)-(1)) ))[0]
+        obj = objdict['alignedbyte']
+        this['alignedbyte'] = obj
+        this['alignedbyte'] = ((io.write(formatfield_75.pack(obj)), obj)[1], io.write(b'\x00'*(-(1) % (4))) )[0]
+        obj = objdict['alignedstruct']
+        this['alignedstruct'] = obj
+        this['alignedstruct'] = build_struct_133(obj, io, this)
+        obj = objdict['bitstruct']
+        this['bitstruct'] = obj
+        this['bitstruct'] = build_bitwise_134(obj, io, this)
+        obj = objdict['pointer']
+        this['pointer'] = obj
+        this['pointer'] = build_pointer(obj, io, 0, lambda: (io.write(formatfield_75.pack(obj)), obj)[1])
+        obj = objdict.get('peek', None)
+        this['peek'] = obj
+        this['peek'] = obj
+        obj = objdict.get('seek0', None)
+        this['seek0'] = obj
+        this['seek0'] = io.seek(0, 1)
+        obj = objdict.get('tell', None)
+        this['tell'] = obj
+        this['tell'] = io.tell()
+        obj = objdict.get('pass1', None)
+        this['pass1'] = obj
+        this['pass1'] = None
+        obj = objdict.get('terminated0', None)
+        this['terminated0'] = obj
+        this['terminated0'] = build_prefixed_135(obj, io, this)
+        obj = objdict['rawcopy1']
+        this['rawcopy1'] = obj
+        this['rawcopy1'] = linkedbuilders[65](obj, io, this, '(???)')
+        obj = objdict['rawcopy2']
+        this['rawcopy2'] = obj
+        this['rawcopy2'] = linkedbuilders[66](obj, io, this, '(???)')
+        obj = objdict['bytesswapped']
+        this['bytesswapped'] = obj
+        this['bytesswapped'] = linkedbuilders[67](obj, io, this, '(???)')
+        obj = objdict['bitsswapped']
+        this['bitsswapped'] = obj
+        this['bitsswapped'] = linkedbuilders[68](obj, io, this, '(???)')
+        obj = objdict['prefixed1']
+        this['prefixed1'] = obj
+        this['prefixed1'] = build_prefixed_136(obj, io, this)
+        obj = objdict.get('prefixed2', None)
+        this['prefixed2'] = obj
+        this['prefixed2'] = linkedbuilders[137](obj, io, this, '(???)')
+        obj = objdict['prefixedarray']
+        this['prefixedarray'] = obj
+        this['prefixedarray'] = (reuse(len(obj), lambda obj: (io.write(formatfield_75.pack(obj)), obj)[1]), build_formatarray_138(obj, io, len(obj)), obj)[2]
+        obj = objdict['fixedsized']
+        this['fixedsized'] = obj
+        this['fixedsized'] = linkedbuilders[139](obj, io, this, '(???)')
+        obj = objdict.get('nullterminated', None)
+        this['nullterminated'] = obj
+        this['nullterminated'] = linkedbuilders[140](obj, io, this, '(???)')
+        obj = objdict.get('nullstripped', None)
+        this['nullstripped'] = obj
+        this['nullstripped'] = linkedbuilders[141](obj, io, this, '(???)')
+        obj = objdict.get('restreamdata', None)
+        this['restreamdata'] = obj
+        this['restreamdata'] = linkedbuilders[142](obj, io, this, '(???)')
+        obj = objdict.get('restreamdata_verify', None)
+        this['restreamdata_verify'] = obj
+        this['restreamdata_verify'] = build_check((this['restreamdata'] == 255))
+        obj = objdict.get('compressed_bzip2_data', None)
+        this['compressed_bzip2_data'] = obj
+        this['compressed_bzip2_data'] = b'BZh91AY&SYSc\x11\x99\x00\x00\x00A\x00@\x00@\x00 \x00!\x00\x82\x83\x17rE8P\x90Sc\x11\x99'
+        obj = objdict.get('compressed_bzip2', None)
+        this['compressed_bzip2'] = obj
+        this['compressed_bzip2'] = linkedbuilders[143](obj, io, this, '(???)')
+        obj = objdict.get('probe', None)
+        this['probe'] = obj
+        this['probe'] = print(this)
+        obj = objdict['debugger']
+        this['debugger'] = obj
+        this['debugger'] = (io.write(formatfield_75.pack(obj)), obj)[1]
+        obj = objdict.get('items1', None)
+        this['items1'] = obj
+        this['items1'] = [1, 2, 3]
+        obj = objdict.get('len1', None)
+        this['len1'] = obj
+        this['len1'] = len_(this['items1'])
+        obj = objdict.get(None, None)
+        build_check((this['len1'] == 3))
+        obj = objdict.get('len2', None)
+        this['len2'] = obj
+        this['len2'] = reuse(len_(this['items2']), lambda obj: (5))
+        obj = objdict['items2']
+        this['items2'] = obj
+        this['items2'] = (io.write(obj), obj)[1]
+        obj = objdict.get(None, None)
+        build_check((this['len2'] == 5))
+        pass
+    except StopFieldError:
+        pass
+    return this
+def parseall(io, this):
+    return parse_struct_1(io, this)
+def buildall(obj, io, this):
+    return build_struct_72(obj, io, this)
+fusedformat_145 = struct.Struct('>B4s')
+fusedformat_146 = struct.Struct('>B16s16s')
+fusedformat_147 = struct.Struct('>BQefd')
+def parse_varint_buffer(buf, pos):
+    num = 0
+    shift = 0
+    while True:
+        try:
+            b = buf[pos]
+        except IndexError:
+            raise StreamError("stream read less than specified amount, expected 1, found 0")
+        pos += 1
+        num |= (b & 127) << shift
+        shift += 7
+        if b < 128:
+            return num, pos
+def parse_zigzag_buffer(buf, pos):
+    x, pos = parse_varint_buffer(buf, pos)
+    return (x >> 1) ^ -(x & 1), pos
+fusedformat_149 = struct.Struct('>B')
+def parse_struct_buffer_148(buf, pos, io, this):
+    result = Container()
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = True, _building = False, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    try:
+        fused = fusedformat_149.unpack_from(buf, pos)
+        pos += 1
+        result['field'] = this['field'] = fused[0]
+        io.seek(pos)
+        value = parse_check((this['field'] == 0))
+        pos = io.tell()
+        pass
+    except StopFieldError:
+        pass
+    return result, pos
+fusedformat_151 = struct.Struct('>B')
+def parse_struct_buffer_150(buf, pos, io, this):
+    result = Container()
+    try:
+        fused = fusedformat_151.unpack_from(buf, pos)
+        pos += 1
+        result['field'] = fused[0]
+        io.seek(pos)
+        value = parse_stopif(True)
+        pos = io.tell()
+        io.seek(pos)
+        value = parse_error()
+        pos = io.tell()
+        pass
+    except StopFieldError:
+        pass
+    return result, pos
+formatarray_152 = struct.Struct('>5B')
+def parse_formatarray_buffer_153(buf, pos, count):
+    if not 0 <= count:
+        raise RangeError("invalid count %s" % (count,))
+    return ListContainer(struct.unpack_from(f'>{count}B', buf, pos)), pos+1*count
+def parse_struct_buffer_154(buf, pos, io, this):
+    result = Container()
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = True, _building = False, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    try:
+        io.seek(pos)
+        value = parse_stopif((this['_']['num'] == 0))
+        pos = io.tell()
+        io.seek(pos)
+        value = parse_error()
+        pos = io.tell()
+        pass
+    except StopFieldError:
+        pass
+    return result, pos
+fusedformat_155 = struct.Struct('>2x')
+def parse_struct_buffer_156(buf, pos, io, this):
+    result = Container()
+    try:
+        io.seek(pos)
+        value = (formatfield_3.unpack(io.read(1))[0], io.read(-(1) % (4) ))[0]
+        pos = io.tell()
+        result['a'] = value
+        io.seek(pos)
+        value = (formatfield_48.unpack(io.read(2))[0], io.read(-(2) % (4) ))[0]
+        pos = io.tell()
+        result['b'] = value
+        pass
+    except StopFieldError:
+        pass
+    return result, pos
+fusedformat_157 = struct.Struct('>5s')
+def parse_struct_buffer_144(buf, pos, io, this):
+    result = Container()
+    this = Container(_ = this, _params = this['_params'], _root = None, _parsing = True, _building = False, _sizing = False, _subcons = None, _io = io, _index = this.get('_index', None))
+    this['_root'] = this['_'].get('_root', this)
+    try:
+        fused = fusedformat_145.unpack_from(buf, pos)
+        pos += 5
+        result['num'] = this['num'] = fused[0]
+        result['bytes1'] = this['bytes1'] = fused[1]
+        io.seek(pos)
+        value = io.read(this['num'])
+        pos = io.tell()
+        result['bytes2'] = this['bytes2'] = value
+        io.seek(pos)
+        value = substream(io, (formatfield_3.unpack(io.read(1))[0])-(0), lambda io: (io.read()))
+        pos = io.tell()
+        result['greedybytes1'] = this['greedybytes1'] = value
+        io.seek(pos)
+        value = parse_bitwise_4(io, this)
+        pos = io.tell()
+        result['bitwise1'] = this['bitwise1'] = value
+        io.seek(pos)
+        value = parse_bitwise_5(io, this)
+        pos = io.tell()
+        result['bitwise2'] = this['bitwise2'] = value
+        io.seek(pos)
+        value = linkedparsers[6](io, this, '(???)')
+        pos = io.tell()
+        result['bytewise1'] = this['bytewise1'] = value
+        io.seek(pos)
+        value = linkedparsers[7](io, this, '(???)')
+        pos = io.tell()
+        result['bytewise2'] = this['bytewise2'] = value
+        fused = fusedformat_146.unpack_from(buf, pos)
+        pos += 33
+        result['formatfield'] = this['formatfield'] = fused[0]
+        result['bytesinteger1'] = this['bytesinteger1'] = int.from_bytes(fused[1], 'big', signed=True)
+        result['bytesinteger2'] = this['bytesinteger2'] = int.from_bytes(fused[2], 'little', signed=False)
+        io.seek(pos)
+        value = bytes2integer(swapbytes(io.read((this['num'] + 1))) if False else io.read((this['num'] + 1)), False)
+        pos = io.tell()
+        result['bytesinteger3'] = this['bytesinteger3'] = value
+        io.seek(pos)
+        value = bits2integer(swapbytesinbits(io.read(16)) if False else io.read(16), True)
+        pos = io.tell()
+        result['bitsinteger1'] = this['bitsinteger1'] = value
+        io.seek(pos)
+        value = bits2integer(swapbytesinbits(io.read(16)) if True else io.read(16), False)
+        pos = io.tell()
+        result['bitsinteger2'] = this['bitsinteger2'] = value
+        io.seek(pos)
+        value = bits2integer(swapbytesinbits(io.read((this['num'] + 1))) if False else io.read((this['num'] + 1)), False)
+        pos = io.tell()
+        result['bitsinteger3'] = this['bitsinteger3'] = value
+        fused = fusedformat_147.unpack_from(buf, pos)
+        pos += 23
+        result['int1'] = this['int1'] = fused[0]
+        result['int2'] = this['int2'] = fused[1]
+        result['float1'] = this['float1'] = fused[2]
+        result['float2'] = this['float2'] = fused[3]
+        result['float3'] = this['float3'] = fused[4]
+        value, pos = parse_varint_buffer(buf, pos)
+        result['varint'] = this['varint'] = value
+        value, pos = parse_zigzag_buffer(buf, pos)
+        result['zigzag'] = this['zigzag'] = value
+        io.seek(pos)
+        value = linkedparsers[10](io, this, '(???)')
+        pos = io.tell()
+        result['string1'] = this['string1'] = value
+        io.seek(pos)
+        value = linkedparsers[11](io, this, '(???)')
+        pos = io.tell()
+        result['string2'] = this['string2'] = value
+        io.seek(pos)
+        value = linkedparsers[12](io, this, '(???)')
+        pos = io.tell()
+        result['string3'] = this['string3'] = value
+        io.seek(pos)
+        value = linkedparsers[13](io, this, '(???)')
+        pos = io.tell()
+        result['string4'] = this['string4'] = value
+        io.seek(pos)
+        value = io.read(formatfield_3.unpack(io.read(1))[0]).decode('ascii')
+        pos = io.tell()
+        result['pascalstring1'] = this['pascalstring1'] = value
+        io.seek(pos)
+        value = io.read(formatfield_3.unpack(io.read(1))[0]).decode('utf8')
+        pos = io.tell()
+        result['pascalstring2'] = this['pascalstring2'] = value
+        io.seek(pos)
+        value = io.read(formatfield_3.unpack(io.read(1))[0]).decode('utf16')
+        pos = io.tell()
+        result['pascalstring3'] = this['pascalstring3'] = value
+        io.seek(pos)
+        value = io.read(formatfield_3.unpack(io.read(1))[0]).decode('utf32')
+        pos = io.tell()
+        result['pascalstring4'] = this['pascalstring4'] = value
+        io.seek(pos)
+        value = (stream_read_terminated(io, b'\x00', False, True, True, '(parsing)')).decode('ascii')
+        pos = io.tell()
+        result['cstring1'] = this['cstring1'] = value
+        io.seek(pos)
+        value = (stream_read_terminated(io, b'\x00', False, True, True, '(parsing)')).decode('utf8')
+        pos = io.tell()
+        result['cstring2'] = this['cstring2'] = value
+        io.seek(pos)
+        value = (stream_read_terminated(io, b'\x00\x00', False, True, True, '(parsing)')).decode('utf16')
+        pos = io.tell()
+        result['cstring3'] = this['cstring3'] = value
+        io.seek(pos)
+        value = (stream_read_terminated(io, b'\x00\x00\x00\x00', False, True, True, '(parsing)')).decode('utf32')
+        pos = io.tell()
+        result['cstring4'] = this['cstring4'] = value
+        io.seek(pos)
+        value = substream(io, (formatfield_3.unpack(io.read(1))[0])-(0), lambda io: (linkedparsers[14](io, this, '(???)')))
+        pos = io.tell()
+        result['greedystring1'] = this['greedystring1'] = value
+        io.seek(pos)
+        value = substream(io, (formatfield_3.unpack(io.read(1))[0])-(0), lambda io: (linkedparsers[15](io, this, '(???)')))
+        pos = io.tell()
+        result['greedystring2'] = this['greedystring2'] = value
+        io.seek(pos)
+        value = substream(io, (formatfield_3.unpack(io.read(1))[0])-(0), lambda io: (linkedparsers[16](io, this, '(???)')))
+        pos = io.tell()
+        result['greedystring3'] = this['greedystring3'] = value
+        io.seek(pos)
+        value = substream(io, (formatfield_3.unpack(io.read(1))[0])-(0), lambda io: (linkedparsers[17](io, this, '(???)')))
+        pos = io.tell()
+        result['greedystring4'] = this['greedystring4'] = value
+        io.seek(pos)
+        value = (io.read(1) != b'\x00')
+        pos = io.tell()
+        result['flag'] = this['flag'] = value
+        io.seek(pos)
+        value = reuse((formatfield_3.unpack(io.read(1))[0]), lambda x: factory_18.get(x, EnumInteger(x)))
+        pos = io.tell()
+        result['enum1'] = this['enum1'] = value
+        io.seek(pos)
+        value = reuse((formatfield_3.unpack(io.read(1))[0]), lambda x: factory_19.get(x, EnumInteger(x)))
+        pos = io.tell()
+        result['enum2'] = this['enum2'] = value
+        io.seek(pos)
+        value = reuse((formatfield_3.unpack(io.read(1))[0]), lambda x: Container(zero=bool(x & 0 == 0), one=bool(x & 1 == 1)))
+        pos = io.tell()
+        result['flagsenum1'] = this['flagsenum1'] = value
+        io.seek(pos)
+        value = reuse((formatfield_3.unpack(io.read(1))[0]), lambda x: Container())
+        pos = io.tell()
+        result['flagsenum2'] = this['flagsenum2'] = value
+        io.seek(pos)
+        value = factory_20[formatfield_3.unpack(io.read(1))[0]]
+        pos = io.tell()
+        result['mapping'] = this['mapping'] = value
+        value, pos = parse_struct_buffer_148(buf, pos, io, this)
+        result['struct1'] = this['struct1'] = value
+        value, pos = parse_struct_buffer_150(buf, pos, io, this)
+        result['struct2'] = this['struct2'] = value
+        io.seek(pos)
+        value = parse_sequence_23(io, this)
+        pos = io.tell()
+        result['sequence1'] = this['sequence1'] = value
+        io.seek(pos)
+        value = parse_sequence_24(io, this)
+        pos = io.tell()
+        result['sequence2'] = this['sequence2'] = value
+        value, pos = (ListContainer(formatarray_152.unpack_from(buf, pos)), pos+5)
+        result['array1'] = this['array1'] = value
+        value, pos = parse_formatarray_buffer_153(buf, pos, this['num'])
+        result['array2'] = this['array2'] = value
+        io.seek(pos)
+        value = substream(io, (formatfield_3.unpack(io.read(1))[0])-(0), lambda io: (linkedparsers[27](io, this, '(???)')))
+        pos = io.tell()
+        result['greedyrange0'] = this['greedyrange0'] = value
+        io.seek(pos)
+        value = parse_repeatuntil_28(io, this)
+        pos = io.tell()
+        result['repeatuntil1'] = this['repeatuntil1'] = value
+        io.seek(pos)
+        value = parse_const(io.read(4), b'\x00\x00\x00\x00')
+        pos = io.tell()
+        result['const1'] = this['const1'] = value
+        io.seek(pos)
+        value = parse_const(formatfield_29.unpack(io.read(4))[0], 0)
+        pos = io.tell()
+        result['const2'] = this['const2'] = value
+        io.seek(pos)
+        value = 'string literal'
+        pos = io.tell()
+        result['computed1'] = this['computed1'] = value
+        io.seek(pos)
+        value = this['num']
+        pos = io.tell()
+        result['computed2'] = this['computed2'] = value
+        io.seek(pos)
+        value = [1, 2, 3]
+        pos = io.tell()
+        result['computedarray'] = this['computedarray'] = value
+        io.seek(pos)
+        value = formatfield_3.unpack(io.read(1))[0]
+        pos = io.tell()
+        result['rebuild'] = this['rebuild'] = value
+        io.seek(pos)
+        value = formatfield_3.unpack(io.read(1))[0]
+        pos = io.tell()
+        result['default'] = this['default'] = value
+        io.seek(pos)
+        value = parse_check((this['num'] == 0))
+        pos = io.tell()
+        io.seek(pos)
+        value = parse_check((this['num'] == 0))
+        pos = io.tell()
+        result['check'] = this['check'] = value
+        io.seek(pos)
+        value = ((parse_error()) if (False) else (None))
+        pos = io.tell()
+        result['error0'] = this['error0'] = value
+        io.seek(pos)
+        value = parse_focusedseq_30(io, this)
+        pos = io.tell()
+        result['focusedseq1'] = this['focusedseq1'] = value
+        io.seek(pos)
+        value = 'num'
+        pos = io.tell()
+        result['focusedseq2_select'] = this['focusedseq2_select'] = value
+        io.seek(pos)
+        value = parse_focusedseq_31(io, this)
+        pos = io.tell()
+        result['focusedseq2'] = this['focusedseq2'] = value
+        io.seek(pos)
+        value = b"(lp0\n(taI1\naF2.3\na(dp1\na(lp2\naS'1'\np3\naS''\np4\na."
+        pos = io.tell()
+        result['pickled_data'] = this['pickled_data'] = value
+        io.seek(pos)
+        value = restream(this['pickled_data'], lambda io: linkedparsers[32](io, this, '(???)'))
+        pos = io.tell()
+        result['pickled'] = this['pickled'] = value
+        io.seek(pos)
+        value = b"\x93NUMPY\x01\x00F\x00{'descr': '<i8', 'fortran_order': False, 'shape': (3,), }            \n\x01\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00"
+        pos = io.tell()
+        result['numpy_data'] = this['numpy_data'] = value
+        io.seek(pos)
+        value = restream(this['numpy_data'], lambda io: linkedparsers[33](io, this, '(???)'))
+        pos = io.tell()
+        result['numpy1'] = this['numpy1'] = value
+        io.seek(pos)
+        value = factory_34(*(ListContainer(formatarray_35.unpack(io.read(3)))))
+        pos = io.tell()
+        result['namedtuple1'] = this['namedtuple1'] = value
+        io.seek(pos)
+        value = restream(b'\x00\x00\x00', lambda io: factory_36(*(linkedparsers[37](io, this, '(???)'))))
+        pos = io.tell()
+        result['namedtuple2'] = this['namedtuple2'] = value
+        io.seek(pos)
+        value = factory_38(*(parse_sequence_39(io, this)))
+        pos = io.tell()
+        result['namedtuple3'] = this['namedtuple3'] = value
+        io.seek(pos)
+        value = factory_40(**(parse_struct_41(io, this)))
+        pos = io.tell()
+        result['namedtuple4'] = this['namedtuple4'] = value
+        io.seek(pos)
+        value = restream(b'\x00\x00\x00\x00ZIz\x00', lambda io: linkedparsers[43](io, this, '(???)'))
+        pos = io.tell()
+        result['timestamp1'] = this['timestamp1'] = value
+        io.seek(pos)
+        value = restream(b'H9\x8c"', lambda io: linkedparsers[44](io, this, '(???)'))
+        pos = io.tell()
+        result['timestamp2'] = this['timestamp2'] = value
+        io.seek(pos)
+        value = formatfield_3.unpack(io.read(1))[0]
+        pos = io.tell()
+        result['hex1'] = this['hex1'] = value
+        io.seek(pos)
+        value = io.read(1)
+        pos = io.tell()
+        result['hex2'] = this['hex2'] = value
+        io.seek(pos)
+        value = linkedparsers[45](io, this, '(???)')
+        pos = io.tell()
+        result['hex3'] = this['hex3'] = value
+        io.seek(pos)
+        value = io.read(1)
+        pos = io.tell()
+        result['hexdump1'] = this['hexdump1'] = value
+        io.seek(pos)
+        value = linkedparsers[46](io, this, '(???)')
+        pos = io.tell()
+        result['hexdump2'] = this['hexdump2'] = value
+        io.seek(pos)
+        value = parse_union_47(io, this)
+        pos = io.tell()
+        result['union1'] = this['union1'] = value
+        io.seek(pos)
+        value = parse_union_49(io, this)
+        pos = io.tell()
+        result['union2'] = this['union2'] = value
+        io.seek(pos)
+        value = parse_union_50(io, this)
+        pos = io.tell()
+        result['union3'] = this['union3'] = value
+        io.seek(pos)
+        value = parse_union_51(io, this)
+        pos = io.tell()
+        result['union4'] = this['union4'] = value
+        io.seek(pos)
+        value = linkedparsers[52](io, this, '(???)')
+        pos = io.tell()
+        result['select'] = this['select'] = value
+        io.seek(pos)
+        value = linkedparsers[53](io, this, '(???)')
+        pos = io.tell()
+        result['optional'] = this['optional'] = value
+        io.seek(pos)
+        value = ((formatfield_3.unpack(io.read(1))[0]) if ((this['num'] == 0)) else (None))
+        pos = io.tell()
+        result['if1'] = this['if1'] = value
+        io.seek(pos)
+        value = ((formatfield_3.unpack(io.read(1))[0]) if ((this['num'] == 0)) else (formatfield_3.unpack(io.read(1))[0]))
+        pos = io.tell()
+        result['ifthenelse'] = this['ifthenelse'] = value
+        io.seek(pos)
+        value = switch_cases_54.get(this['num'], switch_defaultcase_55)(io, this)
+        pos = io.tell()
+        result['switch1'] = this['switch1'] = value
+        io.seek(pos)
+        value = switch_cases_56.get(this['num'], switch_defaultcase_57)(io, this)
+        pos = io.tell()
+        result['switch2'] = this['switch2'] = value
+        io.seek(pos)
+        value = switch_cases_58.get(this['num'], switch_defaultcase_59)(io, this)
+        pos = io.tell()
+        result['switch3'] = this['switch3'] = value
+        io.seek(pos)
+        value = parse_stopif((this['num'] == 255))
+        pos = io.tell()
+        result['stopif0'] = this['stopif0'] = value
+        value, pos = parse_struct_buffer_154(buf, pos, io, this)
+        result['stopif1'] = this['stopif1'] = value
+        io.seek(pos)
+        value = linkedparsers[61](io, this, '(???)')
+        pos = io.tell()
+        result['stopif3'] = this['stopif3'] = value
+        fused = fusedformat_155.unpack_from(buf, pos)
+        pos += 2
+        result['padding'] = this['padding'] = None
+        io.seek(pos)
+        value = (formatfield_3.unpack(io.read(1))[0], io.read((4)-(1) ))[0]
+        pos = io.tell()
+        result['paddedbyte'] = this['paddedbyte'] = value
+        io.seek(pos)
+        value = (formatfield_3.unpack(io.read(1))[0], io.read(-(1) % (4) ))[0]
+        pos = io.tell()
+        result['alignedbyte'] = this['alignedbyte'] = value
+        value, pos = parse_struct_buffer_156(buf, pos, io, this)
+        result['alignedstruct'] = this['alignedstruct'] = value
+        io.seek(pos)
+        value = parse_bitwise_63(io, this)
+        pos = io.tell()
+        result['bitstruct'] = this['bitstruct'] = value
+        io.seek(pos)
+        value = parse_pointer(io, 0, lambda: formatfield_3.unpack(io.read(1))[0])
+        pos = io.tell()
+        result['pointer'] = this['pointer'] = value
+        io.seek(pos)
+        value = parse_peek(io, lambda: formatfield_3.unpack(io.read(1))[0])
+        pos = io.tell()
+        result['peek'] = this['peek'] = value
+        io.seek(pos)
+        value = io.seek(0, 1)
+        pos = io.tell()
+        result['seek0'] = this['seek0'] = value
+        io.seek(pos)
+        value = io.tell()
+        pos = io.tell()
+        result['tell'] = this['tell'] = value
+        io.seek(pos)
+        value = None
+        pos = io.tell()
+        result['pass1'] = this['pass1'] = value
+        io.seek(pos)
+        value = substream(io, (formatfield_3.unpack(io.read(1))[0])-(0), lambda io: (linkedparsers[64](io, this, '(???)')))
+        pos = io.tell()
+        result['terminated0'] = this['terminated0'] = value
+        io.seek(pos)
+        value = linkedparsers[65](io, this, '(???)')
+        pos = io.tell()
+        result['rawcopy1'] = this['rawcopy1'] = value
+        io.seek(pos)
+        value = linkedparsers[66](io, this, '(???)')
+        pos = io.tell()
+        result['rawcopy2'] = this['rawcopy2'] = value
+        io.seek(pos)
+        value = linkedparsers[67](io, this, '(???)')
+        pos = io.tell()
+        result['bytesswapped'] = this['bytesswapped'] = value
+        io.seek(pos)
+        value = linkedparsers[68](io, this, '(???)')
+        pos = io.tell()
+        result['bitsswapped'] = this['bitsswapped'] = value
+        io.seek(pos)
+        value = substream(io, (formatfield_3.unpack(io.read(1))[0])-(0), lambda io: (io.read()))
+        pos = io.tell()
+        result['prefixed1'] = this['prefixed1'] = value
+        io.seek(pos)
+        value = restream(b'\x01', lambda io: substream(io, (formatfield_3.unpack(io.read(1))[0])-(1), lambda io: (io.read())))
+        pos = io.tell()
+        result['prefixed2'] = this['prefixed2'] = value
+        io.seek(pos)
+        value = parse_formatarray_69(io, formatfield_3.unpack(io.read(1))[0])
+        pos = io.tell()
+        result['prefixedarray'] = this['prefixedarray'] = value
+        io.seek(pos)
+        value = substream(io, 10, lambda io: (io.read()))
+        pos = io.tell()
+        result['fixedsized'] = this['fixedsized'] = value
+        io.seek(pos)
+        value = restream(b'\x01\x00', lambda io: stream_read_terminated(io, b'\x00', False, True, True, '(parsing)'))
+        pos = io.tell()
+        result['nullterminated'] = this['nullterminated'] = value
+        io.seek(pos)
+        value = restream(b'\x01\x00', lambda io: linkedparsers[70](io, this, '(???)'))
+        pos = io.tell()
+        result['nullstripped'] = this['nullstripped'] = value
+        io.seek(pos)
+        value = restream(b'\xff', lambda io: formatfield_3.unpack(io.read(1))[0])
+        pos = io.tell()
+        result['restreamdata'] = this['restreamdata'] = value
+        io.seek(pos)
+        value = parse_check((this['restreamdata'] == 255))
+        pos = io.tell()
+        result['restreamdata_verify'] = this['restreamdata_verify'] = value
+        io.seek(pos)
+        value = b'BZh91AY&SYSc\x11\x99\x00\x00\x00A\x00@\x00@\x00 \x00!\x00\x82\x83\x17rE8P\x90Sc\x11\x99'
+        pos = io.tell()
+        result['compressed_bzip2_data'] = this['compressed_bzip2_data'] = value
+        io.seek(pos)
+        value = restream(this['compressed_bzip2_data'], lambda io: linkedparsers[71](io, this, '(???)'))
+        pos = io.tell()
+        result['compressed_bzip2'] = this['compressed_bzip2'] = value
+        io.seek(pos)
+        value = print(this)
+        pos = io.tell()
+        result['probe'] = this['probe'] = value
+        io.seek(pos)
+        value = formatfield_3.unpack(io.read(1))[0]
+        pos = io.tell()
+        result['debugger'] = this['debugger'] = value
+        io.seek(pos)
+        value = [1, 2, 3]
+        pos = io.tell()
+        result['items1'] = this['items1'] = value
+        io.seek(pos)
+        value = len_(this['items1'])
+        pos = io.tell()
+        result['len1'] = this['len1'] = value
+        io.seek(pos)
+        value = parse_check((this['len1'] == 3))
+        pos = io.tell()
+        io.seek(pos)
+        value = 5
+        pos = io.tell()
+        result['len2'] = this['len2'] = value
+        fused = fusedformat_157.unpack_from(buf, pos)
+        pos += 5
+        result['items2'] = this['items2'] = fused[0]
+        io.seek(pos)
+        value = parse_check((this['len2'] == 5))
+        pos = io.tell()
+        pass
+    except StopFieldError:
+        pass
+    return result, pos
+def parseallbuffer(buf, pos, this):
+    io = bufferstream(buf)
+    return parse_struct_buffer_144(buf, pos, io, this)[0]
+compiled = Compiled(parseall, buildall, parseallbuffer, None, None)
@@ -157,6 +157,7 @@ def test_pickling():
     nested = Container(a=1,b=Container(),c=3,d=Container(e=4))
     nested_unpickled = pickle.loads(pickle.dumps(nested))
     assert nested_unpickled == nested
+    assert nested_unpickled.d.e == 4
 
 def test_eq_issue_818():
     c = Container(a=1, b=2, c=3, d=4, e=5)
@@ -322,3 +323,24 @@ def test_method_shadowing_2():
     assert Container.search(c, 'y') == None
     pytest.raises(ZeroDivisionError, c.search, 'x')
 
+
+def test_record():
+    class Point(Record):
+        __slots__ = ("x", "y")
+    r = Point()
+    r.x = 1
+    r["y"] = 2
+    assert r.x == 1 and r["y"] == 2
+    assert list(r) == ["x", "y"] and len(r) == 2 and "x" in r
+    assert r.get("z") is None
+    assert raises(lambda: r["z"]) == KeyError
+    assert r == Container(x=1, y=2)
+    assert Container(x=1, y=2) == r
+    assert r != Container(x=1)
+    assert r.to_container() == Container(x=1, y=2)
+    assert type(r.to_container()) is Container
+    assert not hasattr(r, "__dict__")
+    del r["y"]
+    assert r.keys() == ["x"]
+    import pickle
+    assert pickle.loads(pickle.dumps(r)) == Container(x=1)
@@ -934,6 +934,22 @@ def test_class_nullstripped_build(benchmark):
     d = NullStripped(GreedyBytes)
     benchmark(d.build, bytes(100))
 
+def test_class_restreamed_parse(benchmark):
+    d = Restreamed(Array(256, Bytes(4096)), ident, 16, ident, 16, lambda n: n)
+    benchmark(d.parse, bytes(1024*1024))
+
+def test_class_restreamed_build(benchmark):
+    d = Restreamed(GreedyBytes, ident, 64, ident, 64, lambda n: n)
+    benchmark(d.build, bytes(1024*1024))
+
+def test_class_rebuffered_parse(benchmark):
+    d = Rebuffered(Array(16384, Bytes(64)), tailcutoff=1024)
+    benchmark(d.parse, bytes(1024*1024))
+
+def test_class_rebuffered_build(benchmark):
+    d = Rebuffered(Array(16384, Bytes(64)), tailcutoff=1024)
+    benchmark(d.build, [bytes(64)]*16384)
+
 # - measured by other fields
 # RestreamData
 # Transformed
@@ -947,6 +963,14 @@ def test_class_nullstripped_build(benchmark):
 # - not compilable
 # Rebuffered
 
+def test_class_lazyarray_parse(benchmark):
+    d = LazyArray(1000000, Int64ub)
+    benchmark(d.parse, bytes(8*1000000))
+
+def test_class_lazyarray_parse_varsize(benchmark):
+    d = LazyArray(100000, Prefixed(Byte, GreedyBytes))
+    benchmark(d.parse, bytes(100000))
+
 # - not compilable
 # LazyBound
 
@@ -979,3 +1003,28 @@ def test_overall_build_compiled(benchmark):
     d = d.compile()
     obj = example.parse(exampledata)
     benchmark(d.build, obj)
+
+def test_overall_parse_many(benchmark):
+    d = Struct("id" / Int32ub, "name" / PascalString(Byte, "utf8"), "values" / Array(64, Int16ub)).compile()
+    buffers = [d.build(dict(id=i, name="record", values=range(64))) for i in range(10000)]
+    benchmark(lambda: list(d.parse_many(buffers, chunksize=1000)))
+
+def test_overall_parse_many_sequential(benchmark):
+    d = Struct("id" / Int32ub, "name" / PascalString(Byte, "utf8"), "values" / Array(64, Int16ub)).compile()
+    buffers = [d.build(dict(id=i, name="record", values=range(64))) for i in range(10000)]
+    benchmark(lambda: [d.parse(b) for b in buffers])
+
+def test_overall_parse_shards(benchmark, tmpdir):
+    d = Struct("id" / Int32ub, "name" / PaddedString(12, "utf8"), "values" / Array(16, Int16ub)).compile()
+    filename = str(tmpdir.join("records"))
+    with open(filename, "wb") as f:
+        f.write(Array(100000, d).build([dict(id=i, name="record", values=range(16)) for i in range(100000)]))
+    benchmark(lambda: list(d.parse_shards(filename, shardsize=1024*1024)))
+
+def test_overall_parse_shards_sequential(benchmark, tmpdir):
+    d = Struct("id" / Int32ub, "name" / PaddedString(12, "utf8"), "values" / Array(16, Int16ub)).compile()
+    filename = str(tmpdir.join("records"))
+    with open(filename, "wb") as f:
+        f.write(Array(100000, d).build([dict(id=i, name="record", values=range(16)) for i in range(100000)]))
+    benchmark(lambda: list(d.parse_iter(filename)))
+
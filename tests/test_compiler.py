@@ -4,6 +4,8 @@ from tests.declarativeunittest import *
 from construct import *
 from construct.lib import *
 
+import struct
+
 
 example = Struct(
     "num" / Byte,
@@ -190,3 +192,333 @@ def test_compiled_example_integrity():
     data2 = d.build(obj)
     assert obj == obj2
     assert data == data2
+
+def test_compile_cache(tmpdir):
+    cache = CompileCache(str(tmpdir))
+    d = example.compile(cachedir=cache)
+    entries = os.listdir(str(tmpdir))
+    assert len(entries) == 1
+    assert cache.load(d.modulename) is not None
+    d2 = example.compile(cachedir=str(tmpdir))
+    assert d2.modulename == d.modulename
+    assert os.listdir(str(tmpdir)) == entries
+    assert d2.parse(exampledata) == d.parse(exampledata)
+    assert d2.build(d.parse(exampledata)) == d.build(d.parse(exampledata))
+
+def test_compile_cache_corrupted(tmpdir):
+    cache = CompileCache(str(tmpdir))
+    d = Struct("num" / Byte).compile(cachedir=cache)
+    with open(cache.filename(d.modulename), "wb") as f:
+        f.write(b"garbage")
+    d = Struct("num" / Byte).compile(cachedir=cache)
+    assert d.parse(b"\x01") == Container(num=1)
+
+def test_compile_cache_eviction(tmpdir):
+    cache = CompileCache(str(tmpdir), maxsize=0)
+    Struct("num" / Byte).compile(cachedir=cache)
+    assert os.listdir(str(tmpdir)) == []
+
+def test_compiled_struct_fused_formats():
+    d = Struct(
+        "a" / Int16ub,
+        "b" / Int8ub,
+        "c" / Int24ub,
+        Padding(2),
+        "d" / Bytes(3),
+        "p" / Padding(1, b"\xff"),
+        "e" / Int32sl,
+        "f" / BytesInteger(2, swapped=True, signed=True),
+        "g" / Float32b,
+    )
+    c = d.compile()
+    assert "struct.Struct('>HB3s2x3s1s')" in c.source
+    assert "struct.Struct('<lh')" in c.source
+    data = bytes(range(1, d.sizeof()+1))
+    obj = d.parse(data)
+    assert c.parse(data) == obj
+    assert c.build(obj) == d.build(obj)
+    d = Struct("a" / Bytes(3), "b" / Int8ub)
+    c = d.compile()
+    for a in [b"toolong", b"x"]:
+        assert raises(d.build, dict(a=a, b=1)) == StreamError
+        assert raises(c.build, dict(a=a, b=1)) == StreamError
+        assert raises(c.build_into, dict(a=a, b=1), bytearray(4), 0) == StreamError
+    assert raises(c.build, dict(a="abc", b=1)) == StringError
+    assert c.build(dict(a=bytearray(b"abc"), b=1)) == c.build(dict(a=b"abc", b=1)) == b"abc\x01"
+    d = Struct("a" / BytesInteger(2), "b" / BytesInteger(3, swapped=True, signed=True), "c" / Int8ub)
+    c = d.compile()
+    for a,b in [(None,0), (1.5,0), (-1,0), (2**16,0), (0,"1"), (0,2**23), (0,-2**23-1)]:
+        assert raises(d.build, dict(a=a, b=b, c=1)) == IntegerError
+        assert raises(c.build, dict(a=a, b=b, c=1)) == IntegerError
+        assert raises(c.build_stream, dict(a=a, b=b, c=1), io.BytesIO()) == IntegerError
+    assert raises(Array(2, BytesInteger(4)).compile().build, [0, -1]) == IntegerError
+
+def test_compiled_struct_buffer_parsing():
+    d = Struct(
+        "a" / Int16ub,
+        "inner" / Struct("b" / Int8ub, "c" / Bytes(2)),
+        "d" / Prefixed(Byte, GreedyBytes),
+        "e" / Int32ul,
+        "f" / Bytes(this.a),
+    )
+    c = d.compile()
+    assert c.parsebufferfunc is not None
+    data = b"\x00\x02\x01ab\x03xyz\x04\x00\x00\x00XY"
+    obj = d.parse(data)
+    assert obj.inner.c == b"ab" and obj.d == b"xyz" and obj.f == b"XY"
+    assert c.parse(data) == obj
+    assert c.parse(bytearray(data)) == obj
+    assert c.parse(memoryview(data)) == obj
+    assert c.parse_stream(io.BytesIO(data)) == obj
+    assert raises(c.parse, data[:4]) == StreamError
+    assert raises(c.parse, data[:1]) == StreamError
+    assert raises(c.parse_stream, io.BytesIO(data[:4])) == StreamError
+    d = Struct("a" / Int16ub, "s" / CString("ascii"), "b" / Select(Const(b"XY"), Bytes(2)), "c" / Int8ub)
+    c = d.compile()
+    assert "bufferstream(buf)" in c.source
+    data = b"\x00\x01ab\x00xy\x02"
+    for buf in [data, bytearray(data), memoryview(data), memoryview(b"..." + data)[3:]]:
+        obj = c.parse(buf)
+        assert obj == Container(a=1, s="ab", b=b"xy", c=2) and type(obj.b) is bytes
+
+def test_compiled_struct_buffer_parsing_mmap(tmpdir):
+    import mmap
+    d = Struct("a" / Int16ub, "b" / Prefixed(Byte, GreedyBytes), "c" / Int8ub)
+    c = d.compile()
+    filename = str(tmpdir.join("data"))
+    with open(filename, "wb") as f:
+        f.write(b"\x00\x01\x02ab\x03")
+    with open(filename, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            assert c.parse(m) == Container(a=1, b=b"ab", c=3)
+
+def test_compiled_array_of_formatfields():
+    d = Struct(
+        "a" / Array(3, Int16ub),
+        "n" / Byte,
+        "b" / Array(this.n, Int32sl),
+        "c" / PrefixedArray(Byte, Float32b),
+        "d" / Array(2, Int24ub),
+    )
+    c = d.compile()
+    assert c.source.count("formatarray_") >= 6
+    data = b"\x00\x01\x00\x02\x00\x03" + b"\x02" + b"\xff\xff\xff\xff\x01\x00\x00\x00" + b"\x01\x3f\x80\x00\x00" + b"\x00\x00\x01\x00\x00\x02"
+    obj = d.parse(data)
+    assert obj == Container(a=[1,2,3], n=2, b=[-1,1], c=[1.0], d=[1,2])
+    assert c.parse(data) == obj
+    assert c.parse_stream(io.BytesIO(data)) == obj
+    assert c.build(obj) == data
+    assert raises(c.build, dict(a=[1,2], n=0, b=[], c=[], d=[1,2])) == RangeError
+    assert raises(c.build, dict(a=[1,2,3], n=2, b=[1], c=[], d=[1,2])) == RangeError
+    assert raises(d.build, dict(a=[1,2], n=0, b=[], c=[], d=[1,2])) == RangeError
+    assert raises(Array(3, Int16ub).compile().build, [1,2]) == RangeError
+    assert raises(Struct("x" / Array(3, Int16ub)).compile().build, dict(x=[1,2,3,4])) == RangeError
+    c = Struct("n" / Int8sb, "a" / Array(this.n, Int16ub)).compile()
+    assert raises(c.parse, b"\xff") == RangeError
+    assert raises(c.parse_stream, io.BytesIO(b"\xff")) == RangeError
+
+def test_compiled_bitstruct_shift_and_mask():
+    d = BitStruct(
+        "a" / Flag,
+        "b" / Nibble,
+        Padding(3),
+        "c" / BitsInteger(5, signed=True),
+        "d" / BitsInteger(16, swapped=True),
+        "e" / Padding(3, b"\x01"),
+        "f" / Octet,
+    )
+    c = d.compile()
+    assert "parse_bitwise_" in c.source and "build_bitwise_" in c.source
+    for data in [bytes(5), b"\xff"*5, b"\x9a\xbc\xde\xf0\x12"]:
+        obj = d.parse(data)
+        assert c.parse(data) == obj
+        assert c.parse_stream(io.BytesIO(data)) == obj
+        assert c.build(obj) == d.build(obj)
+    assert raises(c.parse, bytes(4)) == StreamError
+
+def test_compiled_bitwise_single_field():
+    for d in [Bitwise(BitsInteger(16)), Bitwise(BitsInteger(16, swapped=True)), Bitwise(BitsInteger(8, signed=True))]:
+        c = d.compile()
+        assert "parse_bitwise_" in c.source
+        data = b"\xf0\x01"[:d.sizeof()]
+        assert c.parse(data) == d.parse(data)
+        assert c.build(d.parse(data)) == data
+    for d,obj in [(BitStruct("b" / BitsInteger(16, signed=True, swapped=True)), dict(b=-2)), (Bitwise(BitsInteger(8, signed=True, swapped=True)), -2)]:
+        c = d.compile()
+        assert c.build(obj) == d.build(obj)
+        assert c.parse(d.build(obj)) == d.parse(d.build(obj))
+
+def test_compiled_bitwise_range():
+    for d,obj in [(Bitwise(BitsInteger(8)), 300), (Bitwise(BitsInteger(8)), -1), (BitStruct("a" / BitsInteger(4, signed=True), "b" / Nibble), dict(a=9, b=0)), (BitStruct("a" / BitsInteger(4, signed=True), "b" / Nibble), dict(a=-9, b=0)), (Bitwise(BitsInteger(8)), "x")]:
+        assert raises(d.build, obj) == IntegerError
+        assert raises(d.compile().build, obj) == IntegerError
+
+def test_compiled_varint_zigzag():
+    d = Struct("a" / VarInt, "b" / ZigZag, "c" / Byte, "d" / PrefixedArray(VarInt, ZigZag))
+    c = d.compile()
+    assert "linkedparsers[" not in c.source
+    for a,b in [(0,0), (1,-1), (127,63), (128,-64), (2**64,-2**70), (2**100,2**100)]:
+        obj = Container(a=a, b=b, c=7, d=[0,-1,1,-2**40])
+        data = d.build(obj)
+        assert c.build(obj) == data
+        assert c.parse(data) == obj
+        assert c.parse_stream(io.BytesIO(data)) == obj
+    assert raises(c.parse, b"\x80\x80") == StreamError
+    assert raises(c.parse_stream, io.BytesIO(b"\x80\x80")) == StreamError
+    for a,b in [(None,0), (1.5,0), (0,None), (0,"1"), (0,1.5)]:
+        assert raises(c.build, Container(a=a, b=b, c=7, d=[])) == IntegerError
+    assert raises(c.build, Container(a=-1, b=0, c=7, d=[])) == IntegerError
+
+def test_compiled_varint_nonseekable():
+    class Unseekable(io.BytesIO):
+        def seekable(self):
+            return False
+        def seek(self, *args):
+            raise io.UnsupportedOperation
+    c = Sequence(VarInt, VarInt).compile()
+    assert c.parse_stream(Unseekable(b"\x80\x01\x05")) == [128, 5]
+
+def test_compiled_fallbacks():
+    d = Struct("a" / Byte, "b" / Struct("c" / Compressed(GreedyBytes, "zlib")))
+    c = d.compile()
+    assert ("parse", "(compiling) -> b -> c", d.b.subcons[0].subcon) in c.fallbacks
+    assert [(mode,path) for mode,path,sc in c.fallbacks] == [("parse", "(compiling) -> b -> c"), ("build", "(compiling) -> b -> c")]
+    assert raises(d.compile, strict=True) == ConstructError
+    assert raises(c.compile, strict=True) == ConstructError
+    d = Struct("a" / Byte, "b" / Int16ub)
+    assert d.compile(strict=True).fallbacks == []
+
+def test_compiled_records():
+    d = Struct(
+        "a" / Int16ub,
+        "b" / Struct("c" / Byte),
+        "d" / Array(2, Struct("x" / Byte)),
+        "e" / Prefixed(Byte, GreedyBytes),
+    )
+    data = b"\x00\x01\x02\x03\x04\x01e"
+    obj = d.parse(data)
+    c = d.compile(records=True)
+    for r in [c.parse(data), c.parse_stream(io.BytesIO(data))]:
+        assert isinstance(r, Record) and isinstance(r.b, Record) and isinstance(r.d[0], Record)
+        assert r.a == r["a"] == 1
+        assert r.b.c == 2
+        assert r == obj and obj == r
+        assert r.to_container() == obj
+        assert c.build(r) == data
+    assert not isinstance(d.compile().parse(data), Record)
+
+def test_compiled_records_unsuitable_names():
+    d = Struct("keys" / Byte, "class" / Byte)
+    r = d.compile(records=True).parse(b"\x01\x02")
+    assert type(r) is Container and r == Container([("keys", 1), ("class", 2)])
+
+def test_compiled_struct_context_elision():
+    d = Struct(
+        "a" / Int16ub,
+        "b" / Struct("c" / VarInt, "d" / PascalString(Byte, "utf8")),
+        "e" / Array(2, Byte),
+    )
+    c = d.compile()
+    assert "_params" not in c.source
+    obj = Container(a=1, b=Container(c=300, d="x"), e=[2, 3])
+    data = d.build(obj)
+    assert c.build(obj) == data
+    assert c.parse(data) == c.parse_stream(io.BytesIO(data)) == d.parse(data) == obj
+    assert "_params" in Struct("n" / Byte, "data" / Bytes(this.n)).compile().source
+    assert "_params" in Struct("n" / Array(2, Struct("i" / Index))).compile().source
+    d = Struct("b" / Struct("c" / Byte, "d" / Rebuild(Byte, 7)), "e" / Computed(this.b.d))
+    c = d.compile()
+    assert "_params" in c.source
+    assert c.parse(b"\x01\x02") == d.parse(b"\x01\x02")
+    assert c.build(dict(b=dict(c=1))) == b"\x01\x07"
+    class AddBase(Adapter):
+        def _decode(self, obj, context, path):
+            return obj + context.base
+        def _encode(self, obj, context, path):
+            return obj - context.base
+    d = Struct("base" / Int8ub, "v" / AddBase(Int8ub))
+    c = d.compile()
+    assert "_params" in c.source
+    assert c.parse(b"\x01\x02") == c.parse_stream(io.BytesIO(b"\x01\x02")) == d.parse(b"\x01\x02") == Container(base=1, v=3)
+    assert c.build(dict(base=1, v=3)) == b"\x01\x02"
+    d = Struct("a" / Prefixed(VarInt, GreedyBytes), "b" / Prefixed(Byte, Int16ub, includelength=True), "c" / PascalString(Int16ub, "utf8"))
+    c = d.compile()
+    obj = Container(a=bytes(300), b=5, c="x")
+    assert c.build(obj) == d.build(obj)
+    assert b"".join(c.build_segments(obj)) == d.build(obj)
+
+def test_compiled_pickling():
+    import pickle
+    d = Struct(
+        "a" / Byte,
+        "b" / FixedSized(2, ProcessXor(0xf0, GreedyBytes)),
+        "c" / PascalString(Byte, "utf8"),
+    )
+    c = d.compile()
+    obj = Container(a=1, b=b"hi", c="x")
+    data = d.build(obj)
+    cu = pickle.loads(pickle.dumps(c))
+    assert cu.source == c.source and cu.fallbacks
+    assert cu.parse(data) == cu.parse_stream(io.BytesIO(data)) == obj
+    assert cu.build(obj) == data
+    linked = list(cu.module.linkedinstances.values())
+    assert cu.defersubcon.b.subcon.subcon in linked and cu.defersubcon.b.subcon in linked
+    assert all(any(sc is fallback for sc in linked) for mode,path,fallback in cu.fallbacks)
+    d = Struct("a" / Int16ub, "b" / Int16ub)
+    cu = pickle.loads(pickle.dumps(d.compile(records=True)))
+    assert isinstance(cu.parse(b"\x00\x01\x00\x02"), Record)
+    assert cu.build(dict(a=1, b=2)) == b"\x00\x01\x00\x02"
+    assert cu.sizeof() == 4
+
+def test_compiled_nested_substreams():
+    tlv = Prefixed(Int32ub, Struct("tag" / Byte, "data" / GreedyBytes))
+    d = Struct("a" / Byte, "b" / Prefixed(Int32ub, Struct("inner" / tlv, "rest" / FixedSized(5000, GreedyBytes))), "c" / Byte)
+    obj = dict(a=1, b=dict(inner=dict(tag=7, data=b"x"*10000), rest=b"y"*5000), c=2)
+    data = d.build(obj)
+    c = d.compile()
+    assert "substream(io" in c.source
+    assert c.parse(data) == c.parse_stream(io.BytesIO(data)) == d.parse(data)
+    assert c.parse(data).b.inner.data == b"x"*10000
+    assert raises(c.parse_stream, io.BytesIO(data[:9000])) == StreamError
+
+def test_compiled_nullterminated():
+    d = Struct(
+        "a" / CString("utf8"),
+        "b" / CString("utf16"),
+        "c" / NullTerminated(Int16ub, term=b"XY"),
+        "d" / NullTerminated(GreedyBytes, term=b"XY", include=True, consume=False),
+        "e" / Bytes(2),
+    )
+    c = d.compile()
+    assert "stream_read_terminated" in c.source
+    assert not [mode for mode,path,sc in c.fallbacks if mode == "parse"]
+    data = d.build(dict(a=u"x"*500, b=u"Афон", c=7, d=b"aXbX", e=b"zz"))
+    assert c.parse(data) == c.parse_stream(io.BytesIO(data)) == d.parse(data)
+    assert c.parse(data).d == b"aXbXXY"
+    assert c.build(d.parse(data)) == d.build(d.parse(data))
+
+def test_compiled_build_into():
+    d = Struct(
+        "a" / Int16ub,
+        "b" / Array(3, Int16ul),
+        "c" / Const(b"XY"),
+        "d" / Array(2, Struct("x" / Int32sl, Padding(2))),
+        "e" / Computed(7),
+    )
+    obj = Container(a=1, b=[2,3,4], d=[Container(x=-1), Container(x=5)])
+    data = d.build(obj)
+    c = d.compile()
+    assert c.buildsize == len(data) == 22
+    assert "pack_into" in c.source
+    assert c.build(obj) == data
+    buffer = bytearray(30)
+    assert c.build_into(obj, buffer, 3) == 22
+    assert buffer == bytes(3) + data + bytes(5)
+    view = memoryview(bytearray(22))
+    assert c.build_into(obj, view) == 22 and view.tobytes() == data
+    assert raises(c.build_into, obj, bytearray(30), 9) == StreamError
+    assert raises(c.build, dict(obj, d=[Container(x=1)])) == RangeError
+    assert d.build_into(obj, buffer, 4) == 22 and buffer[4:26] == data
+    assert raises(d.build_into, obj, bytearray(10)) == StreamError
+    assert Struct("a" / Byte, "b" / Tell).compile().buildbufferfunc is None
+    assert Struct("a" / Byte, "b" / VarInt).compile().buildbufferfunc is None
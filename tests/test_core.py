@@ -1103,6 +1103,34 @@ def test_prefixed():
     d = Prefixed(Byte, GreedyString("utf-8"))
     common(d, b"\x0a"+bytes(10), u"\x00"*10, SizeofError)
 
+def test_prefixed_nested_substreams():
+    tlv = Prefixed(Int16ub, Struct("pos" / Tell, "data" / GreedyBytes))
+    d = Struct("a" / Byte, "b" / Prefixed(Int16ub, Struct("x" / Tell, "inner" / tlv, "rest" / GreedyBytes)), "c" / Tell, "d" / Byte)
+    data = d.build(dict(a=1, b=dict(inner=dict(data=b"abc"), rest=b"xy"), d=2))
+    obj = d.parse(data)
+    assert obj.b.x == 3 and obj.b.inner.pos == 5 and obj.b.inner.data == b"abc" and obj.b.rest == b"xy"
+    assert obj.c == len(data) - 1 and obj.d == 2
+    assert raises(d.parse, data[:8]) == StreamError
+    d = Prefixed(Byte, Struct("a" / Int16ub, "b" / Pointer(2, Byte), "c" / Seek(0, 2), "d" / GreedyBytes))
+    assert d.parse(b"\x04\x00\x01\x02\x03??") == Container(a=1, b=1, c=5, d=b"")
+    assert raises(Prefixed(Byte, Pointer(0, Byte)).parse, b"\x01\x02") == StreamError
+    d = FixedSized(4, FixedSized(2, Byte) >> GreedyBytes)
+    assert d.parse_stream(io.BytesIO(b"\x01\x00\x02\x03??")) == [1, b"\x02\x03"]
+
+def test_prefixed_pickled(tmpdir):
+    obj = list(range(3000))
+    d = Struct("a" / Byte, "p" / Prefixed(VarInt, Pickled), "f" / FixedSized(40, Pickled))
+    data = d.build(dict(a=1, p=obj, f=[1, 2]))
+    for c in [d, d.compile()]:
+        assert c.parse(data) == Container(a=1, p=obj, f=[1, 2])
+    d = Struct("p" / Lazy(Prefixed(VarInt, Pickled)))
+    filename = str(tmpdir.join("pickled"))
+    with open(filename, "wb") as f:
+        f.write(d.build(dict(p=obj)))
+    with open(filename, "rb") as f:
+        assert d.parse_stream(f).p() == obj
+    assert d.parse_file(filename, memorymap=True).p() == obj
+
 def test_prefixedarray():
     common(PrefixedArray(Byte,Byte), b"\x02\x0a\x0b", [10,11], SizeofError)
     assert PrefixedArray(Byte, Byte).parse(b"\x03\x01\x02\x03") == [1,2,3]
@@ -1146,6 +1174,22 @@ def test_nullterminated():
     d = NullTerminated(GreedyBytes, term=bytes(2))
     common(d, b"\x01\x00\x00\x02\x00\x00", b"\x01\x00\x00\x02", SizeofError)
 
+def test_nullterminated_chunked():
+    d = NullTerminated(GreedyBytes) >> GreedyBytes
+    assert d.parse(b"x"*100000 + b"\x00rest") == [b"x"*100000, b"rest"]
+    d = NullTerminated(GreedyBytes, term=b"\x00\x00", include=True) >> GreedyBytes
+    assert d.parse(b"\x01\x00"*500 + b"\x00\x01\x00\x00\x02") == [b"\x01\x00"*500 + b"\x00\x01\x00\x00", b"\x02"]
+    d = NullTerminated(GreedyBytes, term=b"AB", consume=False) >> GreedyBytes
+    assert d.parse(b"y"*300 + b"ABz") == [b"y"*300, b"ABz"]
+    d = NullTerminated(GreedyBytes, term=b"AB", require=False)
+    assert d.parse(b"x"*301) == b"x"*300
+    assert raises(CString("utf8").parse, b"x"*1000) == StreamError
+    assert CString("utf16").parse((u"ab"*1000).encode("utf-16") + bytes(2)) == u"ab"*1000
+    d = Struct("s" / CString("ascii"), "n" / Byte)
+    assert Rebuffered(d).parse(b"ab\x00\x01") == Container(s="ab", n=1)
+    assert Restreamed(d, ident, 1, ident, 1, lambda n: n).parse(b"ab\x00\x01") == Container(s="ab", n=1)
+    assert Rebuffered(d).compile().parse(b"ab\x00\x01") == Container(s="ab", n=1)
+
 def test_nullstripped():
     d = NullStripped(GreedyBytes)
     common(d, b'\xff', b'\xff', SizeofError)
@@ -1347,6 +1391,33 @@ def test_compressedlz4():
     assert len(d.build(zeros)) < 100
     assert raises(d.sizeof) == SizeofError
 
+def test_compressed_streaming():
+    data = bytes(range(256))*1000
+    records = GreedyRange(Struct("a" / Int32ub, "b" / Bytes(4)))
+    obj = records.parse(data)
+    for encoding in ["zlib", "gzip", "bzip2", "lzma", "hex"]:
+        d = Compressed(GreedyBytes, encoding, streaming=True)
+        assert Compressed(GreedyBytes, encoding).parse(d.build(data)) == data
+        assert d.parse(Compressed(GreedyBytes, encoding).build(data)) == data
+        d = Prefixed(VarInt, Compressed(records, encoding, streaming=True))
+        st = Struct("one" / d, "two" / Byte)
+        assert st.parse(st.build(dict(one=obj, two=1))) == Container(one=obj, two=1)
+    d = Compressed(Struct("a" / Int32ub), "zlib", streaming=True)
+    assert d.parse(Compressed(GreedyBytes, "zlib").build(data)) == Container(a=0x00010203)
+    for streaming in [False, True]:
+        d = Struct("c" / Prefixed(Byte, Compressed(Struct("a" / Rebuild(Byte, 5)), "zlib", streaming=streaming)), "d" / Rebuild(Byte, this.c.a))
+        assert d.parse(d.build(dict(c=dict()))) == Container(c=Container(a=5), d=5)
+    d = Compressed(GreedyBytes, "zlib", streaming=True)
+    assert raises(d.parse, d.build(data)[:-4]) == StreamError
+    d = Compressed(Bytes(4), "zlib", streaming=True)
+    assert raises(d.parse, d.build(b"abcd")[:4]) == StreamError
+    assert raises(d.parse, Compressed(GreedyBytes, "zlib").build(b"ab")) == StreamError
+    d = CompressedLZ4(GreedyBytes, streaming=True)
+    assert CompressedLZ4(GreedyBytes).parse(d.build(data)) == data
+    assert d.parse(CompressedLZ4(GreedyBytes).build(data)) == data
+    assert d.parse(d.build(b"")) == b""
+    assert raises(d.parse, d.build(data)[:-4]) == StreamError
+
 @xfail(ONWINDOWS and PYPY, reason="no wheel for 'cryptography' is currently available for pypy on windows")
 def test_encryptedsym():
     from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
@@ -1473,6 +1544,10 @@ def test_lazy_issue_938():
     d = Lazy(Prefixed(Byte, Byte))
     func = d.parse(b'\x01\x02')
     assert func() == 2
+    d = Struct("a" / Lazy(Prefixed(Byte, GreedyBytes)), "b" / Byte)
+    obj = d.parse(b'\x02\x01\x02\x03')
+    assert obj.a() == b'\x01\x02'
+    assert obj.b == 3
 
 def test_lazy_seek():
     d = Struct(
@@ -1547,6 +1622,17 @@ def test_lazyarray():
     assert d.build(obj[:]) == b"\x00\x01\x02\x03\x04"
     assert raises(d.sizeof) == SizeofError
 
+    d = LazyArray(this.count, Bytes(this.size))
+    obj = d.parse(bytes(range(12)), count=4, size=3)
+    assert obj[1] == b"\x03\x04\x05"
+    assert obj[-1] == b"\x09\x0a\x0b"
+
+    d = Struct("items" / LazyArray(10**8, Int64ub), "end" / Tell)
+    obj = d.parse(bytes(16))
+    assert obj.end == 8 * 10**8
+    assert len(obj["items"]) == 10**8
+    assert obj["items"][1] == 0
+
 def test_lazybound():
     d = LazyBound(lambda: Byte)
     common(d, b"\x01", 1)
@@ -1938,6 +2024,26 @@ def test_pickling_constructs_issue_894():
 
     cloudpickle.dumps(fundus_header)
 
+def test_pickling_constructs_stdlib():
+    import pickle
+
+    d = Struct(
+        "a" / Int16ub,
+        "b" / PascalString(Byte, "utf8"),
+        "c" / CString("utf8"),
+        "d" / PrefixedArray(Byte, VarInt),
+        "e" / If(this.a > 1, Byte),
+        Padding(2),
+        "f" / BitStruct("x" / Flag, "y" / BitsInteger(7)),
+        "g" / GreedyBytes,
+    )
+    data = d.build(dict(a=2, b="x", c="yy", d=[1, 300], e=7, f=dict(x=True, y=5), g=b"end"))
+    du = pickle.loads(pickle.dumps(d))
+    assert du.parse(data) == d.parse(data)
+    assert du.compile().source == d.compile().source
+    assert pickle.loads(pickle.dumps(GreedyBytes)) is GreedyBytes
+    assert pickle.loads(pickle.dumps(Pass)) is Pass
+
 def test_exposing_members_attributes():
     d = Struct(
         "animal" / Enum(Byte, giraffe=1),
@@ -2447,3 +2553,295 @@ def test_issue_1014():
         )),
     )
     assert d.parse(bytes([1,2,3,4,5,6])) == Container(version=0x0102, box=Container(position=3, payload=b'\x04\x05\x06'))
+
+def test_parse_iter(tmpdir):
+    d = Struct("a" / Byte, "b" / PascalString(Byte, "utf8"))
+    data = b"\x01\x01x\x02\x00\x03\x02yz"
+    records = [Container(a=1, b="x"), Container(a=2, b=""), Container(a=3, b="yz")]
+    for c in [d, d.compile()]:
+        assert list(c.parse_iter(io.BytesIO(data))) == records
+        assert list(c.parse_iter(io.BytesIO(b""))) == []
+        assert list(c.parse_iter(io.BufferedReader(io.BytesIO(data)))) == records
+    it = d.parse_iter(io.BytesIO(data[:-1]))
+    assert next(it) == records[0]
+    assert next(it) == records[1]
+    assert raises(next, it) == StreamError
+    it = Struct("a" / Byte, "b" / Int16ub).compile().parse_iter(io.BytesIO(data[:-1]))
+    assert next(it) == Container(a=1, b=0x0178)
+    assert next(it) == Container(a=2, b=0x0003)
+    assert raises(next, it) == StreamError
+    filename = str(tmpdir.join("records"))
+    with open(filename, "wb") as f:
+        f.write(data)
+    assert list(d.parse_iter(filename)) == records
+    r, w = os.pipe()
+    os.write(w, data[:8])
+    os.close(w)
+    with open(r, "rb") as f:
+        assert list(Int16ub.parse_iter(f)) == [0x0101, 0x7802, 0x0003, 0x0279]
+    class Unseekable(io.RawIOBase):
+        def readable(self):
+            return True
+    assert raises(next, Byte.parse_iter(Unseekable())) == StreamError
+    def cancel(ctx):
+        if ctx.a == 2:
+            raise CancelParsing
+    assert list(Struct("a" / Byte, Computed(cancel)).parse_iter(io.BytesIO(b"\x01\x02\x03"))) == [Container(a=1)]
+
+def test_incrementalparser():
+    for d in [Prefixed(Byte, GreedyBytes), Prefixed(Byte, GreedyBytes).compile()]:
+        p = IncrementalParser(d)
+        p.feed(b"\x02a")
+        assert list(p) == []
+        assert p.pending == 2
+        p.feed(b"b\x01c\x03")
+        assert list(p) == [b"ab", b"c"]
+        assert p.pending == 1
+        p.feed(b"xyz")
+        assert next(p) == b"xyz"
+        assert p.pending == 0
+    p = IncrementalParser(Struct("a" / Int16ub, "b" / Int8ub).compile())
+    data = bytes(range(30))
+    records = []
+    for i in range(0, 30, 4):
+        p.feed(data[i:i+4])
+        records.extend(p)
+    assert records == list(Struct("a" / Int16ub, "b" / Int8ub)[10].parse(data))
+    for d in [Struct("n" / Byte, "data" / Bytes(this.n)), Struct("n" / Byte, "data" / Bytes(this.n)).compile()]:
+        p = IncrementalParser(d)
+        for b in b"\x02ab\x00\x01":
+            p.feed(bytes([b]))
+            assert p.needed <= p.pending + 1
+        assert list(p) == [Container(n=2, data=b"ab"), Container(n=0, data=b"")]
+        p.feed(b"c")
+        assert list(p) == [Container(n=1, data=b"c")]
+    for d in [Struct("n" / Int32ub, "data" / Bytes(this.n)), Struct("n" / Int32ub, "data" / Bytes(this.n)).compile()]:
+        p = IncrementalParser(d)
+        p.feed(b"\x00\x00\x10\x00abc")
+        assert list(p) == []
+        assert p.needed == 4 + 4096
+        p.feed(bytes(4092))
+        assert list(p) == []
+        p.feed(bytes(1))
+        assert list(p) == [Container(n=4096, data=b"abc" + bytes(4093))]
+    p = IncrementalParser(Bytes(1000))
+    p.feed(bytes(100*1000+1))
+    for i in range(70):
+        assert next(p) == bytes(1000)
+    assert p.offset < 65536 and p.pending == 30*1000+1
+    assert len(list(p)) == 30 and p.pending == 1
+    p = IncrementalParser(Struct("a" / Const(b"A"), "b" / Byte))
+    p.feed(b"Bx")
+    assert raises(next, p) == ConstError
+    for d in [CString("ascii"), Struct("a" / Optional(Const(b"HEAD")), "s" / CString("ascii"))]:
+        p = IncrementalParser(d)
+        objs = []
+        for b in b"ab\x00" * 3:
+            p.feed(bytes([b]))
+            objs.extend(p)
+        assert objs == [d.parse(b"ab\x00")] * 3 and p.pending == 0
+
+def test_parse_build_async():
+    import asyncio
+    class Reader(asyncio.StreamReader):
+        def __init__(self, data):
+            super().__init__()
+            self.feed_data(data)
+            self.feed_eof()
+            self.reads = []
+        async def readexactly(self, n):
+            self.reads.append(n)
+            return await super().readexactly(n)
+    class Writer:
+        def __init__(self):
+            self.writes = []
+        def write(self, data):
+            self.writes.append(data)
+        async def drain(self):
+            pass
+    async def parse(d, data):
+        reader = Reader(data)
+        obj = await d.parse_async(reader)
+        return obj, reader.reads
+    async def build(d, obj):
+        writer = Writer()
+        await d.build_async(obj, writer)
+        return writer.writes
+    d = Struct("a" / Int16ub, "b" / Bytes(3))
+    for c in [d, d.compile()]:
+        assert asyncio.run(parse(c, b"\x00\x01abcd")) == (Container(a=1, b=b"abc"), [5])
+        assert asyncio.run(build(c, Container(a=1, b=b"abc"))) == [b"\x00\x01abc"]
+    d = Prefixed(Int16ub, Struct("a" / Byte, "b" / GreedyBytes))
+    for c in [d, d.compile()]:
+        assert asyncio.run(parse(c, b"\x00\x03\x01xyz")) == (Container(a=1, b=b"xy"), [2, 3])
+    d = PrefixedArray(Byte, Int16ub)
+    for c in [d, d.compile()]:
+        assert asyncio.run(parse(c, b"\x02\x00\x01\x00\x02")) == ([1, 2], [1, 4])
+    d = Struct("n" / Byte, "data" / Bytes(this.n), "c" / Byte)
+    for c in [d, d.compile()]:
+        assert asyncio.run(parse(c, b"\x02ab\x03")) == (Container(n=2, data=b"ab", c=3), [1, 2, 1])
+    assert raises(asyncio.run, parse(Bytes(4), b"abc")) == StreamError
+    assert raises(asyncio.run, parse(Prefixed(Byte, GreedyBytes), b"\x05abc")) == StreamError
+    assert raises(asyncio.run, parse(Struct("a" / Const(b"A"), "b" / Bytes(this.a)), b"Bx")) == ConstError
+
+def test_parse_async_terminated():
+    import asyncio
+    d = Struct("s" / CString("ascii"), "n" / Byte)
+    data = b"".join(d.build(dict(s="r%d" % i, n=i)) for i in range(30))
+    async def parseall(c, chunk):
+        reader = asyncio.StreamReader()
+        async def feed():
+            for i in range(0, len(data), chunk):
+                reader.feed_data(data[i:i+chunk])
+                await asyncio.sleep(0)
+        feeding = asyncio.ensure_future(feed())
+        objs = [await asyncio.wait_for(c.parse_async(reader), 5) for i in range(30)]
+        await feeding
+        return objs
+    for c in [d, d.compile()]:
+        for chunk in [len(data), 1, 3]:
+            assert asyncio.run(parseall(c, chunk)) == [Container(s="r%d" % i, n=i) for i in range(30)]
+    async def parseone(c, data):
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        return await asyncio.wait_for(c.parse_async(reader), 5), await reader.readexactly(2)
+    d = Struct("a" / Optional(Const(b"HEAD")), "s" / CString("ascii"))
+    assert asyncio.run(parseone(d, b"ab\x00cd")) == (Container(a=None, s="ab"), b"cd")
+
+def test_parse_file_memorymap(tmpdir):
+    import mmap
+    d = Struct("count" / Byte, "items" / LazyArray(this.count, Int16ub), "last" / Pointer(-1, Byte))
+    data = b"\x03\x00\x01\x00\x02\x00\x03"
+    filename = str(tmpdir.join("data"))
+    with open(filename, "wb") as f:
+        f.write(data)
+    obj = d.parse_file(filename, memorymap=True)
+    assert isinstance(obj._io, mmap.mmap)
+    assert obj.last == 3
+    assert list(obj["items"]) == [1, 2, 3]
+    d = Struct("a" / Int16ub, "b" / PascalString(Byte, "utf8"))
+    with open(filename, "wb") as f:
+        f.write(b"\x00\x01\x02ab")
+    for c in [d, d.compile()]:
+        assert c.parse_file(filename, memorymap=True) == c.parse_file(filename) == Container(a=1, b="ab")
+    with open(filename, "wb") as f:
+        pass
+    assert GreedyBytes.parse_file(filename, memorymap=True) == b""
+    assert raises(Byte.parse_file, filename, memorymap=True) == StreamError
+
+def test_build_segments():
+    payload = bytes(range(256)) * 100
+    d = Struct(
+        "a" / Byte,
+        "b" / Prefixed(Int32ub, Struct("c" / Int16ub, "p" / Prefixed(VarInt, GreedyBytes), "q" / FixedSized(30000, GreedyBytes))),
+        "z" / Bytes(3),
+    )
+    obj = dict(a=1, b=dict(c=2, p=payload, q=payload[:20000]), z=b"xyz")
+    segments = d.build_segments(obj)
+    assert b"".join(segments) == d.build(obj)
+    assert any(s is payload for s in segments)
+    assert max(len(s) for s in segments if s is not payload) == 20000
+    assert b"".join(d.compile().build_segments(obj)) == d.build(obj)
+    assert Int16ub.build_segments(1) == [b"\x00\x01"]
+    d = Struct(
+        "raw" / RawCopy(Bytes(5000)),
+        "sum" / Checksum(Bytes(4), lambda data: sum(data).to_bytes(4, "big"), this.raw.data),
+        "ptr" / Pointer(4998, Int16ub),
+        "pad" / Padding(2),
+        "far" / Pointer(6000, Byte),
+    )
+    obj = dict(raw=dict(value=payload[:5000]), ptr=0x4142, far=7)
+    assert b"".join(d.build_segments(obj)) == d.build(obj)
+    s = SegmentedBytesIO()
+    s.write(b"abc")
+    s.write(payload)
+    s.seek(1)
+    assert s.read(4) == b"bc\x00\x01"
+    s.seek(2)
+    s.write(b"XY")
+    s.seek(0, 2)
+    s.write(b"!")
+    assert s.getvalue() == b"abXY" + payload[1:] + b"!"
+    assert payload[:3] == bytes(range(3))
+
+def test_index_file(tmpdir):
+    d = Struct("id" / Int16ub, "name" / PascalString(Byte, "utf8"))
+    records = [Container(id=i, name="n%d" % i) for i in range(300)]
+    filename = str(tmpdir.join("records"))
+    sidecar = str(tmpdir.join("records.idx"))
+    with open(filename, "wb") as f:
+        f.write(GreedyRange(d).build(records))
+    for c in [d, d.compile()]:
+        obj = c.index_file(filename)
+        assert len(obj) == 300
+        assert obj[250] == records[250] and obj[-1] == records[-1]
+        assert obj[10:12] == records[10:12]
+        assert raises(obj.__getitem__, 300) == IndexError
+    obj = d.index_file(filename, sidecar=sidecar)
+    assert os.path.getsize(sidecar) == 8 * (3 + 301)
+    assert list(d.index_file(filename, sidecar=sidecar)) == records
+    with open(filename, "ab") as f:
+        f.write(Prefixed(Byte, GreedyBytes).build(b"x"))
+    assert raises(d.index_file, filename, sidecar=sidecar) == StreamError
+    with open(filename, "wb") as f:
+        f.write(PrefixedArray(Int32ub, Prefixed(Byte, GreedyBytes)).build([b"ab", b"", b"c"]))
+    assert list(Prefixed(Byte, GreedyBytes).index_file(filename, offset=4)) == [b"ab", b"", b"c"]
+    assert list(Prefixed(Byte, GreedyBytes).index_file(filename, sidecar=sidecar, offset=4)) == [b"ab", b"", b"c"]
+    assert list(Int16ub.index_file(filename, offset=4)) == [0x0261, 0x6200, 0x0163]
+    assert list(Int16ub.index_file(filename, sidecar=sidecar + "2", offset=4)) == [0x0261, 0x6200, 0x0163]
+    assert not os.path.exists(sidecar + "2")
+    assert raises(Int32ub.index_file, filename) == StreamError
+    with open(filename, "wb") as f:
+        pass
+    assert list(Byte.index_file(filename)) == []
+    assert list(VarInt.index_file(filename)) == []
+
+def test_parse_many():
+    d = Struct("id" / Int16ub, "name" / PascalString(Byte, "utf8"))
+    records = [Container(id=i, name="n%d" % i) for i in range(100)]
+    buffers = [d.build(r) for r in records]
+    assert list(d.parse_many(buffers, workers=2, chunksize=7)) == records
+    assert list(d.compile().parse_many(iter(buffers), workers=2, chunksize=7)) == records
+    assert sorted(d.parse_many(buffers, workers=2, chunksize=7, ordered=False), key=lambda r: r.id) == records
+    assert list(d.parse_many([], workers=2)) == []
+    nested = Struct("a" / Array(2, d))
+    assert [("_io" in r, "_io" in r.a[0]) for r in nested.parse_many([nested.build(dict(a=records[:2]))], workers=1)] == [(False, False)]
+    assert list(Bytes(this.n).parse_many([b"ab", bytearray(b"cd")], workers=1, n=2)) == [b"ab", b"cd"]
+    assert raises(list, Bytes(this.n).parse_many([b"ab", b"c"], workers=1, n=2)) == StreamError
+
+def test_parse_shards(tmpdir):
+    d = Struct("id" / Int32ub, "name" / PaddedString(6, "utf8"))
+    records = [Container(id=i, name="n%d" % i) for i in range(1000)]
+    filename = str(tmpdir.join("records"))
+    with open(filename, "wb") as f:
+        f.write(Int16ub.build(1000) + Array(1000, d).build(records))
+    for c in [d, d.compile()]:
+        assert list(c.parse_shards(filename, workers=2, shardsize=100, offset=2)) == records
+    assert sorted(d.parse_shards(filename, workers=2, shardsize=100, ordered=False, offset=2), key=lambda r: r.id) == records
+    assert list(d.parse_shards(filename, workers=1, shardsize=1, offset=9992)) == records[999:]
+    assert ["_io" in r for r in d.parse_shards(filename, workers=1, shardsize=1, offset=9992)] == [False]
+    assert raises(list, d.parse_shards(filename, workers=1)) == StreamError
+    assert raises(list, PascalString(Byte, "utf8").parse_shards(filename, workers=1)) == SizeofError
+    with open(filename, "wb") as f:
+        pass
+    assert list(d.parse_shards(filename, workers=1)) == []
+
+def test_lazy_threads(tmpdir):
+    from concurrent.futures import ThreadPoolExecutor
+    d = Struct("items" / LazyArray(1000, Struct("id" / Int32ub, "name" / Lazy(Prefixed(Byte, GreedyString("utf8"))), "value" / Int32ub)))
+    data = d.build(dict(items=[dict(id=i, name="n%d" % i, value=2*i) for i in range(1000)]))
+    filename = str(tmpdir.join("lazy"))
+    with open(filename, "wb") as f:
+        f.write(data)
+    def check(items):
+        return all(items[i].id == i and items[i].name() == "n%d" % i and items[i].value == 2*i for i in reversed(range(1000)))
+    with open(filename, "rb") as f, open(filename, "r+b") as fw:
+        sources = [io.BytesIO(data), d.parse_file(filename, memorymap=True)._io, f, fw]
+        for stream in sources:
+            stream.seek(0)
+            items = d.parse_stream(stream)["items"]
+            position = stream.tell()
+            with ThreadPoolExecutor(4) as executor:
+                assert all(executor.map(check, [items]*8))
+            assert stream.tell() == position
+